@@ -8,9 +8,12 @@ Analyse les fichiers Lua et extrait les chaînes UI.
 
 import os
 import re
-from pathlib import Path
+import sys
 from typing import Dict, List, Set, Tuple, Optional
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.lua_sources import LOC_PATTERN, iter_lua_files
+
 from Extractor_config import (
     LOG_LINE_REGEX, UI_CONTEXT_PATTERNS, ALL_STRINGS_PATTERN,
     IGNORE_LOC_KEY_PATTERNS, IGNORE_LOC_VALUES
@@ -482,9 +485,7 @@ class LocalizableStringExtractor:
 
     def _extract_existing_loc(self, line: str, rel_path: str, file_name: str, line_num: int):
         """Extrait les clés LOC existantes d'une ligne déjà localisée."""
-        loc_pattern = re.compile(r'LOC\s*["\'](\$\$\$/[^=]+)=([^"\']+)["\']')
-
-        for match in loc_pattern.finditer(line):
+        for match in LOC_PATTERN.finditer(line):
             existing_key = match.group(1)
             existing_value = match.group(2)
 
@@ -530,11 +531,7 @@ class LocalizableStringExtractor:
 
     def extract_all(self):
         """Extrait les chaînes de tous les fichiers Lua."""
-        lua_files = list(Path(self.plugin_path).rglob('*.lua'))
-
-        for lua_file in sorted(lua_files):
-            if lua_file.name in self.exclude_files:
-                continue
+        for lua_file in iter_lua_files(self.plugin_path, self.exclude_files):
             self.extract_from_file(str(lua_file))
 
         self.stats.unique_strings = len(self.used_keys)
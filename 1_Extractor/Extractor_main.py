@@ -38,6 +38,7 @@ from datetime import datetime
 # Ajouter le répertoire parent au path pour importer common
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.paths import get_tool_output_path
+from common.snapshots import register_snapshot
 
 from Extractor_engine import LocalizableStringExtractor
 from Extractor_output import OutputGenerator
@@ -98,11 +99,15 @@ def run_extraction(plugin_path: str, output_dir: str, prefix: str, lang: str,
     report_gen = ReportGenerator(plugin_path, prefix, extractor.stats)
     
     # Générer les fichiers
-    output_gen.generate_plugin_strings(extractor.extracted, strings_file, lang)
+    plugin_strings = output_gen.generate_plugin_strings(extractor.extracted, strings_file, lang)
     output_gen.generate_spacing_metadata(extractor.spacing_metadata, extractor.text_to_key, spacing_file)
     output_gen.generate_replacements_json(extractor.extracted, replacements_file, extractor.text_to_key)
     report_gen.generate_report(extractor.extracted, extractor.spacing_metadata, report_file)
     
+    # Historique EN (compare --from/--to du TranslationManager)
+    snapshot = register_snapshot(plugin_path, plugin_strings, 'Extractor', strings_file) \
+        if lang == 'en' else None
+    
     # Afficher le résumé
     extractor.print_summary()
     
@@ -115,6 +120,8 @@ def run_extraction(plugin_path: str, output_dir: str, prefix: str, lang: str,
     print(f"  ✓ spacing_metadata.json ({len(extractor.spacing_metadata)} entrées)")
     print(f"  ✓ replacements.json (pour Applicator)")
     print(f"  ✓ extraction_report.txt (rapport détaillé)")
+    if snapshot:
+        print(f"  ✓ Snapshot EN: {snapshot['id']}")
     print(f"{'=' * 80}\n")
 
 
@@ -6,11 +6,16 @@ Génération des fichiers de sortie: PluginStrings.txt, JSON, rapports, etc.
 """
 
 import os
+import sys
 import json
 from datetime import datetime
 from typing import Dict, List
 from collections import defaultdict
 
+# Ajouter le répertoire parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fingerprint import compute_fingerprint
+
 from Extractor_models import ExtractedString, ExtractionStats
 
 # =============================================================================
@@ -48,8 +53,14 @@ class OutputGenerator:
         self.plugin_path = plugin_path
         self.prefix = prefix
     
-    def generate_plugin_strings(self, extracted: List[ExtractedString], output_path: str, lang: str = "en"):
-        """Génère le fichier PluginStrings.txt avec les clés uniques (fichier de référence)."""
+    def generate_plugin_strings(self, extracted: List[ExtractedString], output_path: str,
+                                lang: str = "en") -> Dict[str, str]:
+        """
+        Génère le fichier PluginStrings.txt avec les clés uniques (fichier de référence).
+
+        Returns:
+            Dict {clé: texte} écrit dans le fichier
+        """
         # Construire un dictionnaire clé → entry (première occurrence)
         unique_keys: Dict[str, ExtractedString] = {}
         
@@ -85,6 +96,7 @@ class OutputGenerator:
                 f.write("\n")
         
         print(f"✓ PluginStrings généré: {output_path} ({len(unique_keys)} clés uniques)")
+        return {key: entry.base_text for key, entry in unique_keys.items()}
     
     def generate_spacing_metadata(self, spacing_metadata: Dict[str, Dict], text_to_key: Dict[str, str], 
                                    output_path: str):
@@ -113,6 +125,7 @@ class OutputGenerator:
             "stats": { ... },
             "files": {
                 "fichier.lua": {
+                    "fingerprint": {"size": ..., "mtime_ns": ..., "sha256": "..."},
                     "replacements": [
                         {
                             "line_num": 74,
@@ -178,6 +191,7 @@ class OutputGenerator:
             
             files_data[file_path] = {
                 'total_replacements': len(replacements),
+                'fingerprint': self._source_fingerprint(file_path),
                 'replacements': replacements
             }
         
@@ -201,6 +215,18 @@ class OutputGenerator:
         total_replacements = sum(f['total_replacements'] for f in files_data.values())
         print(f"✓ Replacements JSON: {output_path} ({total_replacements} lignes à modifier)")
     
+    def _source_fingerprint(self, rel_path: str) -> Dict:
+        """
+        Calcule l'empreinte (taille, mtime, hash) du fichier source tel qu'extrait.
+
+        Permet à l'Applicator de détecter sans relecture les fichiers
+        inchangés ou déjà traités.
+        """
+        try:
+            return compute_fingerprint(os.path.join(self.plugin_path, rel_path))
+        except OSError:
+            return {}
+
     def _build_loc_call(self, entry: ExtractedString) -> str:
         """
         Construit l'appel LOC pour une entrée.
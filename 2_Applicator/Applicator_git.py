@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Applicator_git.py
+
+Mode d'application "git" : au lieu de copier des .bak et de réécrire les
+fichiers du plugin, les contenus modifiés sont écrits directement dans un
+nouveau commit sur une branche jetable, avec la plomberie git locale :
+
+    git hash-object -w --stdin     → blob de chaque fichier modifié (--path :
+                                     .gitattributes appliqué, comme git add)
+    git read-tree HEAD             → index temporaire (GIT_INDEX_FILE)
+    git update-index --index-info  → remplace les blobs dans l'index temporaire
+    git write-tree                 → arbre
+    git commit-tree                → commit (parent: HEAD)
+    git update-ref                 → branche jetable
+
+Ni HEAD, ni l'index, ni le répertoire de travail ne sont modifiés.
+Annuler = ne pas utiliser (ou supprimer) la branche.
+
+Les fichiers à modifier ne doivent pas avoir de modifications non commitées
+(voir dirty_files) : le commit ne contient alors que les remplacements.
+
+Auteur : Claude (Anthropic) pour Julien Moreau
+Date : 2026-10-18
+Version : 1.0
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import Dict, List, Optional
+
+
+# Préfixe des branches créées par le mode git
+GIT_BRANCH_PREFIX = "i18n/applicator-"
+
+
+class GitError(Exception):
+    """Erreur lors d'une commande git."""
+
+
+def _run_git(args: List[str], cwd: str, input_data: bytes = None,
+             env: Dict[str, str] = None) -> str:
+    """Exécute une commande git et retourne sa sortie (sans le saut de ligne final)."""
+    result = subprocess.run(
+        ['git'] + args,
+        cwd=cwd,
+        input=input_data,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env
+    )
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', errors='replace').strip()
+        raise GitError(f"git {' '.join(args)}: {message}")
+    return result.stdout.decode('utf-8', errors='replace').rstrip('\n')
+
+
+def find_git_worktree(path: str) -> Optional[str]:
+    """
+    Retourne la racine du dépôt git contenant path, ou None.
+
+    Args:
+        path: Répertoire du plugin
+
+    Returns:
+        Chemin absolu de la racine du work tree, ou None si hors dépôt
+        (ou si git n'est pas installé)
+    """
+    try:
+        inside = _run_git(['rev-parse', '--is-inside-work-tree'], cwd=path)
+        if inside != 'true':
+            return None
+        return os.path.normpath(_run_git(['rev-parse', '--show-toplevel'], cwd=path))
+    except (GitError, OSError):
+        return None
+
+
+class GitCommitWriter:
+    """
+    Accumule les contenus modifiés puis les écrit dans un commit sur une branche jetable.
+
+    Usage:
+        writer = GitCommitWriter(plugin_path, "i18n/applicator-20260129_143022")
+        writer.add_file("/path/plugin.lrplugin/PWDialogs.lua", new_lines)
+        commit = writer.commit("i18n: apply LOC replacements")
+    """
+
+    def __init__(self, plugin_path: str, branch: str):
+        self.worktree = find_git_worktree(plugin_path)
+        if not self.worktree:
+            raise GitError(f"Pas de dépôt git pour: {plugin_path}")
+
+        self.head = _run_git(['rev-parse', '--verify', 'HEAD'], cwd=self.worktree)
+        self.plugin_dir = self._repo_path(plugin_path)
+        self.branch = self._unique_branch(branch)
+        self.commit_sha = None
+        self._entries = []  # (chemin relatif au dépôt, sha du blob)
+
+    def _unique_branch(self, branch: str) -> str:
+        """Évite d'écraser une branche existante en ajoutant un suffixe."""
+        candidate = branch
+        counter = 2
+        while True:
+            try:
+                _run_git(['rev-parse', '--verify', '--quiet', f'refs/heads/{candidate}'],
+                         cwd=self.worktree)
+            except GitError:
+                return candidate
+            candidate = f"{branch}-{counter}"
+            counter += 1
+
+    def _repo_path(self, file_path: str) -> str:
+        rel = os.path.relpath(os.path.realpath(file_path), os.path.realpath(self.worktree))
+        return rel.replace(os.sep, '/')
+
+    def add_file(self, file_path: str, new_lines: List[str]):
+        """
+        Écrit le nouveau contenu d'un fichier comme blob git (sans toucher au fichier).
+
+        Args:
+            file_path: Chemin du fichier dans le plugin
+            new_lines: Lignes modifiées (fins de ligne d'origine)
+        """
+        path = self._repo_path(file_path)
+        content = ''.join(new_lines).encode('utf-8')
+        blob = _run_git(['hash-object', '-w', f'--path={path}', '--stdin'],
+                        cwd=self.worktree, input_data=content)
+        self._entries.append((path, blob))
+
+    @property
+    def files(self) -> List[str]:
+        return [path for path, _ in self._entries]
+
+    def dirty_files(self, file_paths: List[str]) -> List[str]:
+        """
+        Fichiers ayant des modifications non commitées (index, work tree ou non suivis).
+
+        Le statut est lu une seule fois pour tout le plugin (sortie -z : chemins
+        avec espaces ou caractères non ASCII non échappés).
+
+        Args:
+            file_paths: Chemins des fichiers dans le plugin
+
+        Returns:
+            Chemins relatifs au dépôt, dans l'ordre de file_paths
+        """
+        wanted = [self._repo_path(path) for path in file_paths]
+        if not wanted:
+            return []
+        output = _run_git(['--literal-pathspecs', 'status', '--porcelain', '-z',
+                           '--untracked-files=all', '--', self.plugin_dir], cwd=self.worktree)
+        dirty = set()
+        records = iter(output.split('\0'))
+        for record in records:
+            if not record:
+                continue
+            dirty.add(record[3:])
+            if record[0] in 'RC':
+                dirty.add(next(records, ''))  # Chemin d'origine du renommage / de la copie
+        return [path for path in wanted if path in dirty]
+
+    def _file_modes(self) -> Dict[str, str]:
+        """Modes des fichiers dans HEAD (100644 par défaut)."""
+        output = _run_git(['ls-tree', '-z', 'HEAD', '--'] + self.files, cwd=self.worktree)
+        modes = {}
+        for record in output.split('\0'):
+            if not record:
+                continue
+            meta, path = record.split('\t', 1)
+            modes[path] = meta.split(' ')[0]
+        return modes
+
+    def commit(self, message: str) -> Optional[str]:
+        """
+        Crée le commit et la branche jetable.
+
+        Args:
+            message: Message du commit
+
+        Returns:
+            SHA du commit, ou None si aucun fichier n'a été ajouté
+        """
+        if not self._entries:
+            return None
+
+        modes = self._file_modes()
+        index_info = ''.join(
+            f"{modes.get(path, '100644')} {blob}\t{path}\n" for path, blob in self._entries
+        ).encode('utf-8')
+
+        # Index temporaire : l'index réel du dépôt n'est pas touché
+        with tempfile.TemporaryDirectory(prefix='applicator_git_') as tmpdir:
+            env = {**os.environ, 'GIT_INDEX_FILE': os.path.join(tmpdir, 'index')}
+            _run_git(['read-tree', 'HEAD'], cwd=self.worktree, env=env)
+            _run_git(['update-index', '--add', '--index-info'], cwd=self.worktree,
+                     input_data=index_info, env=env)
+            tree = _run_git(['write-tree'], cwd=self.worktree, env=env)
+
+        self.commit_sha = _run_git(['commit-tree', tree, '-p', self.head, '-F', '-'],
+                                   cwd=self.worktree, input_data=message.encode('utf-8'))
+        _run_git(['update-ref', f'refs/heads/{self.branch}', self.commit_sha, ''],
+                 cwd=self.worktree)
+        return self.commit_sha
@@ -10,17 +10,29 @@ Usage (Menu interactif):
     python Applicator_main.py
 
 Usage (CLI):
-    python Applicator_main.py --plugin-path /path/to/plugin [--extraction-dir /path/to/extraction] [--dry-run] [--no-backup]
+    python Applicator_main.py --plugin-path /path/to/plugin [--extraction-dir /path/to/extraction] [--dry-run] [--no-backup] [--force] [--git]
+                              [--only-file GLOB] [--key-prefix PREFIX] [--pattern GLOB] [--max-lines N]
 
 Options CLI:
     --plugin-path PATH     Chemin vers le repertoire du plugin (OBLIGATOIRE)
     --extraction-dir PATH  Repertoire Extractor (defaut: auto-detection __i18n_kit__/Extractor/)
     --dry-run              Mode simulation (affiche sans modifier)
     --no-backup            Ne pas creer de fichiers de sauvegarde .bak (defaut: backup active)
+    --force                Retraiter tous les fichiers (ignorer les empreintes enregistrees)
+    --git                  Ecrire les modifications dans un commit sur une branche jetable
+                           (i18n/applicator-<timestamp>) au lieu de .bak + reecriture des fichiers
+
+Application selective (options combinables, --only-file/--key-prefix/--pattern repetables):
+    --only-file GLOB       Fichiers a traiter (ex: "PWDialogs.lua", "dialogs/*.lua")
+    --key-prefix PREFIX    Cles LOC a appliquer (ex: "$$$/Piwigo/Dialogs/")
+    --pattern GLOB         Patterns Extractor a appliquer (ex: "LrDialogs.*", "tooltip")
+    --max-lines N          Nombre maximal de lignes a modifier
 
 Sorties générées dans: <plugin>/__i18n_kit__/2_Applicator/<timestamp>/
   - application_report.txt (rapport détaillé)
+  - application_report.jsonl (journal JSON Lines, écrit au fil de l'eau)
   - backups/ (sauvegardes .bak des fichiers modifiés)
+  - localization.patch (dry-run uniquement, diff unifie applicable avec git apply)
 
 Le script :
 1. Détecte automatiquement la dernière extraction (__i18n_kit__/Extractor/)
@@ -28,6 +40,9 @@ Le script :
 3. Cree des sauvegardes dans __i18n_kit__/2_Applicator/<timestamp>/backups/
 4. Remplace les chaines hardcodees par des appels LOC avec valeur par defaut
 5. Genere un rapport detaille des changements
+6. Enregistre l'empreinte des fichiers traites (applied_fingerprints.json dans
+   le dossier Extractor) : les fichiers inchanges depuis la derniere application
+   sont ignores sans etre relus
 
 IMPORTANT: Le format LOC du SDK Lightroom est:
     LOC "$$$/Key=Default Value"
@@ -42,37 +57,162 @@ import os
 import re
 import sys
 import json
+import fnmatch
 import shutil
 import argparse
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 # Ajouter le répertoire parent au path pour importer common
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.paths import get_tool_output_path, find_latest_tool_output
+from common.fingerprint import compute_fingerprint, fingerprint_matches
 import glob
 import subprocess
 
 from Applicator_menu import show_interactive_menu
+from Applicator_git import GitCommitWriter, GitError, GIT_BRANCH_PREFIX
+
+
+# Fichier d'état (dans le dossier Extractor) : empreintes des fichiers
+# qui n'ont plus rien à appliquer pour ce replacements.json
+APPLY_STATE_FILE = "applied_fingerprints.json"
+
+# Patch unifie genere en mode dry-run
+PATCH_FILE = "localization.patch"
+PATCH_CONTEXT_LINES = 3
+
+
+class UnifiedDiffWriter:
+    """
+    Ecrit un patch unifie (format git) construit a partir des seules lignes modifiees.
+
+    Les remplacements ne changent jamais le nombre de lignes : chaque hunk
+    est donc calcule directement depuis les numeros de ligne modifies, sans
+    comparer les fichiers entiers. Le patch est ecrit au fil de l'eau et
+    s'applique depuis la racine du plugin avec `git apply`.
+
+    Les lignes sont recopiees avec leurs fins de ligne d'origine (newline='')
+    : un fichier CRLF produit des lignes de patch CRLF, comme `git diff`.
+    """
+
+    def __init__(self, output_path: str, context: int = PATCH_CONTEXT_LINES):
+        self.output_path = output_path
+        self.context = context
+        self.files = 0
+        self.hunks = 0
+        self._f = open(output_path, 'w', encoding='utf-8', newline='')
+
+    def add_file(self, rel_path: str, old_lines: List[str], new_lines: List[str],
+                 changed_lines: List[int]):
+        """
+        Ajoute les hunks d'un fichier au patch.
+
+        Args:
+            rel_path: Chemin relatif a la racine du plugin
+            old_lines: Lignes originales
+            new_lines: Lignes modifiees (meme nombre que old_lines)
+            changed_lines: Numeros (base 1) des lignes modifiees, tries
+        """
+        if not changed_lines:
+            return
+
+        path = rel_path.replace(os.sep, '/')
+        self._f.write(f"diff --git a/{path} b/{path}\n")
+        self._f.write(f"--- a/{path}\n")
+        self._f.write(f"+++ b/{path}\n")
+
+        for start, end in self._hunk_ranges(changed_lines, len(old_lines)):
+            self._write_hunk(old_lines, new_lines, set(changed_lines), start, end)
+
+        self.files += 1
+
+    def _hunk_ranges(self, changed_lines: List[int], total: int) -> List[Tuple[int, int]]:
+        """Regroupe les lignes modifiees en intervalles [debut, fin[ (base 0) avec contexte."""
+        ranges = []
+        for line_num in changed_lines:
+            start = max(0, line_num - 1 - self.context)
+            end = min(total, line_num + self.context)
+            if ranges and start <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+    def _write_hunk(self, old_lines: List[str], new_lines: List[str],
+                    changed: set, start: int, end: int):
+        """Ecrit un hunk : contexte inchange, puis blocs '-' suivis des blocs '+'."""
+        length = end - start
+        self._f.write(f"@@ -{start + 1},{length} +{start + 1},{length} @@\n")
+
+        idx = start
+        while idx < end:
+            if idx + 1 not in changed:
+                self._write_line(' ', old_lines[idx])
+                idx += 1
+                continue
+
+            run_end = idx
+            while run_end < end and run_end + 1 in changed:
+                run_end += 1
+            for i in range(idx, run_end):
+                self._write_line('-', old_lines[i])
+            for i in range(idx, run_end):
+                self._write_line('+', new_lines[i])
+            idx = run_end
+
+        self.hunks += 1
+
+    def _write_line(self, marker: str, line: str):
+        if line.endswith('\n'):
+            self._f.write(marker + line)
+        else:
+            self._f.write(marker + line + "\n\\ No newline at end of file\n")
+
+    def close(self):
+        self._f.close()
+
+    def discard(self):
+        """Ferme et supprime un patch incomplet."""
+        self.close()
+        if os.path.exists(self.output_path):
+            os.remove(self.output_path)
 
 
 class LocalizationReport:
-    """Genere un rapport detaille des modifications."""
+    """
+    Genere un rapport detaille des modifications.
+
+    Chaque modification, chaine ignoree ou erreur est ecrite immediatement
+    dans application_report.jsonl (une ligne JSON par enregistrement) :
+    seuls les compteurs restent en memoire, et le journal est exploitable
+    meme si le traitement est interrompu. generate() relit ce journal pour
+    produire le rapport texte final.
+    """
 
-    def __init__(self):
-        self.changes = []
-        self.skipped = []
-        self.errors = []
+    def __init__(self, records_path: str):
+        self.records_path = records_path
         self.stats = {
             'files_processed': 0,
             'files_modified': 0,
+            'files_unchanged': 0,
             'total_replacements': 0,
             'strings_replaced': 0,
+            'strings_skipped': 0,
+            'errors': 0,
         }
+        self.git_commit = None  # (branche, sha) en mode git
+        # Ecriture ligne par ligne (line buffering) pour ne rien perdre en cas d'arret
+        self._records = open(records_path, 'w', encoding='utf-8', buffering=1)
+
+    def _write_record(self, record: Dict):
+        self._records.write(json.dumps(record, ensure_ascii=False) + "\n")
 
     def add_change(self, file_path: str, line_num: int, before: str, after: str,
                    members: List[Dict]):
-        self.changes.append({
+        self._write_record({
+            'type': 'change',
             'file': file_path,
             'line': line_num,
             'before': before.strip(),
@@ -83,21 +223,47 @@ class LocalizationReport:
         self.stats['strings_replaced'] += len(members)
 
     def add_skip(self, file_path: str, line_num: int, reason: str, content: str):
-        self.skipped.append({
+        self._write_record({
+            'type': 'skip',
             'file': file_path,
             'line': line_num,
             'reason': reason,
             'content': content.strip()
         })
+        self.stats['strings_skipped'] += 1
 
     def add_error(self, file_path: str, line_num: int, error: str):
-        self.errors.append({
+        self._write_record({
+            'type': 'error',
             'file': file_path,
             'line': line_num,
             'error': error
         })
+        self.stats['errors'] += 1
+
+    def set_git_commit(self, branch: str, commit: str, files: List[str]):
+        """Reference le commit cree en mode git."""
+        self.git_commit = (branch, commit)
+        self._write_record({'type': 'git_commit', 'branch': branch, 'commit': commit, 'files': files})
+
+    def close(self):
+        """Termine le journal JSONL avec un enregistrement de synthese."""
+        if self._records.closed:
+            return
+        self._write_record({'type': 'summary', 'stats': self.stats})
+        self._records.close()
+
+    def _iter_records(self, record_type: str):
+        """Relit le journal JSONL en ne gardant qu'un type d'enregistrement."""
+        with open(self.records_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record['type'] == record_type:
+                    yield record
 
     def generate(self, output_path: str):
+        self.close()
+
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write("=" * 80 + "\n")
             f.write("RAPPORT DE LOCALISATION - PiwigoPublish Plugin\n")
@@ -107,18 +273,26 @@ class LocalizationReport:
             f.write("-" * 80 + "\n")
             f.write(f"Fichiers traites        : {self.stats['files_processed']}\n")
             f.write(f"Fichiers modifies       : {self.stats['files_modified']}\n")
+            f.write(f"Fichiers inchanges      : {self.stats['files_unchanged']} (deja appliques, ignores)\n")
             f.write(f"Lignes modifiees        : {self.stats['total_replacements']}\n")
             f.write(f"Chaines remplacees      : {self.stats['strings_replaced']}\n")
-            f.write(f"Chaines ignorees        : {len(self.skipped)}\n")
-            f.write(f"Erreurs                 : {len(self.errors)}\n\n")
-
-            if self.changes:
+            f.write(f"Chaines ignorees        : {self.stats['strings_skipped']}\n")
+            f.write(f"Erreurs                 : {self.stats['errors']}\n")
+            f.write(f"Journal JSONL           : {self.records_path}\n")
+            if self.git_commit:
+                branch, commit = self.git_commit
+                f.write(f"Commit git              : {commit}\n")
+                f.write(f"Branche git             : {branch}\n")
+                f.write(f"  (appliquer: git switch {branch} / annuler: git branch -D {branch})\n")
+            f.write("\n")
+
+            if self.stats['total_replacements']:
                 f.write("\n" + "=" * 80 + "\n")
                 f.write("MODIFICATIONS EFFECTUEES\n")
                 f.write("=" * 80 + "\n\n")
 
                 current_file = None
-                for change in self.changes:
+                for change in self._iter_records('change'):
                     if change['file'] != current_file:
                         current_file = change['file']
                         f.write(f"\n{'-' * 80}\n")
@@ -132,22 +306,22 @@ class LocalizationReport:
                         f.write(f"    - \"{member['original_text']}\" -> {member['loc_key']}\n")
                     f.write("\n")
 
-            if self.skipped:
+            if self.stats['strings_skipped']:
                 f.write("\n" + "=" * 80 + "\n")
                 f.write("CHAINES IGNOREES\n")
                 f.write("=" * 80 + "\n\n")
 
-                for skip in self.skipped:
+                for skip in self._iter_records('skip'):
                     f.write(f"  {skip['file']}:{skip['line']}\n")
                     f.write(f"    Raison: {skip['reason']}\n")
                     f.write(f"    Contenu: {skip['content'][:80]}\n\n")
 
-            if self.errors:
+            if self.stats['errors']:
                 f.write("\n" + "=" * 80 + "\n")
                 f.write("ERREURS\n")
                 f.write("=" * 80 + "\n\n")
 
-                for err in self.errors:
+                for err in self._iter_records('error'):
                     f.write(f"  {err['file']}:{err['line']}\n")
                     f.write(f"    Erreur: {err['error']}\n\n")
 
@@ -184,6 +358,117 @@ def load_replacements_json(extraction_dir: str) -> Optional[Dict]:
         return None
 
 
+def load_apply_state(extraction_dir: str) -> Dict:
+    """
+    Charge les empreintes des fichiers deja appliques pour cette extraction.
+
+    Returns:
+        {'files': {chemin_relatif: empreinte}} (vide si absent ou illisible)
+    """
+    state_file = os.path.join(extraction_dir, APPLY_STATE_FILE)
+
+    if os.path.exists(state_file):
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if isinstance(state.get('files'), dict):
+                return state
+        except (OSError, ValueError):
+            print(f"  ! {APPLY_STATE_FILE} illisible, tous les fichiers seront retraites")
+
+    return {'files': {}}
+
+
+def save_apply_state(extraction_dir: str, state: Dict) -> None:
+    """Enregistre les empreintes des fichiers deja appliques."""
+    state['updated'] = datetime.now().isoformat()
+    state_file = os.path.join(extraction_dir, APPLY_STATE_FILE)
+    try:
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"  ! Impossible d'enregistrer {APPLY_STATE_FILE}: {e}")
+
+
+def build_selection_index(files_data: Dict, only_files: List[str] = None,
+                          key_prefixes: List[str] = None, patterns: List[str] = None,
+                          max_lines: int = None) -> Tuple[Dict[str, Dict], set]:
+    """
+    Resout une seule fois les filtres de selection sur replacements.json.
+
+    Args:
+        files_data: Section 'files' de replacements.json
+        only_files: Globs sur le chemin relatif des fichiers (ex: "PWDialogs.lua")
+        key_prefixes: Prefixes de cles LOC a conserver (ex: "$$$/Piwigo/Dialogs/")
+        patterns: Globs sur le pattern Extractor de la ligne (ex: "LrDialogs.*", "tooltip")
+        max_lines: Nombre maximal de lignes a modifier (dans l'ordre des fichiers)
+
+    Returns:
+        (index, partiels)
+        - index: {chemin_relatif: file_replacements filtre}, seuls fichiers a ouvrir
+        - partiels: chemins dont une partie des remplacements a ete ecartee
+    """
+    only_files = only_files or []
+    key_prefixes = key_prefixes or []
+    patterns = patterns or []
+
+    index = {}
+    partial = set()
+    remaining = max_lines
+
+    for file_rel_path, file_replacements in sorted(files_data.items()):
+        if remaining is not None and remaining <= 0:
+            break
+
+        normalized = file_rel_path.replace(os.sep, '/')
+        if only_files and not any(
+            fnmatch.fnmatch(normalized, glob_pattern) or
+            fnmatch.fnmatch(os.path.basename(normalized), glob_pattern)
+            for glob_pattern in only_files
+        ):
+            continue
+
+        all_replacements = file_replacements.get('replacements', [])
+        selected = []
+
+        for replacement in all_replacements:
+            if patterns and not any(
+                fnmatch.fnmatch(replacement.get('pattern', ''), p) for p in patterns
+            ):
+                continue
+
+            members = replacement.get('members', [])
+            if key_prefixes:
+                members = [m for m in members
+                           if any(m['loc_key'].startswith(prefix) for prefix in key_prefixes)]
+                if not members:
+                    continue
+
+            if len(members) != len(replacement.get('members', [])):
+                replacement = {**replacement, 'members': members}
+                partial.add(file_rel_path)
+            selected.append(replacement)
+
+            if remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    break
+
+        if not selected:
+            continue
+
+        if len(selected) != len(all_replacements):
+            partial.add(file_rel_path)
+
+        index[file_rel_path] = {
+            **file_replacements,
+            'total_replacements': len(selected),
+            'replacements': selected
+        }
+
+    return index, partial
+
+
 def build_loc_call(member: Dict) -> str:
     """
     Construit l'appel LOC pour un membre.
@@ -267,17 +552,27 @@ def apply_replacements_to_line(line: str, members: List[Dict]) -> Tuple[str, Lis
 
 def process_file_with_replacements(file_path: str, file_replacements: Dict,
                                     report: LocalizationReport, dry_run: bool,
-                                    backup_dir: str = None, create_backup: bool = True) -> int:
+                                    backup_dir: str = None, create_backup: bool = True,
+                                    diff_writer: UnifiedDiffWriter = None,
+                                    rel_path: str = None,
+                                    git_writer: GitCommitWriter = None) -> int:
     """
     Traite un fichier en utilisant les remplacements du JSON.
 
+    Si diff_writer est fourni, les lignes modifiees sont ajoutees au patch
+    unifie (rel_path sert de chemin dans le patch).
+
+    Si git_writer est fourni, le nouveau contenu est ecrit comme blob git
+    (ni backup, ni reecriture du fichier).
+
     Retourne le nombre de remplacements effectues.
     """
     if not os.path.exists(file_path):
         report.add_error(file_path, 0, "Fichier introuvable")
         return 0
 
-    with open(file_path, 'r', encoding='utf-8') as f:
+    # newline='' : les fins de ligne (LF ou CRLF) sont conservees telles quelles
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
         lines = f.readlines()
 
     # Indexer les remplacements par numero de ligne
@@ -288,6 +583,7 @@ def process_file_with_replacements(file_path: str, file_replacements: Dict,
 
     modified = False
     new_lines = []
+    changed_lines = []
     total_applied = 0
 
     for line_num, line in enumerate(lines, 1):
@@ -301,6 +597,7 @@ def process_file_with_replacements(file_path: str, file_replacements: Dict,
             if new_line != line and applied_members:
                 report.add_change(file_path, line_num, line, new_line, applied_members)
                 new_lines.append(new_line)
+                changed_lines.append(line_num)
                 modified = True
                 total_applied += len(applied_members)
             else:
@@ -312,6 +609,7 @@ def process_file_with_replacements(file_path: str, file_replacements: Dict,
                     if new_line != line and applied_members:
                         report.add_change(file_path, line_num, line, new_line, applied_members)
                         new_lines.append(new_line)
+                        changed_lines.append(line_num)
                         modified = True
                         total_applied += len(applied_members)
                     else:
@@ -325,6 +623,13 @@ def process_file_with_replacements(file_path: str, file_replacements: Dict,
         else:
             new_lines.append(line)
 
+    if modified and diff_writer:
+        diff_writer.add_file(rel_path or os.path.basename(file_path), lines, new_lines, changed_lines)
+
+    if modified and git_writer and not dry_run:
+        git_writer.add_file(file_path, new_lines)
+        return total_applied
+
     # Sauvegarder les modifications
     if modified and not dry_run:
         # Créer le backup si demandé
@@ -335,15 +640,30 @@ def process_file_with_replacements(file_path: str, file_replacements: Dict,
             else:
                 backup_path = file_path + '.bak'
             shutil.copy2(file_path, backup_path)
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
             f.writelines(new_lines)
 
     return total_applied
 
 
 def process_plugin_directory(plugin_path: str, extraction_dir: str = None, dry_run: bool = False,
-                              create_backup: bool = True) -> bool:
-    """Traite tous les fichiers Lua du plugin en utilisant replacements.json."""
+                              create_backup: bool = True, force: bool = False,
+                              only_files: List[str] = None, key_prefixes: List[str] = None,
+                              patterns: List[str] = None, max_lines: int = None,
+                              git_mode: bool = False) -> bool:
+    """
+    Traite tous les fichiers Lua du plugin en utilisant replacements.json.
+
+    Les fichiers dont l'empreinte correspond a la derniere application
+    (applied_fingerprints.json) sont ignores sans etre relus, sauf si force=True.
+
+    Les filtres only_files, key_prefixes, patterns et max_lines limitent
+    l'application a une partie de replacements.json (voir build_selection_index) :
+    seuls les fichiers selectionnes sont ouverts et reecrits.
+
+    En mode git (git_mode=True), les modifications sont ecrites dans un commit
+    sur une branche jetable au lieu des .bak et de la reecriture des fichiers.
+    """
 
     if not os.path.isdir(plugin_path):
         print(f"ERREUR: Repertoire du plugin introuvable: {plugin_path}")
@@ -364,6 +684,18 @@ def process_plugin_directory(plugin_path: str, extraction_dir: str = None, dry_r
 
     # Créer le dossier de sortie Applicator
     applicator_output = get_tool_output_path(plugin_path, "Applicator", create=True)
+
+    git_writer = None
+    if git_mode and not dry_run:
+        try:
+            git_writer = GitCommitWriter(
+                plugin_path, GIT_BRANCH_PREFIX + os.path.basename(applicator_output)
+            )
+        except GitError as e:
+            print(f"ERREUR: Mode git impossible: {e}")
+            return False
+        create_backup = False
+
     backup_dir = os.path.join(applicator_output, "backups") if create_backup else None
 
     print("\n" + "=" * 80)
@@ -374,6 +706,8 @@ def process_plugin_directory(plugin_path: str, extraction_dir: str = None, dry_r
     print(f"Sortie Applicator      : {applicator_output}")
     print(f"Mode                   : {'DRY-RUN (simulation)' if dry_run else 'MODIFICATION REELLE'}")
     print(f"Sauvegardes .bak       : {'OUI' if create_backup and not dry_run else 'NON'}")
+    if git_writer:
+        print(f"Mode git               : commit sur la branche {git_writer.branch}")
     print("=" * 80 + "\n")
 
     # Charger replacements.json
@@ -389,26 +723,107 @@ def process_plugin_directory(plugin_path: str, extraction_dir: str = None, dry_r
         print("Aucun remplacement a effectuer")
         return True
 
+    is_filtered = bool(only_files or key_prefixes or patterns or max_lines is not None)
+    if is_filtered:
+        files_data, partial_files = build_selection_index(
+            files_data, only_files, key_prefixes, patterns, max_lines
+        )
+        selected_lines = sum(len(f['replacements']) for f in files_data.values())
+        print(f"* Selection: {len(files_data)} fichier(s), {selected_lines} ligne(s)")
+        if only_files:
+            print(f"  - Fichiers    : {', '.join(only_files)}")
+        if key_prefixes:
+            print(f"  - Prefixes    : {', '.join(key_prefixes)}")
+        if patterns:
+            print(f"  - Patterns    : {', '.join(patterns)}")
+        if max_lines is not None:
+            print(f"  - Max lignes  : {max_lines}")
+        if not files_data:
+            print("Aucun remplacement ne correspond a la selection")
+            return True
+    else:
+        partial_files = set()
+
+    if git_writer:
+        dirty = git_writer.dirty_files([os.path.join(plugin_path, rel) for rel in files_data])
+        if dirty:
+            print("ERREUR: Mode git impossible, modifications non commitees sur:")
+            for path in dirty:
+                print(f"  - {path}")
+            print("        Commitez-les (ou git stash) avant de relancer.")
+            return False
+
     print()
-    report = LocalizationReport()
+    report = LocalizationReport(os.path.join(applicator_output, "application_report.jsonl"))
+    apply_state = load_apply_state(extraction_dir)
+    applied_files = apply_state['files']
+    diff_writer = UnifiedDiffWriter(os.path.join(applicator_output, PATCH_FILE)) if dry_run else None
 
-    for file_rel_path, file_replacements in sorted(files_data.items()):
-        file_path = os.path.join(plugin_path, file_rel_path)
+    try:
+        for file_rel_path, file_replacements in sorted(files_data.items()):
+            file_path = os.path.join(plugin_path, file_rel_path)
+
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                print(f"  ! Fichier introuvable: {file_rel_path}")
+                report.add_error(file_rel_path, 0, "Fichier introuvable")
+                continue
+
+            # Deja applique et inchange depuis : aucune lecture necessaire
+            if not force and fingerprint_matches(file_path, applied_files.get(file_rel_path), st):
+                report.stats['files_unchanged'] += 1
+                print(f"= {file_rel_path} inchange depuis la derniere application (ignore)")
+                continue
 
-        if os.path.exists(file_path):
             print(f"Traitement de {file_rel_path}...")
+
+            source_fingerprint = file_replacements.get('fingerprint')
+            if source_fingerprint and not fingerprint_matches(file_path, source_fingerprint, st):
+                print(f"  ! Fichier modifie depuis l'extraction (numeros de ligne a verifier)")
+
+            issues_before = report.stats['strings_skipped'] + report.stats['errors']
             replacements_count = process_file_with_replacements(
-                file_path, file_replacements, report, dry_run, backup_dir, create_backup
+                file_path, file_replacements, report, dry_run, backup_dir, create_backup,
+                diff_writer=diff_writer, rel_path=file_rel_path, git_writer=git_writer
             )
+            has_issues = report.stats['strings_skipped'] + report.stats['errors'] > issues_before
             report.stats['files_processed'] += 1
             if replacements_count > 0:
                 report.stats['files_modified'] += 1
                 print(f"  * {replacements_count} chaine(s) remplacee(s)")
             else:
                 print(f"  - Aucun remplacement")
-        else:
-            print(f"  ! Fichier introuvable: {file_rel_path}")
-            report.add_error(file_rel_path, 0, "Fichier introuvable")
+
+            # Plus rien a appliquer pour ce fichier : memoriser son empreinte.
+            # Jamais en dry-run, ni si une chaine a ete ignoree ou en erreur (elle
+            # sera retentee), ni si la selection a ecarte une partie des remplacements
+            if dry_run:
+                continue
+            if file_rel_path in partial_files or has_issues:
+                applied_files.pop(file_rel_path, None)
+            elif replacements_count == 0 or not git_writer:
+                applied_files[file_rel_path] = compute_fingerprint(file_path)
+    except BaseException:
+        # Pas de patch partiel : il ne refleterait qu'une partie des fichiers
+        if diff_writer:
+            diff_writer.discard()
+        raise
+    finally:
+        if diff_writer:
+            diff_writer.close()
+
+    save_apply_state(extraction_dir, apply_state)
+
+    if git_writer and git_writer.files:
+        message = (f"i18n: apply LOC replacements ({len(git_writer.files)} file(s))\n\n"
+                   f"Extraction: {extraction_dir}\n")
+        try:
+            commit = git_writer.commit(message)
+            report.set_git_commit(git_writer.branch, commit, git_writer.files)
+        except GitError as e:
+            print(f"ERREUR: Creation du commit git impossible: {e}")
+            report.add_error(plugin_path, 0, f"Commit git: {e}")
 
     # Generer le rapport dans le dossier Applicator
     report_path = os.path.join(applicator_output, "application_report.txt")
@@ -419,13 +834,23 @@ def process_plugin_directory(plugin_path: str, extraction_dir: str = None, dry_r
     print("=" * 80)
     print(f"Fichiers traites        : {report.stats['files_processed']}")
     print(f"Fichiers modifies       : {report.stats['files_modified']}")
+    print(f"Fichiers inchanges      : {report.stats['files_unchanged']}")
     print(f"Lignes modifiees        : {report.stats['total_replacements']}")
     print(f"Chaines remplacees      : {report.stats['strings_replaced']}")
-    print(f"Chaines ignorees        : {len(report.skipped)}")
+    print(f"Chaines ignorees        : {report.stats['strings_skipped']}")
     print(f"\nSortie Applicator       : {applicator_output}")
     if not dry_run and report.stats['files_modified'] > 0 and create_backup:
         print(f"Backups                 : {backup_dir}")
+    if report.git_commit:
+        branch, commit = report.git_commit
+        print(f"Commit git              : {commit[:12]} (branche {branch})")
+        print(f"  Appliquer             : git switch {branch}  (ou git merge {branch})")
+        print(f"  Annuler               : git branch -D {branch}")
     print(f"Rapport detaille        : {report_path}")
+    print(f"Journal JSONL           : {report.records_path}")
+    if diff_writer:
+        print(f"Patch (git apply)       : {diff_writer.output_path} "
+              f"({diff_writer.files} fichier(s), {diff_writer.hunks} hunk(s))")
 
     if dry_run:
         print("\n!!! MODE DRY-RUN: Aucun fichier n'a ete modifie")
@@ -568,12 +993,14 @@ def main():
             print("\nApplication annulee")
             sys.exit(1)
 
-        plugin_path, extraction_dir, dry_run, create_backup = result
+        plugin_path, extraction_dir, dry_run, create_backup, git_mode = result
 
-        success = process_plugin_directory(plugin_path, extraction_dir, dry_run, create_backup)
+        success = process_plugin_directory(plugin_path, extraction_dir, dry_run, create_backup,
+                                           git_mode=git_mode)
 
         # Proposer la gestion des fichiers de traduction si succes et pas en dry-run
-        if success and not dry_run:
+        # (ni en mode git : le plugin sur disque n'a pas encore les appels LOC)
+        if success and not dry_run and not git_mode:
             handle_translation_files(plugin_path, extraction_dir)
 
         sys.exit(0 if success else 1)
@@ -591,6 +1018,10 @@ Exemples:
   python Applicator_main.py --plugin-path ./plugin.lrplugin
   python Applicator_main.py --plugin-path ./plugin.lrplugin --dry-run
 
+  # Application selective (une boite de dialogue a la fois)
+  python Applicator_main.py --plugin-path ./plugin.lrplugin --only-file PWDialogs.lua --pattern "LrDialogs.*"
+  python Applicator_main.py --plugin-path ./plugin.lrplugin --key-prefix "$$$/Piwigo/Dialogs/" --max-lines 50
+
   # Mode CLI avec extraction specifique
   python Applicator_main.py --plugin-path ./plugin.lrplugin --extraction-dir ./plugin.lrplugin/__i18n_kit__/Extractor/20260127_091234
             """
@@ -604,6 +1035,18 @@ Exemples:
                             help='Mode simulation (affiche sans modifier)')
         parser.add_argument('--no-backup', action='store_true',
                             help='Ne pas creer de fichiers de sauvegarde .bak (par defaut: backup active)')
+        parser.add_argument('--force', action='store_true',
+                            help='Retraiter tous les fichiers, meme ceux deja appliques et inchanges')
+        parser.add_argument('--git', action='store_true',
+                            help='Ecrire les modifications dans un commit sur une branche jetable (sans .bak ni reecriture)')
+        parser.add_argument('--only-file', action='append', default=[], metavar='GLOB',
+                            help='Ne traiter que les fichiers correspondants (repetable)')
+        parser.add_argument('--key-prefix', action='append', default=[], metavar='PREFIX',
+                            help="N'appliquer que les cles LOC commencant par PREFIX (repetable)")
+        parser.add_argument('--pattern', action='append', default=[], metavar='GLOB',
+                            help="N'appliquer que les patterns Extractor correspondants, ex: 'LrDialogs.*' (repetable)")
+        parser.add_argument('--max-lines', type=int, default=None, metavar='N',
+                            help='Nombre maximal de lignes a modifier')
 
         args = parser.parse_args()
 
@@ -611,11 +1054,18 @@ Exemples:
             args.plugin_path,
             args.extraction_dir,
             args.dry_run,
-            create_backup=not args.no_backup
+            create_backup=not args.no_backup,
+            force=args.force,
+            only_files=args.only_file,
+            key_prefixes=args.key_prefix,
+            patterns=args.pattern,
+            max_lines=args.max_lines,
+            git_mode=args.git
         )
 
         # Proposer la gestion des fichiers de traduction si succes et pas en dry-run
-        if success and not args.dry_run:
+        # (ni en mode git : le plugin sur disque n'a pas encore les appels LOC)
+        if success and not args.dry_run and not args.git:
             handle_translation_files(args.plugin_path, args.extraction_dir)
 
         sys.exit(0 if success else 1)
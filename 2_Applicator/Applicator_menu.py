@@ -35,6 +35,7 @@ class ApplicatorMenu:
         self.extraction_dir = ""
         self.dry_run = False  # Par défaut: modifications réelles
         self.create_backup = True  # Par défaut: sauvegardes activées
+        self.git_mode = False  # Par défaut: .bak + réécriture des fichiers
 
         # Valider et appliquer le chemin par défaut
         if default_plugin_path:
@@ -110,8 +111,17 @@ class ApplicatorMenu:
             backup_display = f"{c.OK}Oui (recommandé){c.RESET}"
         else:
             backup_display = f"{c.WARNING}Non{c.RESET}"
+        if self.git_mode:
+            backup_display = f"{c.DIM}Non (remplacées par le commit git){c.RESET}"
         print(c.config_line("4. Sauvegardes .bak", backup_display))
 
+        # Mode git
+        if self.git_mode:
+            git_display = f"{c.OK}Oui (commit sur une branche jetable){c.RESET}"
+        else:
+            git_display = f"{c.DIM}Non{c.RESET}"
+        print(c.config_line("5. Mode git", git_display))
+
         # Sortie Applicator
         if self.plugin_path:
             output_path = f"<plugin>/{get_i18n_dir()}/Applicator/<timestamp>/"
@@ -131,7 +141,7 @@ class ApplicatorMenu:
         else:
             print(f"  {c.DIM}ENTRÉE  Lancer (configurer plugin et extraction d'abord){c.RESET}")
 
-        print(c.menu_option("1-4", "Modifier une option"))
+        print(c.menu_option("1-5", "Modifier une option"))
         print(c.menu_option("0", "Quitter"))
         print()
 
@@ -259,6 +269,33 @@ class ApplicatorMenu:
         else:
             print(c.success(f"Option inchangée: {'Oui' if self.create_backup else 'Non'}"))
 
+    def input_git_mode(self):
+        """Demande le mode git."""
+        print()
+        print(c.title("5. Mode git"))
+        print(c.separator())
+        print("Écrit les modifications dans un commit sur une branche jetable")
+        print(f"({c.VALUE}i18n/applicator-<timestamp>{c.RESET}) au lieu des .bak et de la réécriture des fichiers.")
+        print("Le plugin doit être dans un dépôt git, sans modification non commitée")
+        print("sur les fichiers concernés.")
+        print()
+
+        if self.dry_run:
+            print(f"{c.DIM}(Non utilisé en mode simulation){c.RESET}")
+            return
+
+        current = "O" if self.git_mode else "N"
+        response = input(c.prompt(f"Mode git? [{current}]: ")).strip().lower()
+
+        if response in ['o', 'y', 'oui', 'yes']:
+            self.git_mode = True
+            print(c.success("Mode git activé"))
+        elif response in ['n', 'non', 'no']:
+            self.git_mode = False
+            print(c.success("Mode git désactivé"))
+        else:
+            print(c.success(f"Option inchangée: {'Oui' if self.git_mode else 'Non'}"))
+
     def run(self) -> bool:
         """
         Lance le menu interactif avec l'approche "Ready to go".
@@ -303,6 +340,10 @@ class ApplicatorMenu:
             elif choice == '4':
                 self.input_backup()
 
+            elif choice == '5':
+                self.input_git_mode()
+                input(f"\n{c.DIM}Appuyez sur ENTRÉE...{c.RESET}")
+
             elif choice == '':
                 # ENTRÉE mais pas prêt
                 print()
@@ -317,17 +358,18 @@ class ApplicatorMenu:
                 print(c.error("Choix invalide"))
                 input(f"\n{c.DIM}Appuyez sur ENTRÉE...{c.RESET}")
 
-    def to_args(self) -> Tuple[str, str, bool, bool]:
+    def to_args(self) -> Tuple[str, str, bool, bool, bool]:
         """Retourne les arguments sous forme de tuple."""
         return (
             self.plugin_path,
             self.extraction_dir,
             self.dry_run,
-            self.create_backup
+            self.create_backup,
+            self.git_mode
         )
 
 
-def show_interactive_menu(default_plugin_path: str = "") -> Optional[Tuple[str, str, bool, bool]]:
+def show_interactive_menu(default_plugin_path: str = "") -> Optional[Tuple[str, str, bool, bool, bool]]:
     """
     Affiche le menu interactif et retourne les paramètres.
 
@@ -335,7 +377,7 @@ def show_interactive_menu(default_plugin_path: str = "") -> Optional[Tuple[str,
         default_plugin_path: Chemin du plugin pré-configuré (optionnel)
 
     Returns:
-        Tuple avec (plugin_path, extraction_dir, dry_run, create_backup)
+        Tuple avec (plugin_path, extraction_dir, dry_run, create_backup, git_mode)
         ou None si l'utilisateur a annulé
     """
     menu = ApplicatorMenu(default_plugin_path)
@@ -8,8 +8,12 @@ Contient les fonctions de parsing, écriture et utilitaires.
 
 import os
 import sys
-import re
 import json
+import gzip
+import stat
+import shutil
+import hashlib
+import tempfile
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
@@ -17,6 +21,8 @@ from collections import defaultdict
 # Ajouter le répertoire parent au path pour importer common
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common.colors import Colors
+from common.fingerprint import hash_file
+from common.paths import get_i18n_kit_path
 
 # Instance couleurs
 c = Colors()
@@ -50,44 +56,161 @@ TRANSLATION_WARNING_NOTE = """-- -----------------------------------------------
 """
 
 
+# Fichier des différences généré par COMPARE
+UPDATE_FILE = "UPDATE_en.json"
+
+# Préfixe de la ligne d'horodatage (ignorée pour détecter les changements)
+GENERATED_LINE_PREFIX = "-- Generated:"
+
+# Marqueurs des traductions dont les placeholders diffèrent de l'EN (INJECT, SYNC)
+PLACEHOLDER_MARKER = "-- ## NEEDS_REVIEW ## Placeholders : {detail}"
+PLACEHOLDER_REJECTED_MARKER = "-- ## NEEDS_REVIEW ## Placeholders : {detail} - traduction rejetée : {text}"
+
+
 # =============================================================================
-# PARSER
+# PARSER / WRITER (voir TM_parser.py et TM_writer.py)
 # =============================================================================
 
-def parse_translation_file(file_path: str) -> Dict[str, str]:
+from TM_parser import (  # noqa: E402
+    parse_translation_file, parse_translation_file_cached,
+    invalidate_parse_cache, set_parse_cache_dir
+)
+from TM_writer import key_category, patch_translation_content  # noqa: E402
+
+# Sous-dossier de __i18n_tmp__ pour le cache disque du parser
+PARSE_CACHE_DIR = "parse_cache"
+
+
+def enable_parse_cache(plugin_path: str):
+    """Active le cache disque du parser dans <plugin>/__i18n_tmp__/parse_cache (ou le désactive)."""
+    if plugin_path:
+        set_parse_cache_dir(os.path.join(get_i18n_kit_path(plugin_path), PARSE_CACHE_DIR))
+    else:
+        set_parse_cache_dir(None)
+
+
+def _header_info_lines(lang: str, total: int, metadata: Dict = None) -> List[str]:
+    """Lignes d'information de l'entête (entre les deux lignes -- =====)."""
+    metadata = metadata or {}
+    
+    out = []
+    out.append(f"-- Plugin Localization - {lang.upper()}\n")
+    out.append(f"{GENERATED_LINE_PREFIX} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    out.append(f"-- Total keys: {total}\n")
+    
+    # Infos supplémentaires depuis metadata
+    if metadata.get('new_keys'):
+        out.append(f"-- New keys: {metadata['new_keys']}\n")
+    if metadata.get('changed_keys'):
+        out.append(f"-- Changed keys: {metadata['changed_keys']}\n")
+    if metadata.get('source'):
+        out.append(f"-- Source: {metadata['source']}\n")
+    
+    return out
+
+
+def render_translation_file(lang: str, translations: Dict[str, str],
+                            markers: Dict[str, str] = None,
+                            metadata: Dict = None) -> str:
     """
-    Parse un fichier TranslatedStrings_*.txt
+    Génère en mémoire le contenu complet d'un fichier TranslatedStrings_*.txt
     
-    Format: "$$$/Key=Value"
+    Args:
+        lang: Code langue
+        translations: Dict {clé: valeur}
+        markers: Dict {clé: marqueur} pour ajouter des commentaires
+        metadata: Dict avec infos supplémentaires pour l'entête
     
     Returns:
-        Dict[str, str]: {clé: valeur}
+        Contenu complet du fichier
     """
-    strings = {}
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Ignorer lignes vides et commentaires
-            if not line or line.startswith('--'):
-                continue
-            
-            # Parser: "$$$/Key=Value"
-            match = re.match(r'"(\$\$\$/[^"=]+)=([^"]*)"', line)
-            if match:
-                key = match.group(1)
-                value = match.group(2)
-                strings[key] = value
-    
-    return strings
+    markers = markers or {}
+    
+    # Grouper par catégorie ($$$/Prefix/Category/Name)
+    by_category = defaultdict(list)
+    for key in sorted(translations.keys()):
+        by_category[key_category(key)].append(key)
+    
+    out = []
+    out.append("-- =============================================================================\n")
+    out.extend(_header_info_lines(lang, len(translations), metadata))
+    out.append("-- =============================================================================\n\n")
+
+    # Add translation warning note for translators
+    out.append(TRANSLATION_WARNING_NOTE)
+
+    for category in sorted(by_category.keys()):
+        out.append(f"-- {category}\n")
+        for key in by_category[category]:
+            value = translations[key]
+            marker = markers.get(key, '')
+            if marker:
+                out.append(f'{marker}\n')
+            out.append(f'"{key}={value}"\n')
+        out.append("\n")
+    
+    return ''.join(out)
+
+
+def _content_digest(content: str) -> str:
+    """Hash du contenu, sans la ligne d'horodatage (-- Generated: ...)."""
+    digest = hashlib.sha256()
+    for line in content.splitlines(keepends=True):
+        if not line.startswith(GENERATED_LINE_PREFIX):
+            digest.update(line.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def write_if_changed(file_path: str, content: str, backup: bool = False) -> bool:
+    """
+    Écrit un fichier seulement si son contenu change (horodatage ignoré).
+    
+    L'écriture passe par un fichier temporaire dans le même répertoire
+    puis os.replace : le fichier n'est jamais laissé à moitié écrit.
+    
+    Args:
+        file_path: Chemin du fichier
+        content: Nouveau contenu
+        backup: Copier l'ancien fichier en .bak avant de le remplacer
+    
+    Returns:
+        True si le fichier a été écrit, False s'il était déjà à jour
+    """
+    mode = 0o644
+    if os.path.isfile(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if _content_digest(f.read()) == _content_digest(content):
+                return False
+        if backup:
+            shutil.copy2(file_path, file_path + '.bak')
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(file_path) + '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    invalidate_parse_cache(file_path)
+    return True
 
 
 def write_translation_file(file_path: str, lang: str, translations: Dict[str, str],
                            markers: Dict[str, str] = None,
-                           metadata: Dict = None):
+                           metadata: Dict = None, backup: bool = False) -> bool:
     """
-    Écrit un fichier TranslatedStrings_*.txt
+    Écrit un fichier TranslatedStrings_*.txt (seulement s'il change)
+    
+    Si le fichier existe, il est modifié de façon incrémentale (TM_writer) :
+    ordre des clés et commentaires conservés, seules les lignes concernées
+    changent. Sinon, il est généré complètement (tri par catégorie).
     
     Args:
         file_path: Chemin du fichier
@@ -95,45 +218,21 @@ def write_translation_file(file_path: str, lang: str, translations: Dict[str, st
         translations: Dict {clé: valeur}
         markers: Dict {clé: marqueur} pour ajouter des commentaires
         metadata: Dict avec infos supplémentaires pour l'entête
-    """
-    markers = markers or {}
-    metadata = metadata or {}
+        backup: Créer une sauvegarde .bak si le fichier est réécrit
     
-    # Grouper par catégorie
-    by_category = defaultdict(list)
-    for key in sorted(translations.keys()):
-        parts = key.split('/')
-        category = parts[1] if len(parts) > 1 else 'General'
-        by_category[category].append(key)
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write("-- =============================================================================\n")
-        f.write(f"-- Plugin Localization - {lang.upper()}\n")
-        f.write(f"-- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"-- Total keys: {len(translations)}\n")
-        
-        # Infos supplémentaires depuis metadata
-        if metadata.get('new_keys'):
-            f.write(f"-- New keys: {metadata['new_keys']}\n")
-        if metadata.get('changed_keys'):
-            f.write(f"-- Changed keys: {metadata['changed_keys']}\n")
-        if metadata.get('source'):
-            f.write(f"-- Source: {metadata['source']}\n")
-        
-        f.write("-- =============================================================================\n\n")
-
-        # Add translation warning note for translators
-        f.write(TRANSLATION_WARNING_NOTE)
-
-        for category in sorted(by_category.keys()):
-            f.write(f"-- {category}\n")
-            for key in by_category[category]:
-                value = translations[key]
-                marker = markers.get(key, '')
-                if marker:
-                    f.write(f'{marker}\n')
-                f.write(f'"{key}={value}"\n')
-            f.write("\n")
+    Returns:
+        True si le fichier a été écrit, False s'il était inchangé
+    """
+    if os.path.isfile(file_path):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            current = f.read()
+        content = patch_translation_content(
+            current, translations, markers,
+            _header_info_lines(lang, len(translations), metadata)
+        )
+    else:
+        content = render_translation_file(lang, translations, markers, metadata)
+    return write_if_changed(file_path, content, backup)
 
 
 def resolve_path(path: str) -> Tuple[str, str]:
@@ -162,17 +261,69 @@ def resolve_path(path: str) -> Tuple[str, str]:
 
 def load_update_json(update_dir: str) -> Optional[Dict]:
     """
-    Charge le fichier UPDATE_en.json depuis un répertoire.
+    Charge le fichier UPDATE_en.json (ou UPDATE_en.json.gz) depuis un répertoire.
+    
+    Accepte les deux formats :
+        - Complet (v1) : all_new_strings, unchanged_keys + copie TranslatedStrings_en.txt
+        - Compact (v2) : seulement added/changed/deleted/renamed + hash du fichier EN
     
     Returns:
         Dict avec les données ou None si non trouvé
     """
-    update_file = os.path.join(update_dir, 'UPDATE_en.json')
-    if not os.path.isfile(update_file):
+    update_file = os.path.join(update_dir, UPDATE_FILE)
+    if os.path.isfile(update_file):
+        with open(update_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    if os.path.isfile(update_file + '.gz'):
+        with gzip.open(update_file + '.gz', 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    
+    return None
+
+
+def find_update_reference(update_dir: str, update_data: Optional[Dict],
+                          locales_dir: str = None) -> Optional[str]:
+    """
+    Retrouve le fichier EN de référence d'un dossier UPDATE.
+    
+    Ordre de recherche :
+        1. Copie TranslatedStrings_en.txt dans le dossier UPDATE (format v1)
+        2. Fichier new_file enregistré par COMPARE (format v2)
+        3. TranslatedStrings_en.txt dans locales_dir
+    
+    Pour 2 et 3, le premier fichier dont le hash correspond à new_file_sha256
+    est retenu. Si aucun ne correspond (fichier EN modifié depuis COMPARE),
+    le premier fichier existant est utilisé avec un avertissement.
+    
+    Returns:
+        Chemin du fichier EN, ou None
+    """
+    copy_in_update = os.path.join(update_dir, 'TranslatedStrings_en.txt')
+    if os.path.isfile(copy_in_update):
+        return copy_in_update
+    
+    if not update_data or not update_data.get('new_file_sha256'):
         return None
     
-    with open(update_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    candidates = []
+    for candidate in (update_data.get('new_file'),
+                      os.path.join(locales_dir, 'TranslatedStrings_en.txt') if locales_dir else None):
+        if candidate and os.path.isfile(candidate):
+            candidate = os.path.realpath(candidate)
+            if candidate not in candidates:
+                candidates.append(candidate)
+    
+    for candidate in candidates:
+        if hash_file(candidate) == update_data['new_file_sha256']:
+            return candidate
+    
+    if candidates:
+        print(c.warning(f"{candidates[0]} a changé depuis COMPARE (hash différent)"))
+        print(f"{c.DIM}        Relancez COMPARE pour mettre à jour les marqueurs [NEW]/[NEEDS_REVIEW].{c.RESET}")
+        return candidates[0]
+    
+    return None
 
 
 def find_languages(directory: str, exclude_en: bool = True) -> List[str]:
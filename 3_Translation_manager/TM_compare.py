@@ -4,15 +4,27 @@ TM_compare.py
 
 Module COMPARE pour TranslationManager.
 Compare deux versions du fichier EN et génère UPDATE_en.json + CHANGELOG.txt
+
+Les deux versions sont des fichiers, ou des snapshots de l'historique EN
+(common/snapshots.py) enregistrés par l'Extractor, COMPARE, PIPELINE et SYNC.
 """
 
 import os
 import json
-import shutil
+import gzip
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from TM_common import (
+    parse_translation_file, write_translation_file, resolve_path, load_update_json, UPDATE_FILE, c
+)
+from common.fingerprint import hash_file
+from common.snapshots import SnapshotStore, register_snapshot
 
-from TM_common import parse_translation_file, resolve_path, c
+
+# Version du format de UPDATE_en.json (1 = complet, 2 = compact)
+UPDATE_FORMAT = 2
 
 
 # =============================================================================
@@ -36,6 +48,7 @@ class VersionComparator:
                 'added': {key: value},
                 'changed': {key: {'old': x, 'new': y}},
                 'deleted': [keys],
+                'renamed': {new_key: {'from': old_key, 'value': value}},
                 'unchanged': [keys]
             }
         """
@@ -58,28 +71,69 @@ class VersionComparator:
             if key not in self.old:
                 added[key] = val
         
+        deleted.sort()
+        renamed = self._detect_renames(added, deleted)
+        
         self.result = {
             'added': added,
             'changed': changed,
-            'deleted': sorted(deleted),
+            'deleted': deleted,
+            'renamed': renamed,
             'unchanged': sorted(unchanged)
         }
         
         return self.result
+    
+    def _detect_renames(self, added: Dict[str, str], deleted: List[str]) -> Dict[str, Dict]:
+        """
+        Détecte les clés renommées (texte EN identique, clé différente).
+        
+        Index des valeurs supprimées, puis une recherche par clé ajoutée.
+        Si plusieurs clés partagent le même texte, elles sont appariées
+        dans l'ordre alphabétique (ex: décalage des suffixes _1, _2...).
+        Les paires trouvées sont retirées de added et deleted (en place).
+        
+        Returns:
+            {new_key: {'from': old_key, 'value': value}}
+        """
+        by_value = defaultdict(deque)
+        for key in deleted:
+            by_value[self.old[key]].append(key)
+        
+        renamed = {}
+        for key in sorted(added.keys()):
+            candidates = by_value.get(added[key])
+            if candidates:
+                renamed[key] = {'from': candidates.popleft(), 'value': added[key]}
+        
+        if renamed:
+            moved = {info['from'] for info in renamed.values()}
+            for key in renamed:
+                del added[key]
+            deleted[:] = [key for key in deleted if key not in moved]
+        
+        return renamed
 
 
 # =============================================================================
 # FONCTIONS PRINCIPALES
 # =============================================================================
 
-def run_compare(old_path: str, new_path: str, output_dir: str = None) -> str:
+def run_compare(old_path: str, new_path: str, output_dir: str = None,
+                compress: bool = False, plugin_path: str = None) -> str:
     """
     Compare deux versions du fichier EN.
     
+    UPDATE_en.json ne contient que les différences (added, changed,
+    deleted, renamed) et le hash SHA-256 du nouveau fichier EN, qui sert
+    de référence à SYNC (voir find_update_reference).
+    
     Args:
         old_path: Ancien fichier EN (ou répertoire)
         new_path: Nouveau fichier EN (ou répertoire)
         output_dir: Répertoire de sortie (défaut: timestampé)
+        compress: Écrire UPDATE_en.json.gz au lieu de UPDATE_en.json
+        plugin_path: Plugin dont l'historique EN reçoit les deux versions (optionnel)
     
     Returns:
         Chemin du répertoire de sortie
@@ -97,45 +151,137 @@ def run_compare(old_path: str, new_path: str, output_dir: str = None) -> str:
     # Parser les fichiers
     old_strings = parse_translation_file(old_file)
     new_strings = parse_translation_file(new_file)
+    register_snapshot(plugin_path, old_strings, 'COMPARE', old_file)
+    register_snapshot(plugin_path, new_strings, 'COMPARE', new_file)
     
     # Comparer
     comparator = VersionComparator(old_strings, new_strings)
     result = comparator.compare()
     
-    # Générer UPDATE_en.json
-    update_data = {
+    update_data = build_update_data(old_file, new_file, len(old_strings), len(new_strings), result)
+    write_compare_outputs(output_dir, update_data, result, old_file, new_file, compress)
+    
+    return output_dir
+
+
+def run_compare_snapshots(plugin_path: str, from_ref: str, to_ref: str,
+                          output_dir: str = None, compress: bool = False) -> str:
+    """
+    Compare deux snapshots de l'historique EN du plugin.
+    
+    Les entrées communes (même hash) ne sont pas relues : seules les entrées
+    propres à l'un des deux snapshots sont résolues puis comparées.
+    
+    Si le fichier EN du snapshot cible n'existe plus tel qu'enregistré (ou
+    n'est pas connu), ses entrées sont écrites dans le répertoire de sortie
+    (TranslatedStrings_en.txt) : SYNC et EXTRACT y retrouvent la référence.
+    
+    Args:
+        plugin_path: Plugin contenant l'historique (__i18n_tmp__/snapshots)
+        from_ref, to_ref: Snapshots (identifiant, préfixe, 'latest' ou 'latest~N')
+        output_dir: Répertoire de sortie (défaut: timestampé)
+        compress: Écrire UPDATE_en.json.gz au lieu de UPDATE_en.json
+    
+    Returns:
+        Chemin du répertoire de sortie
+    """
+    store = SnapshotStore(plugin_path)
+    old_snap = store.resolve(from_ref)
+    new_snap = store.resolve(to_ref)
+    
+    if not output_dir:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), timestamp)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    old_hashes = store.load_hashes(old_snap['id'])
+    new_hashes = store.load_hashes(new_snap['id'])
+    
+    # Une clé présente des deux côtés avec deux valeurs est dans les deux deltas
+    result = VersionComparator(store.entries(old_hashes - new_hashes),
+                               store.entries(new_hashes - old_hashes)).compare()
+    result['unchanged'] = sorted(store.entries(old_hashes & new_hashes))
+    
+    old_label = f"snapshot {old_snap['id']} ({old_snap['created']})"
+    new_label = f"snapshot {new_snap['id']} ({new_snap['created']})"
+    
+    # Référence EN : le fichier du snapshot s'il est inchangé, sinon une copie
+    new_file = new_snap.get('file')
+    new_sha256 = new_snap.get('file_sha256')
+    if not (new_file and new_sha256 and os.path.isfile(new_file) and hash_file(new_file) == new_sha256):
+        reference = os.path.join(output_dir, 'TranslatedStrings_en.txt')
+        write_translation_file(reference, 'en', store.entries(new_hashes),
+                               metadata={'source': f'COMPARE ({new_label})'})
+        new_sha256 = new_sha256 or hash_file(reference)
+    
+    update_data = build_update_data(old_snap.get('file'), new_file,
+                                    old_snap['keys'], new_snap['keys'], result,
+                                    new_file_sha256=new_sha256)
+    update_data['old_snapshot'] = old_snap['id']
+    update_data['new_snapshot'] = new_snap['id']
+    write_compare_outputs(output_dir, update_data, result, old_label, new_label, compress)
+    
+    return output_dir
+
+
+def build_update_data(old_file: str, new_file: str, total_old: int, total_new: int,
+                      result: Dict, new_file_sha256: str = None) -> Dict:
+    """
+    Construit le contenu de UPDATE_en.json (format compact : seulement les différences).
+    
+    Args:
+        old_file, new_file: Fichiers EN comparés (None: snapshot sans fichier connu)
+        total_old, total_new: Nombre de clés de chaque version
+        result: Résultat de VersionComparator.compare()
+        new_file_sha256: Hash du nouveau fichier (None: calculé sur new_file)
+    """
+    return {
+        'format': UPDATE_FORMAT,
         'generated': datetime.now().isoformat(),
-        'old_file': os.path.abspath(old_file),
-        'new_file': os.path.abspath(new_file),
+        'old_file': os.path.abspath(old_file) if old_file else None,
+        'new_file': os.path.abspath(new_file) if new_file else None,
+        'new_file_sha256': hash_file(new_file) if new_file_sha256 is None else new_file_sha256,
         'summary': {
             'added': len(result['added']),
             'changed': len(result['changed']),
             'deleted': len(result['deleted']),
+            'renamed': len(result['renamed']),
             'unchanged': len(result['unchanged']),
-            'total_old': len(old_strings),
-            'total_new': len(new_strings)
+            'total_old': total_old,
+            'total_new': total_new
         },
         'added': result['added'],
         'changed': result['changed'],
         'deleted': result['deleted'],
-        # Inclure aussi les clés inchangées avec leurs valeurs pour référence complète
-        'unchanged_keys': result['unchanged'],
-        'all_new_strings': new_strings  # Toutes les clés de la nouvelle version
+        'renamed': result['renamed']
     }
+
+
+def write_compare_outputs(output_dir: str, update_data: Dict, result: Dict,
+                          old_file: str, new_file: str, compress: bool = False):
+    """Écrit UPDATE_en.json (ou .gz) et CHANGELOG.txt dans output_dir."""
+    os.makedirs(output_dir, exist_ok=True)
+    _write_update_json(output_dir, update_data, compress)
+    _generate_changelog(os.path.join(output_dir, 'CHANGELOG.txt'), result, old_file, new_file)
+
+
+def _write_update_json(output_dir: str, update_data: Dict, compress: bool = False):
+    """Écrit UPDATE_en.json (JSON compact) ou UPDATE_en.json.gz."""
+    update_file = os.path.join(output_dir, UPDATE_FILE)
+    payload = json.dumps(update_data, ensure_ascii=False, separators=(',', ':'))
     
-    update_file = os.path.join(output_dir, 'UPDATE_en.json')
-    with open(update_file, 'w', encoding='utf-8') as f:
-        json.dump(update_data, f, indent=2, ensure_ascii=False)
-    
-    # Générer CHANGELOG.txt
-    changelog_file = os.path.join(output_dir, 'CHANGELOG.txt')
-    _generate_changelog(changelog_file, result, old_file, new_file)
-    
-    # Copier le nouveau fichier EN comme référence
-    new_en_file = os.path.join(output_dir, 'TranslatedStrings_en.txt')
-    shutil.copy2(new_file, new_en_file)
+    if compress:
+        target, stale = update_file + '.gz', update_file
+        with gzip.open(target, 'wt', encoding='utf-8') as f:
+            f.write(payload)
+    else:
+        target, stale = update_file, update_file + '.gz'
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(payload)
     
-    return output_dir
+    # Ne pas laisser l'autre variante d'une exécution précédente
+    if os.path.isfile(stale):
+        os.remove(stale)
 
 
 def _generate_changelog(file_path: str, result: Dict, old_file: str, new_file: str):
@@ -156,6 +302,7 @@ def _generate_changelog(file_path: str, result: Dict, old_file: str, new_file: s
         f.write(f"  Clés ajoutées    : {len(result['added']):4d}  [NEW]\n")
         f.write(f"  Clés modifiées   : {len(result['changed']):4d}  [CHANGED]\n")
         f.write(f"  Clés supprimées  : {len(result['deleted']):4d}  [DELETED]\n")
+        f.write(f"  Clés renommées   : {len(result['renamed']):4d}  [RENAMED]\n")
         f.write(f"  Clés inchangées  : {len(result['unchanged']):4d}\n")
         f.write("\n")
         
@@ -188,6 +335,17 @@ def _generate_changelog(file_path: str, result: Dict, old_file: str, new_file: s
             for key in result['deleted']:
                 f.write(f"  [DELETED] {key}\n")
         
+        if result['renamed']:
+            f.write("\n" + "=" * 80 + "\n")
+            f.write(f"CLÉS RENOMMÉES ({len(result['renamed'])})\n")
+            f.write("Texte EN identique : les traductions existantes sont conservées.\n")
+            f.write("=" * 80 + "\n\n")
+            for key in sorted(result['renamed'].keys()):
+                rename = result['renamed'][key]
+                f.write(f"  [RENAMED] {rename['from']}\n")
+                f.write(f"         →  {key}\n")
+                f.write(f"        EN: {rename['value']}\n\n")
+        
         f.write("\n" + "=" * 80 + "\n")
         f.write("PROCHAINE ÉTAPE\n")
         f.write("=" * 80 + "\n")
@@ -237,11 +395,10 @@ def menu_compare(plugin_path: str = ""):
         else:
             output_dir = None  # run_compare créera un dossier local
 
-        output_dir = run_compare(old_path, new_path, output_dir)
+        output_dir = run_compare(old_path, new_path, output_dir, plugin_path=plugin_path)
 
         # Charger le résultat pour affichage
-        with open(os.path.join(output_dir, 'UPDATE_en.json'), 'r', encoding='utf-8') as f:
-            result = json.load(f)
+        result = load_update_json(output_dir)
 
         summary = result['summary']
         print(f"\n{c.HEADER}{'=' * 66}{c.RESET}")
@@ -250,14 +407,14 @@ def menu_compare(plugin_path: str = ""):
         print(f"  {c.KEY}Clés ajoutées   {c.RESET}: {c.GREEN}{summary['added']:4d}{c.RESET}  {c.DIM}[NEW]{c.RESET}")
         print(f"  {c.KEY}Clés modifiées  {c.RESET}: {c.YELLOW}{summary['changed']:4d}{c.RESET}  {c.DIM}[CHANGED]{c.RESET}")
         print(f"  {c.KEY}Clés supprimées {c.RESET}: {c.RED}{summary['deleted']:4d}{c.RESET}  {c.DIM}[DELETED]{c.RESET}")
+        print(f"  {c.KEY}Clés renommées  {c.RESET}: {c.CYAN}{summary['renamed']:4d}{c.RESET}  {c.DIM}[RENAMED]{c.RESET}")
         print(f"  {c.KEY}Clés inchangées {c.RESET}: {c.DIM}{summary['unchanged']:4d}{c.RESET}")
         print()
         print(c.success(f"Fichiers générés dans: {c.VALUE}{output_dir}{c.RESET}"))
         print(f"    {c.DIM}• UPDATE_en.json{c.RESET}")
         print(f"    {c.DIM}• CHANGELOG.txt{c.RESET}")
-        print(f"    {c.DIM}• TranslatedStrings_en.txt{c.RESET}")
 
-        if summary['added'] or summary['changed'] or summary['deleted']:
+        if summary['added'] or summary['changed'] or summary['deleted'] or summary['renamed']:
             print()
             print(f"{c.INFO}[INFO]{c.RESET} PROCHAINE ÉTAPE:")
             print(f"  {c.DIM}• EXTRACT pour générer les fichiers de traduction{c.RESET}")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+TM_consistency.py
+
+Module CONSISTENCY pour TranslationManager.
+Détecte les clés qui partagent le même texte EN mais dont les traductions
+divergent (ex: "Cancel" sous $$$/P/Dialog/Cancel et $$$/P/Export/Cancel).
+
+- Un seul passage par fichier : les clés sont regroupées par texte EN
+  normalisé (dict), puis chaque langue est parcourue une fois
+- Option --apply : la traduction majoritaire du groupe est propagée aux
+  autres clés (non traduites comprises) ; les égalités ne sont pas tranchées
+"""
+
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from TM_common import (
+    parse_translation_file, write_translation_file, resolve_path, find_languages, c
+)
+from TM_memory import normalize_text
+from TM_merge import save_base_snapshot
+from TM_writer import read_markers
+
+
+# Marqueur des clés harmonisées par --apply
+HARMONIZED_MARKER = "-- ## NEEDS_REVIEW ## Harmonisé (traduction majoritaire)"
+
+
+@dataclass
+class InconsistentGroup:
+    """Clés de même texte EN traduites différemment dans une langue."""
+    en_text: str
+    translations: Dict[str, str]                  # {clé: traduction} (non traduites: valeur EN)
+    votes: Dict[str, int] = field(default_factory=dict)
+    majority: Optional[str] = None                # None si égalité
+
+
+def group_by_en_text(en_strings: Dict[str, str]) -> List[List[str]]:
+    """Groupes de clés (au moins 2) partageant le même texte EN normalisé."""
+    groups = defaultdict(list)
+    for key, text in en_strings.items():
+        if text.strip():
+            groups[normalize_text(text)].append(key)
+    return [sorted(keys) for keys in groups.values() if len(keys) > 1]
+
+
+def find_inconsistencies(en_strings: Dict[str, str], lang_strings: Dict[str, str],
+                         groups: List[List[str]] = None) -> List[InconsistentGroup]:
+    """
+    Liste les groupes dont les traductions divergent dans une langue.
+
+    Seules les vraies traductions (différentes du texte EN) votent ; une clé
+    non traduite dans un groupe traduit est aussi signalée.
+    """
+    if groups is None:
+        groups = group_by_en_text(en_strings)
+
+    result = []
+    for keys in groups:
+        present = {key: lang_strings[key] for key in keys if key in lang_strings}
+        votes = Counter(value for key, value in present.items()
+                        if value.strip() and value != en_strings[key])
+        if not votes or (len(votes) == 1 and len(present) == sum(votes.values())):
+            continue  # Rien de traduit, ou toutes les clés traduites à l'identique
+
+        ranked = votes.most_common(2)
+        majority = ranked[0][0] if len(ranked) == 1 or ranked[0][1] > ranked[1][1] else None
+        result.append(InconsistentGroup(
+            en_text=en_strings[keys[0]],
+            translations=present,
+            votes=dict(votes),
+            majority=majority
+        ))
+    return result
+
+
+def run_consistency(reference_path: str, locales_dir: str = None,
+                    languages: List[str] = None, apply: bool = False) -> Dict[str, Dict]:
+    """
+    Analyse (et optionnellement harmonise) toutes les langues.
+
+    Args:
+        reference_path: Fichier EN de référence (ou répertoire)
+        locales_dir: Répertoire des fichiers de langues (défaut: celui du EN)
+        languages: Langues à analyser (défaut: toutes)
+        apply: Propager la traduction majoritaire
+
+    Returns:
+        {langue: {'groups': [InconsistentGroup], 'propagated': int, 'written': bool}}
+    """
+    ref_dir, ref_file = resolve_path(reference_path)
+    locales_dir = locales_dir or ref_dir
+    en_strings = parse_translation_file(ref_file)
+    groups = group_by_en_text(en_strings)
+
+    results = {}
+    for lang in languages or find_languages(locales_dir, exclude_en=True):
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        if not os.path.isfile(lang_file):
+            continue
+
+        lang_strings = parse_translation_file(lang_file)
+        inconsistent = find_inconsistencies(en_strings, lang_strings, groups)
+        propagated = 0
+        written = False
+
+        if apply:
+            updates = {
+                key: group.majority
+                for group in inconsistent if group.majority
+                for key, value in group.translations.items() if value != group.majority
+            }
+            if updates:
+                with open(lang_file, 'r', encoding='utf-8') as f:
+                    markers = read_markers(f.read())
+                for key, value in updates.items():
+                    lang_strings[key] = value
+                    markers[key] = HARMONIZED_MARKER
+                written = write_translation_file(lang_file, lang, lang_strings, markers,
+                                                 {'source': 'CONSISTENCY'}, backup=True)
+                save_base_snapshot(lang_file, lang_strings)
+                propagated = len(updates)
+
+        results[lang] = {'groups': inconsistent, 'propagated': propagated, 'written': written}
+
+    return results
+
+
+def generate_consistency_report(results: Dict[str, Dict], max_groups: int = 10) -> str:
+    """Génère le rapport de cohérence avec couleurs."""
+    lines = []
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append(f"{c.TITLE}COHÉRENCE DES TRADUCTIONS{c.RESET}")
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append("")
+
+    for lang, data in sorted(results.items()):
+        groups = data['groups']
+        if not groups:
+            lines.append(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.OK}[OK]{c.RESET}")
+            continue
+
+        lines.append(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.YELLOW}{len(groups)}{c.RESET} groupe(s) incohérent(s)")
+        for group in groups[:max_groups]:
+            lines.append(f"  {c.KEY}EN{c.RESET}: {group.en_text}")
+            for key, value in sorted(group.translations.items()):
+                flag = f"{c.GREEN}✓{c.RESET}" if value == group.majority else f"{c.YELLOW}≠{c.RESET}"
+                lines.append(f"    {flag} {c.DIM}{key}{c.RESET} = {value}")
+            if group.majority is None:
+                lines.append(f"    {c.DIM}(égalité : pas de traduction majoritaire){c.RESET}")
+        if len(groups) > max_groups:
+            lines.append(f"  {c.DIM}... et {len(groups) - max_groups} autres{c.RESET}")
+        if data['propagated']:
+            lines.append(f"  {c.GREEN}{data['propagated']}{c.RESET} clé(s) harmonisée(s)")
+        lines.append("")
+
+    total = sum(len(data['groups']) for data in results.values())
+    lines.append(f"{c.separator()}")
+    lines.append(f"  {c.KEY}Langues analysées   {c.RESET}: {c.WHITE}{len(results)}{c.RESET}")
+    lines.append(f"  {c.KEY}Groupes incohérents {c.RESET}: {c.YELLOW if total else c.GREEN}{total}{c.RESET}")
+
+    return "\n".join(lines)
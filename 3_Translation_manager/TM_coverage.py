@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+TM_coverage.py
+
+Module COVERAGE pour TranslationManager.
+Matrice de couverture par langue et par catégorie : clés traduites,
+identiques à l'EN, [NEW], [NEEDS_REVIEW] et manquantes.
+
+L'index est enregistré dans __i18n_tmp__/coverage.json et mis à jour de
+façon incrémentale :
+- SYNC et INJECT signalent les langues qu'ils viennent d'écrire
+- Les autres fichiers ne sont relus que si leur empreinte (taille, mtime)
+  a changé ; un changement du fichier EN invalide tout l'index
+
+Sorties : tableau terminal, CSV ou JSON (tableaux de bord).
+"""
+
+import os
+import io
+import csv
+import sys
+import json
+import hashlib
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from TM_common import find_languages, c
+from TM_parser import parse_lines, parse_translation_file
+from TM_writer import key_category, read_markers
+
+# Ajouter le répertoire parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fingerprint import compute_fingerprint, fingerprint_matches
+from common.paths import get_i18n_kit_path
+
+
+# Fichier d'index dans __i18n_tmp__
+COVERAGE_FILE = "coverage.json"
+COVERAGE_FORMAT = 1
+
+# Colonnes de la matrice ('new' et 'needs_review' comptent des marqueurs,
+# indépendamment de 'translated' / 'identical')
+COLUMNS = ('total', 'translated', 'identical', 'new', 'needs_review', 'missing')
+
+
+def language_coverage(en_strings: Dict[str, str], lang_strings: Dict[str, str],
+                      markers: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Compte les clés EN d'une langue par catégorie.
+
+    Returns:
+        {catégorie: {colonne: nombre}}
+    """
+    categories = defaultdict(lambda: dict.fromkeys(COLUMNS, 0))
+    for key, en_value in en_strings.items():
+        row = categories[key_category(key)]
+        row['total'] += 1
+        if key not in lang_strings:
+            row['missing'] += 1
+            continue
+        row['identical' if lang_strings[key] == en_value else 'translated'] += 1
+        marker = markers.get(key, '')
+        if '## NEW ##' in marker:
+            row['new'] += 1
+        elif '## NEEDS_REVIEW ##' in marker:
+            row['needs_review'] += 1
+    return dict(categories)
+
+
+def coverage_totals(categories: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    """Somme des catégories d'une langue."""
+    totals = dict.fromkeys(COLUMNS, 0)
+    for row in categories.values():
+        for column in COLUMNS:
+            totals[column] += row.get(column, 0)
+    return totals
+
+
+def _en_digest(en_strings: Dict[str, str]) -> str:
+    """Empreinte du contenu EN (indépendante de l'emplacement du fichier)."""
+    data = json.dumps(en_strings, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+def coverage_index_path(locales_dir: str) -> str:
+    """Chemin de l'index de couverture d'un répertoire de langues."""
+    return os.path.join(get_i18n_kit_path(os.path.abspath(locales_dir)), COVERAGE_FILE)
+
+
+def load_coverage_index(locales_dir: str) -> Dict:
+    """Charge l'index (vide s'il est absent, illisible ou d'un autre format)."""
+    try:
+        with open(coverage_index_path(locales_dir), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('format') == COVERAGE_FORMAT:
+            return index
+    except (OSError, ValueError):
+        pass
+    return {'format': COVERAGE_FORMAT, 'en_digest': None, 'languages': {}}
+
+
+def update_coverage(locales_dir: str, touched: List[str] = None,
+                    en_strings: Dict[str, str] = None,
+                    refresh: bool = False) -> Optional[Dict]:
+    """
+    Met à jour l'index de couverture et l'enregistre.
+
+    Args:
+        locales_dir: Répertoire des fichiers de langues
+        touched: Langues qui viennent d'être écrites (recalculées sans contrôle)
+        en_strings: Chaînes EN déjà chargées (défaut: TranslatedStrings_en.txt)
+        refresh: Tout recalculer
+
+    Returns:
+        Index à jour, ou None sans fichier EN
+    """
+    if en_strings is None:
+        en_file = os.path.join(locales_dir, 'TranslatedStrings_en.txt')
+        if not os.path.isfile(en_file):
+            return None
+        en_strings = parse_translation_file(en_file)
+
+    index = load_coverage_index(locales_dir)
+    digest = _en_digest(en_strings)
+    if refresh or index.get('en_digest') != digest:
+        index['languages'] = {}
+    index['en_digest'] = digest
+
+    touched = set(touched or [])
+    languages = find_languages(locales_dir, exclude_en=True)
+    entries = index['languages']
+
+    for lang in list(entries):
+        if lang not in languages:
+            del entries[lang]
+
+    for lang in languages:
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        entry = entries.get(lang)
+        if lang not in touched and entry and fingerprint_matches(lang_file, entry.get('fingerprint')):
+            continue
+
+        with open(lang_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        entries[lang] = {
+            'fingerprint': compute_fingerprint(lang_file),
+            'categories': language_coverage(
+                en_strings, parse_lines(content.splitlines()).strings, read_markers(content)
+            )
+        }
+
+    path = coverage_index_path(locales_dir)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1, sort_keys=True)
+    except OSError:
+        pass  # L'index sera reconstruit au prochain appel
+    return index
+
+
+# =============================================================================
+# RENDUS
+# =============================================================================
+
+def coverage_matrix(index: Dict, languages: List[str] = None) -> Dict[str, Dict]:
+    """
+    Matrice {langue: {'totals': {...}, 'categories': {...}}} (langues triées).
+    """
+    matrix = {}
+    for lang in sorted(index.get('languages', {})):
+        if languages and lang not in languages:
+            continue
+        categories = index['languages'][lang]['categories']
+        matrix[lang] = {
+            'totals': coverage_totals(categories),
+            'categories': {name: categories[name] for name in sorted(categories)}
+        }
+    return matrix
+
+
+def render_coverage_json(matrix: Dict[str, Dict]) -> str:
+    """Matrice au format JSON."""
+    return json.dumps(matrix, ensure_ascii=False, indent=2)
+
+
+def render_coverage_csv(matrix: Dict[str, Dict]) -> str:
+    """Matrice au format CSV (une ligne par langue et catégorie, '*' = total)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(('lang', 'category') + COLUMNS)
+    for lang, data in matrix.items():
+        writer.writerow((lang, '*') + tuple(data['totals'][col] for col in COLUMNS))
+        for category, row in data['categories'].items():
+            writer.writerow((lang, category) + tuple(row[col] for col in COLUMNS))
+    return buffer.getvalue()
+
+
+def _percent(part: int, total: int) -> str:
+    return f"{100 * part / total:5.1f}%" if total else "   - "
+
+
+def render_coverage_table(matrix: Dict[str, Dict], categories: bool = True) -> str:
+    """Matrice sous forme de tableau terminal (avec couleurs)."""
+    lines = []
+    lines.append(f"{c.HEADER}{'=' * 78}{c.RESET}")
+    lines.append(f"{c.TITLE}COUVERTURE DES TRADUCTIONS{c.RESET}")
+    lines.append(f"{c.HEADER}{'=' * 78}{c.RESET}")
+    lines.append("")
+    lines.append(f"  {c.KEY}{'Langue / catégorie':<26}{'Total':>7}{'Trad.':>7}{'%':>7}"
+                 f"{'= EN':>7}{'NEW':>6}{'REVIEW':>8}{'Manq.':>7}{c.RESET}")
+    lines.append(f"  {c.DIM}{'-' * 75}{c.RESET}")
+
+    def _row(label: str, row: Dict[str, int], color: str) -> str:
+        pct_color = c.GREEN if row['total'] and row['translated'] == row['total'] else c.YELLOW
+        return (f"  {color}{label:<26}{c.RESET}{row['total']:>7}{row['translated']:>7}"
+                f"{pct_color}{_percent(row['translated'], row['total']):>7}{c.RESET}"
+                f"{row['identical']:>7}{row['new']:>6}{row['needs_review']:>8}{row['missing']:>7}")
+
+    for lang, data in matrix.items():
+        lines.append(_row(lang.upper(), data['totals'], c.CYAN))
+        if categories:
+            for category, row in data['categories'].items():
+                lines.append(_row(f"  {category}"[:26], row, c.DIM))
+
+    if not matrix:
+        lines.append(f"  {c.DIM}(aucune langue){c.RESET}")
+    return "\n".join(lines)
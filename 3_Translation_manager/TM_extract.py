@@ -7,16 +7,153 @@ Génère les fichiers TRANSLATE_xx.txt pour faciliter la traduction.
 """
 
 import os
+import json
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-from TM_common import parse_translation_file, load_update_json, find_languages, c
+from TM_common import parse_translation_file, load_update_json, find_languages, key_category, c
+from TM_memory import open_memory
+
+
+# Version du format des manifestes TRANSLATE_xx.manifest.json
+MANIFEST_FORMAT = 1
 
 
 # =============================================================================
 # FONCTIONS PRINCIPALES
 # =============================================================================
 
+def collect_translate_entries(update_data: Dict, lang: str,
+                              existing_translations: Dict[str, str] = None,
+                              has_existing: bool = False) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Détermine les clés à traduire pour une langue.
+    
+    Returns:
+        (nouvelles clés {clé: EN}, clés modifiées {clé: {'old', 'new'}})
+    """
+    existing_translations = existing_translations or {}
+    
+    added_keys = dict(update_data.get('added', {}))
+    changed_keys = update_data.get('changed', {})
+    
+    # Clés renommées : à traduire seulement si l'ancienne clé n'était pas traduite
+    if has_existing:
+        for key, rename in update_data.get('renamed', {}).items():
+            if rename['from'] not in existing_translations:
+                added_keys[key] = rename['value']
+    
+    return added_keys, changed_keys
+
+
+def render_translate_file(update_data: Dict, lang: str,
+                          existing_translations: Dict[str, str] = None,
+                          has_existing: bool = False, source: str = '',
+                          keys: Set[str] = None, part: Tuple[int, int] = None) -> str:
+    """
+    Génère en mémoire le contenu d'un fichier TRANSLATE_xx.txt.
+    
+    Args:
+        update_data: Données UPDATE_en.json (chargées ou construites par COMPARE)
+        lang: Code langue cible
+        existing_translations: Traductions actuelles de la langue
+        has_existing: True si le fichier de langue existe (clés renommées)
+        source: Origine affichée dans l'entête (dossier UPDATE)
+        keys: Restreindre aux clés données (une partie d'un découpage)
+        part: (numéro, nombre de parties) affiché dans l'entête
+    
+    Returns:
+        Contenu complet du fichier
+    """
+    existing_translations = existing_translations or {}
+    
+    added_keys, changed_keys = collect_translate_entries(
+        update_data, lang, existing_translations, has_existing
+    )
+    if keys is not None:
+        added_keys = {k: v for k, v in added_keys.items() if k in keys}
+        changed_keys = {k: v for k, v in changed_keys.items() if k in keys}
+    
+    # Traductions déjà connues (mémoire de traduction) pour pré-remplir
+    known = {}
+    memory = open_memory()
+    if memory:
+        with memory:
+            en_texts = list(added_keys.values()) + [ch['new'] for ch in changed_keys.values()]
+            known = memory.lookup_many(en_texts, lang)
+    
+    out = []
+    out.append("# " + "=" * 70 + "\n")
+    out.append(f"# FICHIER DE TRADUCTION - {lang.upper()}\n")
+    out.append(f"# Généré: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    out.append(f"# Source: {source}\n")
+    if part:
+        categories = sorted({key_category(k) for k in list(added_keys) + list(changed_keys)})
+        out.append(f"# Partie: {part[0]}/{part[1]} ({', '.join(categories)})\n")
+    out.append("# " + "=" * 70 + "\n")
+    out.append("#\n")
+    out.append("# INSTRUCTIONS:\n")
+    out.append("# 1. Pour chaque entrée, écrivez la traduction après le symbole →\n")
+    out.append("# 2. Laissez vide pour garder la valeur EN par défaut\n")
+    out.append("# 3. Les lignes commençant par # sont ignorées\n")
+    out.append("#\n")
+    out.append("# " + "=" * 70 + "\n\n")
+    
+    # Section: Nouvelles clés
+    if added_keys:
+        out.append("# " + "-" * 70 + "\n")
+        out.append(f"# NOUVELLES CLÉS ({len(added_keys)})\n")
+        out.append("# " + "-" * 70 + "\n\n")
+        
+        for key in sorted(added_keys.keys()):
+            en_value = added_keys[key]
+            out.append(f"[KEY] {key}\n")
+            out.append(f"[EN]  {en_value}\n")
+            if en_value in known:
+                out.append("# Pré-rempli depuis la mémoire de traduction\n")
+            out.append(f"[{lang.upper()}] → {known.get(en_value, '')}\n")
+            out.append("\n")
+    
+    # Section: Clés modifiées
+    if changed_keys:
+        out.append("# " + "-" * 70 + "\n")
+        out.append(f"# CLÉS MODIFIÉES ({len(changed_keys)}) - Le texte EN a changé\n")
+        out.append("# " + "-" * 70 + "\n\n")
+        
+        for key in sorted(changed_keys.keys()):
+            change = changed_keys[key]
+            old_en = change['old']
+            new_en = change['new']
+            current_trans = existing_translations.get(key, '')
+            
+            out.append(f"[KEY] {key}\n")
+            out.append(f"[EN AVANT]  {old_en}\n")
+            out.append(f"[EN APRÈS]  {new_en}\n")
+            if current_trans and current_trans != old_en:
+                out.append(f"[{lang.upper()} ACTUEL] {current_trans}\n")
+            if new_en in known:
+                out.append("# Pré-rempli depuis la mémoire de traduction\n")
+            out.append(f"[{lang.upper()}] → {known.get(new_en, '')}\n")
+            out.append("\n")
+    
+    # Résumé
+    out.append("# " + "=" * 70 + "\n")
+    out.append(f"# TOTAL: {len(added_keys)} nouvelles + {len(changed_keys)} modifiées\n")
+    out.append("# " + "=" * 70 + "\n")
+    
+    return ''.join(out)
+
+
+def _load_existing(lang: str, locales_dir: str = None) -> Tuple[Dict[str, str], bool]:
+    """Charge les traductions existantes d'une langue (dict, fichier présent)."""
+    if locales_dir:
+        existing_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        if os.path.isfile(existing_file):
+            return parse_translation_file(existing_file), True
+    return {}, False
+
+
 def run_extract(update_dir: str, lang: str, locales_dir: str = None,
                 output_dir: str = None) -> str:
     """
@@ -37,11 +174,7 @@ def run_extract(update_dir: str, lang: str, locales_dir: str = None,
         raise FileNotFoundError(f"UPDATE_en.json non trouvé dans: {update_dir}")
     
     # Charger les traductions existantes si disponibles
-    existing_translations = {}
-    if locales_dir:
-        existing_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
-        if os.path.isfile(existing_file):
-            existing_translations = parse_translation_file(existing_file)
+    existing_translations, has_existing = _load_existing(lang, locales_dir)
     
     # Répertoire de sortie
     if not output_dir:
@@ -50,67 +183,131 @@ def run_extract(update_dir: str, lang: str, locales_dir: str = None,
     
     # Générer le fichier TRANSLATE
     output_file = os.path.join(output_dir, f'TRANSLATE_{lang}.txt')
-    
-    added_keys = update_data.get('added', {})
-    changed_keys = update_data.get('changed', {})
-    
+    content = render_translate_file(update_data, lang, existing_translations, has_existing,
+                                    source=update_dir)
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("# " + "=" * 70 + "\n")
-        f.write(f"# FICHIER DE TRADUCTION - {lang.upper()}\n")
-        f.write(f"# Généré: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"# Source: {update_dir}\n")
-        f.write("# " + "=" * 70 + "\n")
-        f.write("#\n")
-        f.write("# INSTRUCTIONS:\n")
-        f.write("# 1. Pour chaque entrée, écrivez la traduction après le symbole →\n")
-        f.write("# 2. Laissez vide pour garder la valeur EN par défaut\n")
-        f.write("# 3. Les lignes commençant par # sont ignorées\n")
-        f.write("#\n")
-        f.write("# " + "=" * 70 + "\n\n")
-        
-        # Section: Nouvelles clés
-        if added_keys:
-            f.write("# " + "-" * 70 + "\n")
-            f.write(f"# NOUVELLES CLÉS ({len(added_keys)})\n")
-            f.write("# " + "-" * 70 + "\n\n")
-            
-            for key in sorted(added_keys.keys()):
-                en_value = added_keys[key]
-                f.write(f"[KEY] {key}\n")
-                f.write(f"[EN]  {en_value}\n")
-                f.write(f"[{lang.upper()}] → \n")
-                f.write("\n")
-        
-        # Section: Clés modifiées
-        if changed_keys:
-            f.write("# " + "-" * 70 + "\n")
-            f.write(f"# CLÉS MODIFIÉES ({len(changed_keys)}) - Le texte EN a changé\n")
-            f.write("# " + "-" * 70 + "\n\n")
-            
-            for key in sorted(changed_keys.keys()):
-                change = changed_keys[key]
-                old_en = change['old']
-                new_en = change['new']
-                current_trans = existing_translations.get(key, '')
-                
-                f.write(f"[KEY] {key}\n")
-                f.write(f"[EN AVANT]  {old_en}\n")
-                f.write(f"[EN APRÈS]  {new_en}\n")
-                if current_trans and current_trans != old_en:
-                    f.write(f"[{lang.upper()} ACTUEL] {current_trans}\n")
-                f.write(f"[{lang.upper()}] → \n")
-                f.write("\n")
-        
-        # Résumé
-        f.write("# " + "=" * 70 + "\n")
-        f.write(f"# TOTAL: {len(added_keys)} nouvelles + {len(changed_keys)} modifiées\n")
-        f.write("# " + "=" * 70 + "\n")
+        f.write(content)
     
     return output_file
 
 
+def plan_chunks(weights: Dict[str, int], chunks: int) -> List[List[str]]:
+    """
+    Répartit des catégories en parties de poids équilibré.
+    
+    Glouton : les catégories, de la plus lourde à la plus légère, vont dans la
+    partie la moins chargée. Une catégorie n'est jamais coupée.
+    
+    Args:
+        weights: {catégorie: nombre de caractères à traduire}
+        chunks: Nombre de parties souhaité (réduit s'il y a moins de catégories)
+    
+    Returns:
+        Liste des parties (catégories triées), sans partie vide
+    """
+    chunks = max(1, min(chunks, len(weights)))
+    heap = [(0, index) for index in range(chunks)]
+    parts = [[] for _ in range(chunks)]
+    
+    for category in sorted(weights, key=lambda cat: (-weights[cat], cat)):
+        load, index = heapq.heappop(heap)
+        parts[index].append(category)
+        heapq.heappush(heap, (load + weights[category], index))
+    
+    # Ordre stable : parties triées par leur première catégorie
+    return sorted((sorted(part) for part in parts if part), key=lambda part: part[0])
+
+
+def run_extract_chunks(update_dir: str, lang: str, locales_dir: str = None,
+                       output_dir: str = None, chunks: int = None,
+                       chunk_size: int = None) -> List[str]:
+    """
+    Génère TRANSLATE_xx.txt découpé en parties pour plusieurs traducteurs.
+    
+    Chaque partie (TRANSLATE_xx.partNN.txt) regroupe des catégories entières,
+    équilibrées par nombre de caractères EN. Le manifeste
+    TRANSLATE_xx.manifest.json décrit les clés de chaque partie ; INJECT
+    accepte ensuite n'importe quel sous-ensemble des parties, dans n'importe
+    quel ordre.
+    
+    Args:
+        update_dir: Répertoire contenant UPDATE_en.json
+        lang: Code langue cible
+        locales_dir: Répertoire des fichiers de langues existants
+        output_dir: Répertoire de sortie (défaut: update_dir)
+        chunks: Nombre de parties
+        chunk_size: Taille cible d'une partie (caractères EN), si chunks n'est pas donné
+    
+    Returns:
+        Chemins des parties générées (suivis du manifeste)
+    """
+    update_data = load_update_json(update_dir)
+    if not update_data:
+        raise FileNotFoundError(f"UPDATE_en.json non trouvé dans: {update_dir}")
+    
+    existing_translations, has_existing = _load_existing(lang, locales_dir)
+    
+    if not output_dir:
+        output_dir = update_dir
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Poids par catégorie : longueur du texte EN à traduire
+    added_keys, changed_keys = collect_translate_entries(
+        update_data, lang, existing_translations, has_existing
+    )
+    texts = dict(added_keys)
+    texts.update({key: change['new'] for key, change in changed_keys.items()})
+    
+    keys_by_category = {}
+    weights = {}
+    for key, text in texts.items():
+        category = key_category(key)
+        keys_by_category.setdefault(category, []).append(key)
+        weights[category] = weights.get(category, 0) + max(1, len(text))
+    
+    if not chunks:
+        total = sum(weights.values())
+        chunks = -(-total // chunk_size) if chunk_size else 1
+    plan = plan_chunks(weights, chunks) if weights else [[]]
+    
+    generated = []
+    manifest_parts = []
+    for number, categories in enumerate(plan, 1):
+        keys = sorted(key for cat in categories for key in keys_by_category[cat])
+        file_name = f'TRANSLATE_{lang}.part{number:02d}.txt'
+        content = render_translate_file(update_data, lang, existing_translations, has_existing,
+                                        source=update_dir, keys=set(keys),
+                                        part=(number, len(plan)))
+        output_file = os.path.join(output_dir, file_name)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        generated.append(output_file)
+        manifest_parts.append({
+            'part': number,
+            'file': file_name,
+            'categories': categories,
+            'chars': sum(weights[cat] for cat in categories),
+            'keys': keys
+        })
+    
+    manifest = {
+        'format': MANIFEST_FORMAT,
+        'lang': lang,
+        'generated': datetime.now().isoformat(),
+        'source': update_dir,
+        'parts': manifest_parts
+    }
+    manifest_file = os.path.join(output_dir, f'TRANSLATE_{lang}.manifest.json')
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    generated.append(manifest_file)
+    
+    return generated
+
+
 def run_extract_all(update_dir: str, locales_dir: str = None,
-                    output_dir: str = None) -> List[str]:
+                    output_dir: str = None, chunks: int = None,
+                    chunk_size: int = None) -> List[str]:
     """
     Génère les fichiers TRANSLATE pour toutes les langues détectées.
     
@@ -118,6 +315,8 @@ def run_extract_all(update_dir: str, locales_dir: str = None,
         update_dir: Répertoire contenant UPDATE_en.json
         locales_dir: Répertoire des fichiers de langues existants
         output_dir: Répertoire de sortie
+        chunks: Découper chaque langue en N parties (voir run_extract_chunks)
+        chunk_size: Ou découper par taille de partie (caractères EN)
     
     Returns:
         Liste des fichiers générés
@@ -135,8 +334,12 @@ def run_extract_all(update_dir: str, locales_dir: str = None,
     generated_files = []
     for lang in sorted(languages):
         try:
-            output_file = run_extract(update_dir, lang, locales_dir, output_dir)
-            generated_files.append(output_file)
+            if chunks or chunk_size:
+                generated_files.extend(run_extract_chunks(update_dir, lang, locales_dir, output_dir,
+                                                          chunks, chunk_size))
+            else:
+                output_file = run_extract(update_dir, lang, locales_dir, output_dir)
+                generated_files.append(output_file)
         except Exception as e:
             print(f"  ⚠️  Erreur pour {lang}: {e}")
     
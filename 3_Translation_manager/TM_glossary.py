@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+TM_glossary.py
+
+Module CHECK (glossaire) pour TranslationManager.
+Vérifie que les termes du glossaire sont traduits de façon cohérente dans
+toutes les langues.
+
+Format du glossaire (JSON) :
+    {
+      "Piwigo": {"*": "Piwigo"},
+      "album": {"fr": "album", "de": {"required": ["Album"], "forbidden": ["Fotoalbum"]}},
+      "publish service": {"fr": {"required": "service de publication"}}
+    }
+
+- "*" s'applique à toutes les langues (ex: nom de marque à ne pas traduire)
+- required : la traduction doit contenir l'une de ces formes
+- forbidden : la traduction ne doit contenir aucune de ces formes
+
+Tous les termes sont compilés dans un automate Aho-Corasick (un pour l'EN,
+un par langue pour les formes cibles) : chaque texte n'est parcouru qu'une
+fois, quel que soit le nombre de termes.
+"""
+
+import os
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from TM_common import parse_translation_file, resolve_path, find_languages, c
+
+
+# =============================================================================
+# AUTOMATE MULTI-MOTIFS
+# =============================================================================
+
+class AhoCorasick:
+    """
+    Recherche simultanée de plusieurs motifs (insensible à la casse).
+
+    Seules les occurrences de mots entiers sont retenues ("album" ne
+    correspond pas dans "albums" ni dans "photoalbum").
+
+    Usage:
+        matcher = AhoCorasick(["album", "publish service"])
+        matcher.find("Publish service for this album")  # {0, 1}
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = [p.lower() for p in patterns]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(index)
+
+        # Liens d'échec (parcours en largeur ; les fils de la racine échouent vers elle)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def find(self, text: str) -> Set[int]:
+        """Indices des motifs présents (mots entiers) dans le texte."""
+        found = set()
+        if not self.patterns:
+            return found
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in out[state]:
+                start = position - len(self.patterns[index]) + 1
+                if _is_boundary(text, start - 1) and _is_boundary(text, position + 1):
+                    found.add(index)
+        return found
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+# =============================================================================
+# GLOSSAIRE
+# =============================================================================
+
+@dataclass
+class TermRule:
+    """Règle d'un terme pour une langue."""
+    required: List[str] = field(default_factory=list)
+    forbidden: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Violation:
+    """Terme du glossaire mal traduit."""
+    lang: str
+    key: str
+    term: str
+    kind: str                    # 'missing' ou 'forbidden'
+    expected: List[str]
+    found: Optional[str] = None  # Forme interdite trouvée
+    text: str = ''
+
+
+class Glossary:
+    """Glossaire EN → traductions imposées / interdites par langue."""
+
+    def __init__(self, terms: Dict[str, Dict[str, TermRule]]):
+        self.terms = list(terms)
+        self.rules = terms
+        self.en_matcher = AhoCorasick(self.terms)
+        self._target_matchers: Dict[str, Tuple[AhoCorasick, List[str]]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'Glossary':
+        """Charge un glossaire JSON (voir le format en tête de module)."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        terms = {}
+        for term, by_lang in data.items():
+            terms[term] = {}
+            for lang, rule in by_lang.items():
+                if isinstance(rule, str):
+                    rule = {'required': [rule]}
+                terms[term][lang] = TermRule(
+                    required=_as_list(rule.get('required')),
+                    forbidden=_as_list(rule.get('forbidden'))
+                )
+        return cls(terms)
+
+    def rule(self, term: str, lang: str) -> Optional[TermRule]:
+        by_lang = self.rules[term]
+        return by_lang.get(lang) or by_lang.get('*')
+
+    def _target_matcher(self, lang: str) -> Tuple[AhoCorasick, List[str]]:
+        """Automate des formes cibles (imposées + interdites) d'une langue."""
+        if lang not in self._target_matchers:
+            forms = sorted({
+                form for term in self.terms if self.rule(term, lang)
+                for form in self.rule(term, lang).required + self.rule(term, lang).forbidden
+            })
+            self._target_matchers[lang] = (AhoCorasick(forms), forms)
+        return self._target_matchers[lang]
+
+    def check(self, lang: str, en_strings: Dict[str, str],
+              lang_strings: Dict[str, str]) -> List[Violation]:
+        """
+        Vérifie une langue : un passage par texte EN et par texte traduit.
+
+        Les clés non traduites (valeur identique au texte EN) sont ignorées.
+        """
+        matcher, forms = self._target_matcher(lang)
+        violations = []
+
+        for key in sorted(en_strings.keys() & lang_strings.keys()):
+            en_text = en_strings[key]
+            target = lang_strings[key]
+            if not target or target == en_text:
+                continue
+
+            terms = self.en_matcher.find(en_text)
+            if not terms:
+                continue
+            present = {forms[index].lower() for index in matcher.find(target)}
+
+            for term_index in sorted(terms):
+                term = self.terms[term_index]
+                rule = self.rule(term, lang)
+                if not rule:
+                    continue
+                if rule.required and not any(form.lower() in present for form in rule.required):
+                    violations.append(Violation(lang, key, term, 'missing', rule.required,
+                                                text=target))
+                for form in rule.forbidden:
+                    if form.lower() in present:
+                        violations.append(Violation(lang, key, term, 'forbidden', rule.required,
+                                                    found=form, text=target))
+
+        return violations
+
+
+def _as_list(value) -> List[str]:
+    if not value:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+# =============================================================================
+# FONCTIONS PRINCIPALES
+# =============================================================================
+
+def run_check(glossary_path: str, reference_path: str, locales_dir: str = None,
+              languages: List[str] = None) -> Dict[str, List[Violation]]:
+    """
+    Vérifie le glossaire sur toutes les langues.
+
+    Args:
+        glossary_path: Fichier glossaire JSON
+        reference_path: Fichier EN de référence (ou répertoire)
+        locales_dir: Répertoire des fichiers de langues (défaut: celui du EN)
+        languages: Langues à vérifier (défaut: toutes)
+
+    Returns:
+        {langue: [violations]}
+    """
+    glossary = Glossary.load(glossary_path)
+    ref_dir, ref_file = resolve_path(reference_path)
+    locales_dir = locales_dir or ref_dir
+    en_strings = parse_translation_file(ref_file)
+
+    results = {}
+    for lang in languages or find_languages(locales_dir, exclude_en=True):
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        if os.path.isfile(lang_file):
+            results[lang] = glossary.check(lang, en_strings, parse_translation_file(lang_file))
+    return results
+
+
+def generate_check_report(results: Dict[str, List[Violation]]) -> str:
+    """Génère le rapport de vérification du glossaire avec couleurs."""
+    lines = []
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append(f"{c.TITLE}VÉRIFICATION DU GLOSSAIRE{c.RESET}")
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append("")
+
+    for lang, violations in sorted(results.items()):
+        if not violations:
+            lines.append(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.OK}[OK]{c.RESET}")
+            continue
+
+        lines.append(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.YELLOW}{len(violations)}{c.RESET} problème(s)")
+        for v in violations:
+            if v.kind == 'missing':
+                detail = f"« {v.term} » → attendu: {' / '.join(v.expected)}"
+            else:
+                detail = f"« {v.term} » → forme interdite: {v.found}"
+            lines.append(f"  {c.YELLOW}!{c.RESET} {c.DIM}{v.key}{c.RESET}")
+            lines.append(f"      {detail}")
+            lines.append(f"      {c.DIM}{v.text}{c.RESET}")
+        lines.append("")
+
+    total = sum(len(v) for v in results.values())
+    lines.append(f"{c.separator()}")
+    lines.append(f"  {c.KEY}Langues vérifiées{c.RESET}: {c.WHITE}{len(results)}{c.RESET}")
+    lines.append(f"  {c.KEY}Problèmes        {c.RESET}: {c.YELLOW if total else c.GREEN}{total}{c.RESET}")
+
+    return "\n".join(lines)
@@ -6,23 +6,57 @@ Module INJECT pour TranslationManager.
 Réinjecte les traductions depuis TRANSLATE_xx.txt dans les fichiers de langue.
 
 IMPORTANT: Les clés non traduites (→ vide) reçoivent la valeur EN par défaut.
+
+Les placeholders de chaque traduction sont comparés à ceux de l'EN (signatures
+EN calculées une fois pour toutes les langues) :
+- Placeholders manquants ou en trop : traduction rejetée, clé [NEEDS_REVIEW]
+- Mêmes placeholders dans un autre ordre : traduction injectée, clé [NEEDS_REVIEW]
 """
 
 import os
-import shutil
+import re
+import json
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from TM_common import (
     parse_translation_file, write_translation_file,
-    load_update_json, find_languages, c
+    load_update_json, find_languages,
+    PLACEHOLDER_MARKER, PLACEHOLDER_REJECTED_MARKER, c
+)
+from TM_memory import open_memory
+from TM_merge import (
+    three_way_merge, next_base, load_base_snapshot, save_base_snapshot,
+    write_conflicts, conflict_markers
 )
+from TM_coverage import update_coverage
+from common.placeholders import placeholder_signatures, find_placeholder_issues
+
+
+# TRANSLATE_xx.txt ou partie TRANSLATE_xx.partNN.txt (EXTRACT --chunks)
+TRANSLATE_FILE_RE = re.compile(r'^TRANSLATE_(.+?)(?:\.part(\d+))?\.txt$')
 
 
 # =============================================================================
 # PARSER TRANSLATE
 # =============================================================================
 
+def update_en_values(update_data: Optional[Dict]) -> Dict[str, str]:
+    """Valeurs EN actuelles des clés ajoutées, modifiées et renommées."""
+    en_values = {}
+    if update_data:
+        # Clés ajoutées
+        for key, value in update_data.get('added', {}).items():
+            en_values[key] = value
+        # Clés modifiées (nouvelle valeur EN)
+        for key, change in update_data.get('changed', {}).items():
+            en_values[key] = change.get('new', '')
+        # Clés renommées (valeur EN inchangée)
+        for key, rename in update_data.get('renamed', {}).items():
+            en_values[key] = rename.get('value', '')
+    return en_values
+
+
 def parse_translate_file(file_path: str, update_data: Dict = None) -> Dict[str, str]:
     """
     Parse un fichier TRANSLATE_xx.txt et extrait les traductions.
@@ -43,14 +77,7 @@ def parse_translate_file(file_path: str, update_data: Dict = None) -> Dict[str,
     current_en_value = None
     
     # Préparer les valeurs EN depuis update_data
-    en_values = {}
-    if update_data:
-        # Clés ajoutées
-        for key, value in update_data.get('added', {}).items():
-            en_values[key] = value
-        # Clés modifiées (nouvelle valeur EN)
-        for key, change in update_data.get('changed', {}).items():
-            en_values[key] = change.get('new', '')
+    en_values = update_en_values(update_data)
     
     with open(file_path, 'r', encoding='utf-8') as f:
         for line in f:
@@ -121,39 +148,110 @@ def run_inject(translate_file: str, target_file: str,
     # Parser le fichier de traduction
     new_translations = parse_translate_file(translate_file, update_data)
     
-    if not new_translations:
+    stats = _inject_translations(new_translations, target_file, update_data,
+                                 os.path.basename(translate_file), create_backup)
+    if stats.get('written'):
+        lang = os.path.basename(target_file).replace('TranslatedStrings_', '').replace('.txt', '')
+        update_coverage(os.path.dirname(os.path.abspath(target_file)), [lang])
+    return stats
+
+
+def _inject_translations(new_translations: Dict[str, str], target_file: str,
+                         update_data: Optional[Dict], source: str,
+                         create_backup: bool = True,
+                         en_signatures: Dict[str, Tuple[str, ...]] = None) -> Dict:
+    """
+    Fusionne des traductions parsées dans un fichier de langue.
+    
+    Args:
+        new_translations: {clé: traduction} (un fichier TRANSLATE ou plusieurs parties)
+        target_file: Fichier TranslatedStrings_xx.txt cible
+        update_data: Données UPDATE_en.json (valeurs EN, clés renommées)
+        source: Fichier(s) d'origine, pour l'entête et les conflits
+        create_backup: Créer une sauvegarde .bak
+        en_signatures: Signatures des placeholders EN (partagées entre langues)
+    
+    Returns:
+        Statistiques d'injection
+    """
+    if not new_translations and not (update_data or {}).get('renamed'):
         return {'injected': 0, 'from_en': 0, 'skipped': 0, 'total': 0}
     
-    # Charger le fichier cible existant
+    # Charger le fichier cible existant (modifications directes éventuelles)
     if os.path.isfile(target_file):
         existing = parse_translation_file(target_file)
-        if create_backup:
-            shutil.copy2(target_file, target_file + '.bak')
     else:
         existing = {}
     
+    # Base de fusion : dernier état écrit par SYNC/INJECT
+    # (sans base connue, les traductions s'appliquent directement au fichier)
+    base = load_base_snapshot(target_file)
+    if base is None:
+        base = dict(existing)
+    
     # Fusionner
-    stats = {'injected': 0, 'from_en': 0, 'skipped': 0}
+    stats = {'injected': 0, 'from_en': 0, 'skipped': 0, 'renamed': 0}
     
-    # Récupérer les valeurs EN pour comparaison
-    en_values = {}
+    # Clés renommées (COMPARE) : déplacer la traduction existante vers la nouvelle clé
     if update_data:
-        for key, value in update_data.get('added', {}).items():
-            en_values[key] = value
-        for key, change in update_data.get('changed', {}).items():
-            en_values[key] = change.get('new', '')
+        for new_key, rename in update_data.get('renamed', {}).items():
+            old_key = rename['from']
+            if old_key in existing and new_key not in existing:
+                existing[new_key] = existing.pop(old_key)
+                stats['renamed'] += 1
+            if old_key in base and new_key not in base:
+                base[new_key] = base.pop(old_key)
+    
+    # Récupérer les valeurs EN pour comparaison
+    en_values = update_en_values(update_data)
+    if en_signatures is None:
+        en_signatures = placeholder_signatures(en_values)
+    
+    # Placeholders : tout le lot est contrôlé en une passe
+    issues = find_placeholder_issues(en_signatures, new_translations)
+    placeholder_markers = {}
+    stats['placeholder_rejected'] = 0
+    stats['placeholder_flagged'] = 0
     
+    # Valeurs entrantes : la base + les traductions du fichier TRANSLATE
+    incoming = dict(base)
+    accepted = set()
     for key, translation in new_translations.items():
         if translation:
+            issue = issues.get(key)
+            if issue and issue.blocking:
+                # Rejet : la clé garde sa valeur (EN par défaut si elle est nouvelle)
+                placeholder_markers[key] = PLACEHOLDER_REJECTED_MARKER.format(
+                    detail=issue.describe(), text=translation)
+                stats['placeholder_rejected'] += 1
+                if key not in incoming and key in en_values:
+                    incoming[key] = en_values[key]
+                continue
+            if issue:
+                placeholder_markers[key] = PLACEHOLDER_MARKER.format(detail=issue.describe())
+                stats['placeholder_flagged'] += 1
             # Vérifier si c'est la valeur EN ou une vraie traduction
             if key in en_values and translation == en_values[key]:
                 stats['from_en'] += 1
+                # La valeur EN par défaut ne remplace pas une modification directe
+                if key in existing and existing[key] != base.get(key):
+                    continue
             else:
                 stats['injected'] += 1
-            existing[key] = translation
+            incoming[key] = translation
+            if not issue:
+                accepted.add(key)
         else:
             stats['skipped'] += 1
     
+    # Fusion à trois voies : base / fichier actuel / TRANSLATE
+    merge = three_way_merge(base, existing, incoming)
+    existing = merge.merged
+    stats['conflicts'] = len(merge.conflicts)
+    stats['kept_local'] = len(merge.kept_local)
+    stats['conflicts_file'] = write_conflicts(target_file, merge.conflicts,
+                                              f"INJECT {source}")
+    
     stats['total'] = len(existing)
     
     # Détecter la langue depuis le nom du fichier
@@ -162,14 +260,31 @@ def run_inject(translate_file: str, target_file: str,
     if 'TranslatedStrings_' in basename:
         lang = basename.replace('TranslatedStrings_', '').replace('.txt', '')
     
+    # Alimenter la mémoire de traduction : clés de ce fichier TRANSLATE dont le
+    # texte EN est connu, injectées sans écart et retenues telles quelles par la fusion
+    kept_local = set(merge.kept_local)
+    memory = open_memory()
+    if memory:
+        with memory:
+            memory.store_many(lang, (
+                (en_values[key], existing[key], key)
+                for key in accepted
+                if key in en_values and existing.get(key) == new_translations[key]
+                and key not in kept_local and key not in merge.conflicts
+            ))
+    
     # Métadonnées pour l'entête
     metadata = {
         'new_keys': stats['injected'] + stats['from_en'],
-        'source': os.path.basename(translate_file)
+        'source': source
     }
     
-    # Écrire le fichier mis à jour
-    write_translation_file(target_file, lang, existing, metadata=metadata)
+    # Écrire le fichier mis à jour (backup .bak seulement s'il change)
+    markers = {key: marker for key, marker in placeholder_markers.items() if key in existing}
+    markers.update(conflict_markers(target_file, merge.conflicts))
+    stats['written'] = write_translation_file(target_file, lang, existing, markers,
+                                              metadata, backup=create_backup)
+    save_base_snapshot(target_file, next_base(existing, merge.conflicts))
     
     return stats
 
@@ -180,6 +295,11 @@ def run_inject_from_dir(translate_dir: str, locales_dir: str,
     """
     Injecte tous les fichiers TRANSLATE_*.txt dans les fichiers de langue.
     
+    Les parties d'un découpage (TRANSLATE_xx.partNN.txt, voir EXTRACT --chunks)
+    sont regroupées par langue et injectées en une seule écriture. N'importe
+    quel sous-ensemble des parties peut être fourni, dans n'importe quel
+    ordre ; réinjecter une partie déjà injectée ne change rien.
+    
     Args:
         translate_dir: Répertoire contenant les fichiers TRANSLATE_*.txt
         locales_dir: Répertoire des fichiers TranslatedStrings_*.txt
@@ -192,25 +312,58 @@ def run_inject_from_dir(translate_dir: str, locales_dir: str,
     if not update_dir:
         update_dir = translate_dir
     
+    # Trouver tous les fichiers TRANSLATE_*.txt, groupés par langue
+    files_by_lang = {}
+    for file in sorted(os.listdir(translate_dir)):
+        match = TRANSLATE_FILE_RE.match(file)
+        if match:
+            files_by_lang.setdefault(match.group(1), []).append(file)
+    
+    if not files_by_lang:
+        return {}
+    
+    update_data = load_update_json(update_dir)
+    en_signatures = placeholder_signatures(update_en_values(update_data))
     results = {}
     
-    # Trouver tous les fichiers TRANSLATE_*.txt
-    for file in os.listdir(translate_dir):
-        if file.startswith('TRANSLATE_') and file.endswith('.txt'):
-            lang = file.replace('TRANSLATE_', '').replace('.txt', '')
+    for lang, files in sorted(files_by_lang.items()):
+        target_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        
+        try:
+            new_translations = {}
+            for file in files:
+                new_translations.update(
+                    parse_translate_file(os.path.join(translate_dir, file), update_data)
+                )
+            stats = _inject_translations(new_translations, target_file, update_data,
+                                         ', '.join(files), create_backup, en_signatures)
             
-            translate_file = os.path.join(translate_dir, file)
-            target_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+            # Parties reçues / attendues (manifeste EXTRACT --chunks)
+            parts = [int(m.group(2)) for m in map(TRANSLATE_FILE_RE.match, files) if m.group(2)]
+            manifest = load_translate_manifest(translate_dir, lang)
+            if parts or manifest:
+                stats['parts'] = sorted(parts)
+                stats['parts_total'] = len(manifest['parts']) if manifest else len(parts)
             
-            try:
-                stats = run_inject(translate_file, target_file, update_dir, create_backup)
-                results[lang] = stats
-            except Exception as e:
-                results[lang] = {'error': str(e)}
+            results[lang] = stats
+        except Exception as e:
+            results[lang] = {'error': str(e)}
+    
+    update_coverage(locales_dir, [lang for lang, stats in results.items() if stats.get('written')])
     
     return results
 
 
+def load_translate_manifest(translate_dir: str, lang: str) -> Optional[Dict]:
+    """Charge TRANSLATE_xx.manifest.json (None si absent ou illisible)."""
+    manifest_file = os.path.join(translate_dir, f'TRANSLATE_{lang}.manifest.json')
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 # =============================================================================
 # MENU INTERACTIF
 # =============================================================================
@@ -265,6 +418,11 @@ def menu_inject(plugin_path: str = ""):
             print(f"  {c.KEY}Valeurs EN par défaut  {c.RESET}: {c.CYAN}{stats['from_en']}{c.RESET}")
             print(f"  {c.KEY}Entrées ignorées       {c.RESET}: {c.DIM}{stats['skipped']}{c.RESET}")
             print(f"  {c.KEY}Total clés dans fichier{c.RESET}: {c.WHITE}{stats['total']}{c.RESET}")
+            if stats.get('conflicts'):
+                print(f"  {c.KEY}Conflits               {c.RESET}: {c.YELLOW}{stats['conflicts']}{c.RESET}  {c.DIM}{stats['conflicts_file']}{c.RESET}")
+            if stats.get('placeholder_rejected') or stats.get('placeholder_flagged'):
+                print(f"  {c.KEY}Placeholders rejetés  {c.RESET}: {c.YELLOW}{stats['placeholder_rejected']}{c.RESET}  {c.DIM}[NEEDS_REVIEW]{c.RESET}")
+                print(f"  {c.KEY}Placeholders déplacés {c.RESET}: {c.YELLOW}{stats['placeholder_flagged']}{c.RESET}  {c.DIM}[NEEDS_REVIEW]{c.RESET}")
             print()
             print(c.success(f"Fichier mis à jour: {c.VALUE}{target_file}{c.RESET}"))
             print(f"{c.DIM}  (Backup .bak créé){c.RESET}")
@@ -308,6 +466,11 @@ def menu_inject(plugin_path: str = ""):
                         translated = stats['injected']
                         from_en = stats['from_en']
                         print(f"  {c.CYAN}[{lang.upper()}]{c.RESET} {c.OK}[OK]{c.RESET} {c.GREEN}{translated}{c.RESET} traduites + {c.CYAN}{from_en}{c.RESET} EN par défaut")
+                        if stats.get('conflicts'):
+                            print(f"       {c.WARNING}[ATTENTION]{c.RESET} {stats['conflicts']} conflit(s) : {c.DIM}{stats['conflicts_file']}{c.RESET}")
+                        if stats.get('placeholder_rejected') or stats.get('placeholder_flagged'):
+                            print(f"       {c.WARNING}[ATTENTION]{c.RESET} placeholders : {stats['placeholder_rejected']} rejetée(s), "
+                                  f"{stats['placeholder_flagged']} ordre différent {c.DIM}[NEEDS_REVIEW]{c.RESET}")
                 print()
                 print(c.success("Fichiers mis à jour (backups .bak créés)"))
 
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+TM_jobs.py
+
+Mode JOB pour TranslationManager (--job fichier.json).
+Exécute une suite d'opérations sans aucune interaction, dans un seul
+processus (cache de parsing et mémoire de traduction partagés entre les
+étapes), et produit un résultat JSON structuré : statistiques, durées et
+fichiers générés par étape.
+
+Format du fichier job :
+
+    {
+      "memory": "~/.lightroom_i18n/translation_memory.sqlite",   (null = désactivée)
+      "stop_on_error": true,
+      "defaults": {"jobs": 4},
+      "steps": [
+        {"command": "compare", "old": "v1/en.txt", "new": "v2/en.txt", "plugin_path": "a.lrplugin"},
+        {"command": "sync", "plugin_path": "a.lrplugin", "locales": "a.lrplugin"},
+        {"command": "coverage", "locales": "a.lrplugin", "format": "csv", "output": "coverage.csv"}
+      ]
+    }
+
+Les paramètres d'une étape reprennent les options CLI de la commande
+(--plugin-path → "plugin_path", --from → "from"). Les valeurs de "defaults"
+s'appliquent aux étapes qui acceptent le paramètre. Pendant l'exécution, les
+messages des modules sont redirigés vers stderr : stdout ne reçoit que le JSON.
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, is_dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from TM_common import enable_parse_cache, load_update_json, resolve_path
+from TM_memory import set_memory_path, DEFAULT_MEMORY_PATH
+from TM_compare import run_compare, run_compare_snapshots
+from TM_extract import run_extract, run_extract_chunks, run_extract_all
+from TM_inject import run_inject, run_inject_from_dir
+from TM_sync import run_sync
+from TM_pipeline import run_pipeline
+from TM_pretranslate import run_pretranslate, create_backend, DEFAULT_MT_CACHE_PATH
+from TM_glossary import run_check
+from TM_consistency import run_consistency
+from TM_prune import run_prune
+from TM_coverage import (
+    update_coverage, coverage_matrix, render_coverage_table, render_coverage_csv, render_coverage_json
+)
+from TM_workspace import run_workspace_sync, plugin_names
+from TM_pseudo import run_pseudo, parse_expansion, DEFAULT_EXPANSION
+from common.paths import get_tool_output_path, find_latest_tool_output
+
+
+# Version du format de résultat
+JOB_RESULT_FORMAT = 1
+
+
+def _languages(value) -> Optional[List[str]]:
+    """Langues d'une étape : liste JSON ou chaîne séparée par des virgules."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return [lang.strip() for lang in value.split(',') if lang.strip()]
+    return list(value)
+
+
+def _update_dir(params: Dict) -> Optional[str]:
+    """Dossier UPDATE : explicite, ou dernier dossier TranslationManager du plugin."""
+    if params.get('update'):
+        return params['update']
+    if params.get('plugin_path'):
+        return find_latest_tool_output(params['plugin_path'], "TranslationManager")
+    return None
+
+
+def _output_dir(params: Dict) -> Optional[str]:
+    if params.get('output'):
+        return params['output']
+    if params.get('plugin_path'):
+        return get_tool_output_path(params['plugin_path'], "TranslationManager", create=True)
+    return None
+
+
+def _lang_file(locales_dir: str, lang: str) -> str:
+    return os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+
+
+# =============================================================================
+# ÉTAPES : (paramètres) → (résultat, fichiers générés)
+# =============================================================================
+
+def _step_compare(params: Dict) -> Tuple[Dict, List[str]]:
+    output_dir = _output_dir(params)
+    if params.get('from'):
+        if not params.get('plugin_path'):
+            raise ValueError("'from' requiert 'plugin_path'")
+        output_dir = run_compare_snapshots(params['plugin_path'], params['from'],
+                                           params.get('to') or 'latest', output_dir,
+                                           compress=params.get('gzip', False))
+    elif params.get('old') and params.get('new'):
+        output_dir = run_compare(params['old'], params['new'], output_dir,
+                                 compress=params.get('gzip', False),
+                                 plugin_path=params.get('plugin_path'))
+    else:
+        raise ValueError("'old' et 'new' (ou 'from' avec 'plugin_path') requis")
+    return load_update_json(output_dir)['summary'], [output_dir]
+
+
+def _step_extract(params: Dict) -> Tuple[Dict, List[str]]:
+    update_dir = _update_dir(params)
+    if not update_dir:
+        raise ValueError("'update' ou 'plugin_path' (après COMPARE) requis")
+    chunks, chunk_size = params.get('chunks'), params.get('chunk_size')
+    if params.get('lang') and not (chunks or chunk_size):
+        generated = [run_extract(update_dir, params['lang'], params.get('locales'), params.get('output'))]
+    elif params.get('lang'):
+        generated = run_extract_chunks(update_dir, params['lang'], params.get('locales'),
+                                       params.get('output'), chunks, chunk_size)
+    else:
+        generated = run_extract_all(update_dir, params.get('locales'), params.get('output'),
+                                    chunks, chunk_size)
+    return {'update_dir': update_dir, 'files': len(generated)}, generated
+
+
+def _step_inject(params: Dict) -> Tuple[Dict, List[str]]:
+    translate_dir = params.get('translate_dir')
+    update_dir = params.get('update')
+    if not translate_dir and params.get('plugin_path'):
+        translate_dir = find_latest_tool_output(params['plugin_path'], "TranslationManager")
+        update_dir = update_dir or translate_dir
+
+    if params.get('translate') and params.get('target'):
+        stats = run_inject(params['translate'], params['target'], update_dir)
+        return stats, [params['target']] if stats.get('written') else []
+    if translate_dir and params.get('locales'):
+        results = run_inject_from_dir(translate_dir, params['locales'], update_dir)
+        written = [_lang_file(params['locales'], lang) for lang, stats in results.items()
+                   if stats.get('written')]
+        return results, written
+    raise ValueError("'translate' + 'target' ou 'translate_dir' (ou 'plugin_path') + 'locales' requis")
+
+
+def _step_sync(params: Dict) -> Tuple[Dict, List[str]]:
+    update_dir = _update_dir(params)
+    if not params.get('ref') and not update_dir:
+        raise ValueError("'ref', 'update' ou 'plugin_path' requis")
+    results = run_sync(params.get('ref'), params.get('locales'), update_dir,
+                       jobs=params.get('jobs'), plugin_path=params.get('plugin_path'))
+    locales_dir = params.get('locales') or (resolve_path(params['ref'])[0] if params.get('ref') else None)
+    written = [_lang_file(locales_dir, lang) for lang, stats in results.items()
+               if stats['written'] and locales_dir]
+    return results, written
+
+
+def _step_pipeline(params: Dict) -> Tuple[Dict, List[str]]:
+    if not (params.get('old') and params.get('new')):
+        raise ValueError("'old' et 'new' requis")
+    pipeline = run_pipeline(params['old'], params['new'], params.get('locales'), _output_dir(params),
+                            jobs=params.get('jobs'), compress=params.get('gzip', False),
+                            plugin_path=params.get('plugin_path'))
+    return pipeline, [pipeline['output_dir']] + pipeline['translate_files']
+
+
+def _step_pretranslate(params: Dict) -> Tuple[Dict, List[str]]:
+    reference = params.get('ref') or params.get('locales')
+    if not reference or not params.get('backend'):
+        raise ValueError("'backend' et 'ref' ou 'locales' requis")
+    backend = create_backend(params['backend'], dictionary_file=params.get('dictionary'))
+    results = run_pretranslate(reference, params.get('locales'), backend, _languages(params.get('lang')),
+                               cache_path=None if params.get('no_cache') else DEFAULT_MT_CACHE_PATH,
+                               workers=params.get('workers', 4), rate=params.get('rate'))
+    return results, []
+
+
+def _step_check(params: Dict) -> Tuple[Dict, List[str]]:
+    reference = params.get('ref') or params.get('locales')
+    if not reference or not params.get('glossary'):
+        raise ValueError("'glossary' et 'ref' ou 'locales' requis")
+    return run_check(params['glossary'], reference, params.get('locales'),
+                     _languages(params.get('lang'))), []
+
+
+def _step_consistency(params: Dict) -> Tuple[Dict, List[str]]:
+    reference = params.get('ref') or params.get('locales')
+    if not reference:
+        raise ValueError("'ref' ou 'locales' requis")
+    return run_consistency(reference, params.get('locales'), _languages(params.get('lang')),
+                           apply=params.get('apply', False)), []
+
+
+def _step_prune(params: Dict) -> Tuple[Dict, List[str]]:
+    if not params.get('plugin_path'):
+        raise ValueError("'plugin_path' requis")
+    result = run_prune(params['plugin_path'], params.get('locales'),
+                       _languages(params.get('exclude')), remove=params.get('remove', False))
+    locales_dir = params.get('locales') or params['plugin_path']
+    written = [_lang_file(locales_dir, lang) for lang, data in result['files'].items() if data['written']]
+    return result, written
+
+
+def _step_coverage(params: Dict) -> Tuple[Dict, List[str]]:
+    if not params.get('locales'):
+        raise ValueError("'locales' requis")
+    index = update_coverage(params['locales'], refresh=params.get('refresh', False))
+    if index is None:
+        raise FileNotFoundError(f"Fichier EN introuvable dans {params['locales']}")
+    matrix = coverage_matrix(index, _languages(params.get('lang')))
+    if not params.get('output'):
+        return matrix, []
+    renderers = {
+        'table': lambda m: render_coverage_table(m, not params.get('summary', False)),
+        'csv': render_coverage_csv,
+        'json': render_coverage_json,
+    }
+    with open(params['output'], 'w', encoding='utf-8') as f:
+        f.write(renderers[params.get('format', 'json')](matrix))
+    return matrix, [params['output']]
+
+
+def _step_workspace(params: Dict) -> Tuple[Dict, List[str]]:
+    if not params.get('plugins'):
+        raise ValueError("'plugins' requis")
+    result = run_workspace_sync(params['plugins'], _languages(params.get('lang')),
+                                jobs=params.get('jobs'), dry_run=params.get('dry_run', False))
+    paths = plugin_names(params['plugins'])
+    written = [_lang_file(paths[name], lang) for name, languages in result['plugins'].items()
+               for lang, stats in languages.items() if stats['written']]
+    return result, written
+
+
+def _step_pseudo(params: Dict) -> Tuple[Dict, List[str]]:
+    if not (params.get('ref') and params.get('lang')):
+        raise ValueError("'ref' et 'lang' requis")
+    stats = run_pseudo(params['ref'], params['lang'], params.get('output'),
+                       parse_expansion(params.get('expansion', DEFAULT_EXPANSION)),
+                       accents=not params.get('no_accents', False),
+                       brackets=not params.get('no_brackets', False),
+                       seed=params.get('seed', ''), force=params.get('force', False))
+    return stats, [stats['output']]
+
+
+# {commande: (fonction, paramètres acceptés)}
+STEPS: Dict[str, Tuple[Callable[[Dict], Tuple[Dict, List[str]]], set]] = {
+    'compare': (_step_compare, {'old', 'new', 'from', 'to', 'plugin_path', 'output', 'gzip'}),
+    'extract': (_step_extract, {'update', 'plugin_path', 'locales', 'lang', 'output', 'chunks', 'chunk_size'}),
+    'inject': (_step_inject, {'translate', 'target', 'translate_dir', 'update', 'plugin_path', 'locales'}),
+    'sync': (_step_sync, {'ref', 'update', 'plugin_path', 'locales', 'jobs'}),
+    'pipeline': (_step_pipeline, {'old', 'new', 'plugin_path', 'locales', 'output', 'jobs', 'gzip'}),
+    'pretranslate': (_step_pretranslate, {'backend', 'dictionary', 'ref', 'locales', 'lang',
+                                          'workers', 'rate', 'no_cache'}),
+    'check': (_step_check, {'glossary', 'ref', 'locales', 'lang'}),
+    'consistency': (_step_consistency, {'ref', 'locales', 'lang', 'apply'}),
+    'prune': (_step_prune, {'plugin_path', 'locales', 'exclude', 'remove'}),
+    'coverage': (_step_coverage, {'locales', 'lang', 'format', 'output', 'summary', 'refresh'}),
+    'workspace': (_step_workspace, {'plugins', 'lang', 'jobs', 'dry_run'}),
+    'pseudo': (_step_pseudo, {'ref', 'lang', 'output', 'expansion', 'seed', 'no_accents',
+                              'no_brackets', 'force'}),
+}
+
+
+# =============================================================================
+# EXÉCUTION
+# =============================================================================
+
+def _json_default(value):
+    """Conversion des résultats des modules (dataclasses, ensembles) en JSON."""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def load_job(job_path: str) -> Dict:
+    """
+    Charge et valide un fichier job.
+
+    Raises:
+        ValueError: Commande ou paramètre inconnu
+    """
+    with open(job_path, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+    if isinstance(job, list):
+        job = {'steps': job}
+
+    for number, step in enumerate(job.get('steps', []), 1):
+        command = step.get('command')
+        if command not in STEPS:
+            raise ValueError(f"Étape {number}: commande inconnue '{command}'")
+        unknown = set(step) - STEPS[command][1] - {'command'}
+        if unknown:
+            raise ValueError(f"Étape {number} ({command}): paramètre(s) inconnu(s) {sorted(unknown)}")
+    return job
+
+
+def run_job(job: Dict, log=None) -> Dict:
+    """
+    Exécute les étapes d'un job dans l'ordre.
+
+    Args:
+        job: Job chargé par load_job
+        log: Flux recevant les messages des modules (défaut: stderr)
+
+    Returns:
+        {'format', 'ok', 'seconds', 'steps': [{'command', 'ok', 'seconds',
+        'result' | 'error', 'outputs'}]}
+    """
+    log = log or sys.stderr
+    memory = job.get('memory', DEFAULT_MEMORY_PATH)
+    set_memory_path(os.path.expanduser(memory) if memory else None)
+    defaults = job.get('defaults', {})
+    stop_on_error = job.get('stop_on_error', True)
+
+    steps = []
+    started = time.perf_counter()
+    for step in job.get('steps', []):
+        function, accepted = STEPS[step['command']]
+        params = {key: value for key, value in defaults.items() if key in accepted}
+        params.update({key: value for key, value in step.items() if key != 'command'})
+
+        entry = {'command': step['command'], 'ok': True}
+        step_started = time.perf_counter()
+        try:
+            with redirect_stdout(log):
+                enable_parse_cache(params.get('plugin_path'))
+                result, outputs = function(params)
+            entry['result'] = json.loads(json.dumps(result, default=_json_default))
+            entry['outputs'] = outputs
+        except Exception as e:
+            entry['ok'] = False
+            entry['error'] = f"{type(e).__name__}: {e}"
+            entry['outputs'] = []
+        entry['seconds'] = round(time.perf_counter() - step_started, 3)
+        steps.append(entry)
+        if not entry['ok'] and stop_on_error:
+            break
+
+    return {
+        'format': JOB_RESULT_FORMAT,
+        'ok': all(entry['ok'] for entry in steps) and len(steps) == len(job.get('steps', [])),
+        'seconds': round(time.perf_counter() - started, 3),
+        'steps': steps
+    }
+
+
+def run_job_file(job_path: str) -> int:
+    """
+    Exécute un fichier job et écrit le résultat JSON sur stdout.
+
+    Returns:
+        Code de sortie (0 si toutes les étapes ont réussi)
+    """
+    try:
+        job = load_job(job_path)
+    except (OSError, ValueError) as e:
+        result = {'format': JOB_RESULT_FORMAT, 'ok': False, 'error': f"{type(e).__name__}: {e}", 'steps': []}
+    else:
+        result = run_job(job)
+        result['job'] = os.path.abspath(job_path)
+
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+    return 0 if result['ok'] else 1
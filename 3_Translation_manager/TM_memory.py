@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+TM_memory.py
+
+Mémoire de traduction locale (SQLite) pour TranslationManager.
+
+Chaque traduction validée est enregistrée avec le texte EN correspondant,
+indexée par (hash du texte EN normalisé, langue). Une chaîne EN qui
+réapparaît (nouvelle clé, clé renommée, autre plugin) est alors
+pré-remplie au lieu d'être retraduite.
+
+- Alimentée automatiquement par SYNC et INJECT
+- Utilisée par SYNC (clés [NEW]) et EXTRACT (TRANSLATE_xx.txt pré-remplis)
+- Désactivée tant que set_memory_path() n'a pas été appelé
+  (TranslationManager l'active par défaut, option --no-memory)
+"""
+
+import os
+import sqlite3
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# Emplacement par défaut (partagé entre tous les plugins)
+DEFAULT_MEMORY_PATH = os.path.join(os.path.expanduser('~'), '.lightroom_i18n',
+                                   'translation_memory.sqlite')
+
+# Nombre maximal de paramètres par requête IN (...)
+_LOOKUP_BATCH = 500
+
+# Chemin de la base active (None = mémoire désactivée)
+_memory_path: Optional[str] = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory (
+    en_hash     TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    en_text     TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    key         TEXT,
+    updated     TEXT NOT NULL,
+    PRIMARY KEY (en_hash, lang)
+)
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Normalise un texte EN (espaces consécutifs et bords ignorés)."""
+    return ' '.join(text.split())
+
+
+def text_hash(text: str) -> str:
+    """Hash du texte EN normalisé (clé de la mémoire)."""
+    return hashlib.sha1(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def set_memory_path(path: Optional[str]) -> None:
+    """Active la mémoire de traduction (chemin de la base) ou la désactive (None)."""
+    global _memory_path
+    _memory_path = path
+
+
+def get_memory_path() -> Optional[str]:
+    """Retourne le chemin de la base active (None si désactivée)."""
+    return _memory_path
+
+
+def open_memory() -> Optional['TranslationMemory']:
+    """Ouvre la mémoire active, ou retourne None si elle est désactivée ou inaccessible."""
+    if not _memory_path:
+        return None
+    try:
+        return TranslationMemory(_memory_path)
+    except (sqlite3.Error, OSError):
+        return None
+
+
+class TranslationMemory:
+    """
+    Mémoire de traduction SQLite.
+
+    Usage:
+        with TranslationMemory("/path/translation_memory.sqlite") as memory:
+            memory.store_many('fr', [("Hello", "Bonjour")])
+            memory.lookup_many(["Hello"], 'fr')  # {'Hello': 'Bonjour'}
+    """
+
+    def __init__(self, db_path: str):
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        # timeout: plusieurs processus SYNC peuvent écrire en même temps
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def lookup(self, en_text: str, lang: str) -> Optional[str]:
+        """Retourne la traduction connue d'un texte EN, ou None."""
+        row = self.conn.execute(
+            "SELECT translation FROM memory WHERE en_hash = ? AND lang = ?",
+            (text_hash(en_text), lang)
+        ).fetchone()
+        return row[0] if row else None
+
+    def lookup_many(self, en_texts: Iterable[str], lang: str) -> Dict[str, str]:
+        """
+        Recherche plusieurs textes EN en quelques requêtes.
+
+        Returns:
+            {texte EN: traduction} pour les textes trouvés
+        """
+        by_hash = {}
+        for text in en_texts:
+            if text:
+                by_hash.setdefault(text_hash(text), []).append(text)
+
+        found = {}
+        hashes = list(by_hash.keys())
+        for start in range(0, len(hashes), _LOOKUP_BATCH):
+            batch = hashes[start:start + _LOOKUP_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f"SELECT en_hash, translation FROM memory "
+                f"WHERE lang = ? AND en_hash IN ({placeholders})",
+                [lang] + batch
+            )
+            for en_hash, translation in rows:
+                for text in by_hash[en_hash]:
+                    found[text] = translation
+        return found
+
+    def store_many(self, lang: str, entries: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        Enregistre des traductions (une seule transaction).
+
+        Les entrées vides ou identiques au texte EN (non traduites) sont ignorées.
+
+        Args:
+            lang: Code langue
+            entries: (texte EN, traduction, clé) ; la clé est informative
+
+        Returns:
+            Nombre d'entrées transmises à la base
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (text_hash(en_text), lang, en_text, translation, key, now)
+            for en_text, translation, key in entries
+            if en_text and translation and translation != en_text
+        ]
+        if not rows:
+            return 0
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO memory (en_hash, lang, en_text, translation, key, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (en_hash, lang) DO UPDATE SET "
+                "translation = excluded.translation, en_text = excluded.en_text, "
+                "key = excluded.key, updated = excluded.updated "
+                "WHERE memory.translation != excluded.translation",
+                rows
+            )
+        return len(rows)
+
+    def count(self, lang: str = None) -> int:
+        """Nombre d'entrées (toutes langues ou une langue)."""
+        if lang:
+            row = self.conn.execute("SELECT COUNT(*) FROM memory WHERE lang = ?", (lang,)).fetchone()
+        else:
+            row = self.conn.execute("SELECT COUNT(*) FROM memory").fetchone()
+        return row[0]
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+TM_merge.py
+
+Fusion à trois voies (clé par clé) pour SYNC, INJECT et WORKSPACE.
+
+Après chaque écriture d'un fichier TranslatedStrings_xx.txt, SYNC et INJECT
+enregistrent l'état écrit (« base ») dans __i18n_tmp__/merge_base/. Lors de
+l'écriture suivante, chaque clé est fusionnée entre :
+
+- base    : dernier état écrit par TranslationManager
+- fichier : contenu actuel du fichier (modifications directes d'un traducteur)
+- entrant : valeurs proposées par l'opération (TRANSLATE_xx.txt, SYNC)
+
+Une clé modifiée d'un seul côté prend la valeur modifiée ; modifiée des deux
+côtés (valeurs différentes), elle garde la valeur du fichier et le conflit est
+écrit dans CONFLICTS_xx.txt (à côté du fichier de langue) pour relecture.
+"""
+
+import os
+import sys
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Ajouter le répertoire parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.paths import get_i18n_kit_path
+
+
+# Sous-dossier de __i18n_tmp__ contenant les bases de fusion
+MERGE_BASE_DIR = "merge_base"
+
+# Marqueur ajouté au-dessus d'une clé en conflit
+CONFLICT_MARKER = "-- ## CONFLICT ## Voir {file}"
+
+# Valeur absente (clé supprimée ou jamais présente)
+_MISSING = object()
+
+
+@dataclass
+class MergeResult:
+    """Résultat d'une fusion à trois voies."""
+    merged: Dict[str, str] = field(default_factory=dict)
+    # {clé: {'base': ..., 'file': ..., 'incoming': ...}} (None = clé absente)
+    conflicts: Dict[str, Dict[str, Optional[str]]] = field(default_factory=dict)
+    # Clés dont la modification directe du fichier a été conservée
+    kept_local: List[str] = field(default_factory=list)
+
+
+def three_way_merge(base: Dict[str, str], ours: Dict[str, str],
+                    theirs: Dict[str, str]) -> MergeResult:
+    """
+    Fusionne clé par clé (temps linéaire en nombre de clés).
+
+    Args:
+        base: Dernier état écrit (ancêtre commun)
+        ours: Contenu actuel du fichier
+        theirs: Valeurs proposées par l'opération en cours
+
+    Returns:
+        MergeResult (en cas de conflit, la valeur du fichier est conservée)
+    """
+    result = MergeResult()
+    merged = result.merged
+
+    for key in ours.keys() | theirs.keys():
+        o = ours.get(key, _MISSING)
+        t = theirs.get(key, _MISSING)
+
+        if o == t:
+            value = o
+        else:
+            b = base.get(key, _MISSING)
+            if o == b:
+                value = t            # Modifiée seulement par l'opération
+            elif t == b:
+                value = o            # Modifiée seulement dans le fichier
+                result.kept_local.append(key)
+            else:
+                value = o            # Modifiée des deux côtés : conflit
+                result.conflicts[key] = {
+                    'base': None if b is _MISSING else b,
+                    'file': None if o is _MISSING else o,
+                    'incoming': None if t is _MISSING else t,
+                }
+
+        if value is not _MISSING:
+            merged[key] = value
+
+    result.kept_local.sort()
+    return result
+
+
+def merge_synced_strings(base: Dict[str, str], read: Dict[str, str], current: Dict[str, str],
+                         synced: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+    """
+    Fusionne le résultat d'une synchronisation avec l'EN (SYNC, WORKSPACE).
+
+    Une valeur reprise telle quelle depuis la lecture (read) ne propose aucune
+    modification par rapport à la base : l'édition du traducteur l'emporte.
+    L'ensemble des clés reste celui de synced : une clé obsolète conservée par
+    la fusion est retirée, une clé supprimée du fichier reprend sa valeur.
+
+    Args:
+        base: Dernier état écrit (à défaut, les chaînes lues)
+        read: Chaînes lues avant la synchronisation
+        current: Contenu actuel du fichier
+        synced: Résultat de la synchronisation
+
+    Returns:
+        (chaînes à écrire, conflits sur les clés présentes dans le fichier)
+    """
+    incoming = {key: base[key] if key in base and read.get(key) == value else value
+                for key, value in synced.items()}
+    merge = three_way_merge(base, current, incoming)
+    strings = {key: merge.merged.get(key, value) for key, value in synced.items()}
+    conflicts = {key: conflict for key, conflict in merge.conflicts.items()
+                 if key in strings and conflict['file'] is not None}
+    return strings, conflicts
+
+
+def next_base(merged: Dict[str, str], conflicts: Dict[str, Dict]) -> Dict[str, str]:
+    """
+    Base à enregistrer après écriture.
+
+    Une clé en conflit garde son ancienne base : elle reste en conflit tant
+    qu'elle n'est pas résolue dans le fichier.
+    """
+    base = dict(merged)
+    for key, conflict in conflicts.items():
+        if conflict['base'] is None:
+            base.pop(key, None)
+        else:
+            base[key] = conflict['base']
+    return base
+
+
+def base_snapshot_path(lang_file: str) -> str:
+    """Chemin de la base de fusion d'un fichier de langue."""
+    directory = os.path.dirname(os.path.abspath(lang_file))
+    name = os.path.splitext(os.path.basename(lang_file))[0]
+    return os.path.join(get_i18n_kit_path(directory), MERGE_BASE_DIR, f"{name}.json")
+
+
+def load_base_snapshot(lang_file: str) -> Optional[Dict[str, str]]:
+    """Charge la base de fusion (None si aucune écriture précédente connue)."""
+    try:
+        with open(base_snapshot_path(lang_file), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_base_snapshot(lang_file: str, strings: Dict[str, str]) -> None:
+    """Enregistre l'état écrit comme base de la prochaine fusion."""
+    path = base_snapshot_path(lang_file)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(strings, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    except OSError:
+        pass  # Sans base, la prochaine fusion revient au comportement simple
+
+
+def conflicts_path(lang_file: str) -> str:
+    """Fichier de conflits associé à un fichier de langue (CONFLICTS_xx.txt)."""
+    name = os.path.splitext(os.path.basename(lang_file))[0]
+    lang = name.replace('TranslatedStrings_', '')
+    return os.path.join(os.path.dirname(lang_file), f'CONFLICTS_{lang}.txt')
+
+
+def write_conflicts(lang_file: str, conflicts: Dict[str, Dict], source: str) -> Optional[str]:
+    """
+    Ajoute les conflits d'une opération au fichier CONFLICTS_xx.txt.
+
+    Les conflits précédents (non encore relus) sont conservés.
+
+    Returns:
+        Chemin du fichier de conflits, ou None s'il n'y a aucun conflit
+    """
+    if not conflicts:
+        return None
+
+    path = conflicts_path(lang_file)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("# " + "=" * 77 + "\n")
+        f.write(f"# {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {source} - "
+                f"{len(conflicts)} conflit(s)\n")
+        f.write("# Valeur conservée : [FICHIER]. Reportez [ENTRANT] dans le fichier si besoin.\n")
+        f.write("# " + "=" * 77 + "\n\n")
+        for key in sorted(conflicts):
+            conflict = conflicts[key]
+            f.write(f"[KEY] {key}\n")
+            for label, name in (('[BASE]', 'base'), ('[FICHIER]', 'file'), ('[ENTRANT]', 'incoming')):
+                value = conflict[name]
+                f.write(f"{label} {'(absente)' if value is None else value}\n")
+            f.write("\n")
+    return path
+
+
+def conflict_markers(lang_file: str, conflicts: Dict[str, Dict]) -> Dict[str, str]:
+    """Marqueurs à placer au-dessus des clés en conflit (présentes dans le fichier)."""
+    marker = CONFLICT_MARKER.format(file=os.path.basename(conflicts_path(lang_file)))
+    return {key: marker for key, conflict in conflicts.items() if conflict['file'] is not None}
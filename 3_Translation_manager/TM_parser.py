@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+TM_parser.py
+
+Parser des fichiers TranslatedStrings_*.txt pour TranslationManager.
+
+- Chemin rapide sur les lignes '"$$$/...' (pas d'expression régulière),
+  avec repli sur un pattern précompilé
+- Cache des résultats indexé par (mtime, taille) : en mémoire, et
+  optionnellement sur disque (pickle sous __i18n_tmp__)
+- Les lignes mal formées sont signalées avec leur numéro de ligne
+
+Un même fichier EN parsé par COMPARE, EXTRACT, SYNC et INJECT dans une
+même session n'est donc lu qu'une seule fois.
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Optional
+
+# Ajouter le répertoire parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.colors import Colors
+
+# Instance couleurs
+c = Colors()
+
+# Format: "$$$/Key=Value" (suite éventuelle de la ligne ignorée)
+TRANSLATION_LINE_RE = re.compile(r'"(\$\$\$/[^"=]+)=([^"]*)"')
+
+# Préfixe d'une ligne de traduction
+_LINE_PREFIX = '"$$$/'
+
+# Version du format des entrées en cache disque (à incrémenter si ParsedFile change)
+_CACHE_FORMAT = 1
+
+
+@dataclass
+class ParsedFile:
+    """Résultat du parsing d'un fichier TranslatedStrings_*.txt."""
+    strings: Dict[str, str] = field(default_factory=dict)
+    malformed: List[Tuple[int, str]] = field(default_factory=list)  # (numéro de ligne, contenu)
+
+
+# Cache en mémoire : chemin absolu -> (mtime_ns, taille, ParsedFile)
+_memory_cache: Dict[str, Tuple[int, int, ParsedFile]] = {}
+
+# Répertoire du cache disque (None = désactivé)
+_disk_cache_dir: Optional[str] = None
+
+
+def parse_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse une ligne (déjà nettoyée) "$$$/Key=Value".
+
+    Returns:
+        (clé, valeur) ou None si la ligne n'est pas une traduction valide
+    """
+    if line.startswith(_LINE_PREFIX):
+        eq = line.find('=', len(_LINE_PREFIX))
+        if eq > len(_LINE_PREFIX):
+            end = line.find('"', eq + 1)
+            key = line[1:eq]
+            if end != -1 and '"' not in key:
+                return key, line[eq + 1:end]
+
+    match = TRANSLATION_LINE_RE.match(line)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+def parse_lines(lines) -> ParsedFile:
+    """
+    Parse des lignes de fichier TranslatedStrings.
+
+    Les lignes vides et les commentaires (--) sont ignorés ; toute autre
+    ligne qui n'est pas une traduction est enregistrée comme mal formée.
+    """
+    result = ParsedFile()
+    strings = result.strings
+
+    for line_num, raw in enumerate(lines, 1):
+        line = raw.strip()
+
+        # Ignorer lignes vides et commentaires
+        if not line or line.startswith('--'):
+            continue
+
+        parsed = parse_line(line)
+        if parsed:
+            strings[parsed[0]] = parsed[1]
+        else:
+            result.malformed.append((line_num, line))
+
+    return result
+
+
+def set_parse_cache_dir(cache_dir: Optional[str]) -> None:
+    """
+    Active (ou désactive avec None) le cache disque des résultats de parsing.
+
+    Args:
+        cache_dir: Répertoire du cache (ex: <plugin>/__i18n_tmp__/parse_cache)
+    """
+    global _disk_cache_dir
+    _disk_cache_dir = cache_dir
+
+
+def get_parse_cache_dir() -> Optional[str]:
+    """Retourne le répertoire du cache disque actif (None si désactivé)."""
+    return _disk_cache_dir
+
+
+def invalidate_parse_cache(file_path: str = None) -> None:
+    """Oublie le résultat en cache d'un fichier (ou de tous si file_path est None)."""
+    if file_path is None:
+        _memory_cache.clear()
+    else:
+        _memory_cache.pop(os.path.abspath(file_path), None)
+
+
+def _disk_cache_path(abs_path: str) -> str:
+    digest = hashlib.sha1(abs_path.encode('utf-8')).hexdigest()
+    return os.path.join(_disk_cache_dir, f"{digest}.pickle")
+
+
+def _load_disk_cache(abs_path: str, mtime_ns: int, size: int) -> Optional[ParsedFile]:
+    if not _disk_cache_dir:
+        return None
+    try:
+        with open(_disk_cache_path(abs_path), 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+        return None
+    if entry.get('format') != _CACHE_FORMAT or entry.get('path') != abs_path:
+        return None
+    if entry.get('mtime_ns') != mtime_ns or entry.get('size') != size:
+        return None
+    return ParsedFile(entry['strings'], entry['malformed'])
+
+
+def _store_disk_cache(abs_path: str, mtime_ns: int, size: int, parsed: ParsedFile) -> None:
+    if not _disk_cache_dir:
+        return
+    try:
+        os.makedirs(_disk_cache_dir, exist_ok=True)
+        with open(_disk_cache_path(abs_path), 'wb') as f:
+            pickle.dump({
+                'format': _CACHE_FORMAT,
+                'path': abs_path,
+                'mtime_ns': mtime_ns,
+                'size': size,
+                'strings': parsed.strings,
+                'malformed': parsed.malformed,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Le cache disque est facultatif
+
+
+def parse_translation_file_cached(file_path: str) -> ParsedFile:
+    """
+    Parse un fichier TranslatedStrings_*.txt en utilisant le cache.
+
+    Le ParsedFile retourné est partagé avec le cache : ne pas le modifier.
+    """
+    abs_path = os.path.abspath(file_path)
+    st = os.stat(abs_path)
+
+    cached = _memory_cache.get(abs_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    parsed = _load_disk_cache(abs_path, st.st_mtime_ns, st.st_size)
+    if parsed is None:
+        with open(abs_path, 'r', encoding='utf-8') as f:
+            parsed = parse_lines(f)
+        _store_disk_cache(abs_path, st.st_mtime_ns, st.st_size, parsed)
+
+        for line_num, line in parsed.malformed:
+            print(c.warning(f"{os.path.basename(abs_path)}:{line_num}: ligne ignorée (format invalide): {line[:80]}"))
+
+    _memory_cache[abs_path] = (st.st_mtime_ns, st.st_size, parsed)
+    return parsed
+
+
+def parse_translation_file(file_path: str) -> Dict[str, str]:
+    """
+    Parse un fichier TranslatedStrings_*.txt
+
+    Format: "$$$/Key=Value"
+
+    Returns:
+        Dict[str, str]: {clé: valeur} (copie modifiable)
+    """
+    return dict(parse_translation_file_cached(file_path).strings)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+TM_pipeline.py
+
+Module PIPELINE pour TranslationManager.
+Enchaîne COMPARE → EXTRACT → SYNC en une seule passe, sans aller-retour
+par UPDATE_en.json entre les étapes :
+
+- Chaque fichier (ancien EN, nouveau EN, langues) est lu une seule fois
+- Les structures parsées passent directement de VersionComparator au
+  générateur TRANSLATE puis à _sync_language
+- Les artefacts (UPDATE_en.json, CHANGELOG.txt, TRANSLATE_xx.txt) sont
+  écrits à la fin ; les fichiers de langue ne sont réécrits que s'ils changent
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, List
+
+from TM_common import parse_translation_file, resolve_path, find_languages
+from TM_compare import VersionComparator, build_update_data, write_compare_outputs
+from TM_extract import render_translate_file
+from TM_sync import sync_languages
+from common.snapshots import register_snapshot
+
+
+def run_pipeline(old_path: str, new_path: str, locales_dir: str = None,
+                 output_dir: str = None, jobs: int = None,
+                 compress: bool = False, plugin_path: str = None) -> Dict:
+    """
+    Exécute COMPARE, EXTRACT et SYNC en mémoire.
+
+    Args:
+        old_path: Ancien fichier EN (ou répertoire)
+        new_path: Nouveau fichier EN (ou répertoire)
+        locales_dir: Répertoire des fichiers de langues (défaut: celui du nouveau EN)
+        output_dir: Répertoire des artefacts (défaut: timestampé)
+        jobs: Nombre de processus pour SYNC (défaut: voir TM_sync.default_jobs)
+        compress: Écrire UPDATE_en.json.gz au lieu de UPDATE_en.json
+        plugin_path: Plugin dont l'historique EN reçoit les deux versions (optionnel)
+
+    Returns:
+        {
+            'output_dir': str,
+            'summary': résumé COMPARE,
+            'translate_files': [chemins TRANSLATE_xx.txt],
+            'sync': statistiques SYNC par langue
+        }
+    """
+    # Résoudre les chemins
+    _, old_file = resolve_path(old_path)
+    new_dir, new_file = resolve_path(new_path)
+
+    if not locales_dir:
+        locales_dir = new_dir
+
+    if not output_dir:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), timestamp)
+
+    # 1. COMPARE (en mémoire)
+    old_strings = parse_translation_file(old_file)
+    new_strings = parse_translation_file(new_file)
+    register_snapshot(plugin_path, old_strings, 'PIPELINE', old_file)
+    register_snapshot(plugin_path, new_strings, 'PIPELINE', new_file)
+    result = VersionComparator(old_strings, new_strings).compare()
+    update_data = build_update_data(old_file, new_file, len(old_strings), len(new_strings), result)
+
+    # Langues : chaque fichier n'est parsé qu'une fois, pour EXTRACT et SYNC
+    languages = find_languages(locales_dir, exclude_en=True)
+    lang_strings = {}
+    for lang in languages:
+        lang_strings[lang] = parse_translation_file(
+            os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        )
+
+    # 2. EXTRACT (contenu en mémoire, avant que SYNC ne modifie les langues)
+    translate_contents = {}
+    for lang in (languages or ['fr']):
+        translate_contents[lang] = render_translate_file(
+            update_data, lang, lang_strings.get(lang, {}), lang in lang_strings,
+            source=output_dir
+        )
+
+    # 3. SYNC (réutilise les chaînes EN et langues déjà parsées)
+    sync_results = sync_languages(new_strings, languages, locales_dir, update_data,
+                                  jobs, preloaded=lang_strings)
+
+    # Artefacts écrits à la fin
+    write_compare_outputs(output_dir, update_data, result, old_file, new_file, compress)
+    translate_files = _write_translate_files(output_dir, translate_contents)
+
+    return {
+        'output_dir': output_dir,
+        'summary': update_data['summary'],
+        'translate_files': translate_files,
+        'sync': sync_results
+    }
+
+
+def _write_translate_files(output_dir: str, contents: Dict[str, str]) -> List[str]:
+    """Écrit les fichiers TRANSLATE_xx.txt générés en mémoire."""
+    files = []
+    for lang in sorted(contents):
+        output_file = os.path.join(output_dir, f'TRANSLATE_{lang}.txt')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(contents[lang])
+        files.append(output_file)
+    return files
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+TM_pretranslate.py
+
+Module PRETRANSLATE pour TranslationManager.
+Pré-remplit les clés non traduites (marquées [NEW] et encore au texte EN,
+ou absentes du fichier de langue) avec un service de traduction automatique.
+
+- Backends interchangeables (classe MTBackend) : 'pseudo' et 'dictionary'
+  sont fournis (locaux, déterministes) ; un backend externe se charge avec
+  --backend module:Classe
+- Textes dédupliqués sur toutes les langues, envoyés par lots, en parallèle,
+  sous une limite de requêtes par seconde
+- Cache disque SQLite indexé par (hash du texte EN, langue, backend)
+- Placeholders (%s, %d, \\n...) protégés par des jetons avant l'envoi ; une
+  traduction qui les perd est rejetée
+
+Les clés pré-traduites sont marquées "-- ## NEW ## Pré-traduit (...)" pour relecture ;
+la base de fusion n'est pas modifiée (traductions non relues).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from TM_common import (
+    parse_translation_file, write_translation_file, resolve_path, find_languages
+)
+from TM_memory import normalize_text
+from TM_writer import read_markers
+from common.placeholders import protect_placeholders, restore_placeholders
+
+
+# Cache des traductions automatiques (partagé entre tous les plugins)
+DEFAULT_MT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.lightroom_i18n',
+                                     'mt_cache.sqlite')
+
+# Marqueur des clés à traduire (ajoutées par SYNC) et des clés pré-traduites
+NEW_MARKER = "-- ## NEW ##"
+PRETRANSLATED_MARKER = "-- ## NEW ## Pré-traduit ({backend}, à relire)"
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class MTBackend:
+    """
+    Interface d'un service de traduction automatique.
+
+    Une sous-classe définit translate_batch() ; les attributs de classe
+    règlent le découpage en lots et le débit.
+    """
+    name = 'base'
+    batch_size = 50             # Textes par requête
+    requests_per_second = 0.0   # 0 = pas de limite
+
+    def translate_batch(self, texts: List[str], lang: str) -> List[Optional[str]]:
+        """
+        Traduit un lot de textes (placeholders déjà remplacés par des jetons).
+
+        Returns:
+            Une traduction par texte, dans le même ordre (None = non traduit)
+        """
+        raise NotImplementedError
+
+
+class PseudoBackend(MTBackend):
+    """Pseudo-localisation déterministe (accents + crochets), pour les tests."""
+    name = 'pseudo'
+    batch_size = 200
+
+    _ACCENTS = str.maketrans('aceinouyACEINOUY', 'àçéîñöûýÀÇÉÎÑÖÛÝ')
+
+    def translate_batch(self, texts: List[str], lang: str) -> List[Optional[str]]:
+        return [f"[{lang}] {text.translate(self._ACCENTS)}" for text in texts]
+
+
+class DictionaryBackend(MTBackend):
+    """
+    Traductions lues dans un fichier JSON {langue: {texte EN: traduction}}.
+
+    Les textes absents du dictionnaire ne sont pas traduits.
+    """
+    name = 'dictionary'
+    batch_size = 1000
+
+    def __init__(self, dictionary_file: str = None):
+        self.entries: Dict[str, Dict[str, str]] = {}
+        if dictionary_file:
+            with open(dictionary_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for lang, entries in data.items():
+                self.entries[lang] = {normalize_text(en): tr for en, tr in entries.items()}
+
+    def translate_batch(self, texts: List[str], lang: str) -> List[Optional[str]]:
+        entries = self.entries.get(lang, {})
+        return [entries.get(normalize_text(text)) for text in texts]
+
+
+BACKENDS = {
+    PseudoBackend.name: PseudoBackend,
+    DictionaryBackend.name: DictionaryBackend,
+}
+
+
+def create_backend(spec: str, **options) -> MTBackend:
+    """
+    Crée un backend à partir de son nom ('pseudo', 'dictionary') ou d'un
+    chemin d'import 'module:Classe' (backend externe).
+    """
+    if spec in BACKENDS:
+        cls = BACKENDS[spec]
+    elif ':' in spec:
+        module_name, class_name = spec.split(':', 1)
+        cls = getattr(importlib.import_module(module_name), class_name)
+    else:
+        raise ValueError(f"Backend inconnu: {spec} (disponibles: {', '.join(sorted(BACKENDS))})")
+
+    if cls is DictionaryBackend:
+        return cls(options.get('dictionary_file'))
+    return cls()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class MTCache:
+    """Cache SQLite des traductions automatiques : (hash EN, langue, backend) → traduction."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS mt_cache (
+        en_hash     TEXT NOT NULL,
+        lang        TEXT NOT NULL,
+        backend     TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        created     TEXT NOT NULL,
+        PRIMARY KEY (en_hash, lang, backend)
+    )
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute(self._SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def lookup_many(self, texts: Iterable[str], lang: str, backend: str) -> Dict[str, str]:
+        by_hash = {self._hash(text): text for text in texts}
+        found = {}
+        hashes = list(by_hash)
+        for start in range(0, len(hashes), 500):
+            batch = hashes[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT en_hash, translation FROM mt_cache WHERE lang = ? AND backend = ? "
+                f"AND en_hash IN ({','.join('?' * len(batch))})",
+                [lang, backend] + batch
+            )
+            for en_hash, translation in rows:
+                found[by_hash[en_hash]] = translation
+        return found
+
+    def store_many(self, lang: str, backend: str, translations: Dict[str, str]) -> None:
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO mt_cache (en_hash, lang, backend, translation, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(self._hash(en), lang, backend, tr, now) for en, tr in translations.items()]
+            )
+
+
+# =============================================================================
+# TRADUCTION PAR LOTS
+# =============================================================================
+
+class RateLimiter:
+    """Limite le nombre d'appels par seconde (partagé entre les threads)."""
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second if per_second and per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def translate_texts(backend: MTBackend, texts_by_lang: Dict[str, Iterable[str]],
+                    cache: MTCache = None, workers: int = 4,
+                    rate: float = None) -> Dict[str, Dict[str, str]]:
+    """
+    Traduit des textes EN pour plusieurs langues en un seul appel.
+
+    Les textes sont dédupliqués, cherchés dans le cache, puis les manquants
+    sont envoyés par lots de backend.batch_size, en parallèle (workers) et
+    sous la limite de débit (rate, défaut: backend.requests_per_second).
+
+    Returns:
+        {langue: {texte EN: traduction}} (textes non traduits absents)
+    """
+    limiter = RateLimiter(backend.requests_per_second if rate is None else rate)
+    results = {lang: {} for lang in texts_by_lang}
+    jobs = []
+
+    for lang, texts in texts_by_lang.items():
+        pending = sorted(set(texts))
+        if cache and pending:
+            results[lang].update(cache.lookup_many(pending, lang, backend.name))
+            pending = [text for text in pending if text not in results[lang]]
+        for start in range(0, len(pending), max(1, backend.batch_size)):
+            jobs.append((lang, pending[start:start + backend.batch_size]))
+
+    def _run(job):
+        lang, texts = job
+        protected = [protect_placeholders(text) for text in texts]
+        limiter.wait()
+        translated = backend.translate_batch([p[0] for p in protected], lang)
+        batch = {}
+        for text, (_, placeholders), result in zip(texts, protected, translated):
+            if result:
+                restored = restore_placeholders(result, placeholders)
+                if restored is not None:
+                    batch[text] = restored
+        return lang, batch
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for lang, batch in pool.map(_run, jobs):
+                results[lang].update(batch)
+                if cache and batch:
+                    cache.store_many(lang, backend.name, batch)
+
+    return results
+
+
+# =============================================================================
+# FONCTIONS PRINCIPALES
+# =============================================================================
+
+def run_pretranslate(reference_path: str, locales_dir: str = None,
+                     backend: MTBackend = None, languages: List[str] = None,
+                     cache_path: Optional[str] = DEFAULT_MT_CACHE_PATH,
+                     workers: int = 4, rate: float = None) -> Dict[str, Dict]:
+    """
+    Pré-traduit les clés non traduites de toutes les langues.
+
+    Une clé est considérée non traduite si elle porte un marqueur [NEW] et
+    que sa valeur est encore le texte EN, ou si elle est absente du fichier.
+    Une valeur identique à l'EN sans marqueur ("OK", nom de marque) est une
+    traduction légitime et n'est pas modifiée.
+
+    Args:
+        reference_path: Fichier EN de référence (ou répertoire)
+        locales_dir: Répertoire des fichiers de langues (défaut: celui du EN)
+        backend: Backend de traduction (défaut: PseudoBackend)
+        languages: Langues à traiter (défaut: toutes)
+        cache_path: Base du cache disque (None = sans cache)
+        workers: Requêtes simultanées
+        rate: Requêtes par seconde (défaut: limite du backend)
+
+    Returns:
+        Dict par langue : {'candidates', 'translated', 'written'}
+    """
+    backend = backend or PseudoBackend()
+    ref_dir, ref_file = resolve_path(reference_path)
+    locales_dir = locales_dir or ref_dir
+    en_strings = parse_translation_file(ref_file)
+
+    if not languages:
+        languages = find_languages(locales_dir, exclude_en=True)
+
+    # Clés à traduire par langue ({clé: texte EN}, texte non vide)
+    lang_strings = {}
+    lang_markers = {}
+    todo = {}
+    for lang in languages:
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        if not os.path.isfile(lang_file):
+            continue
+        with open(lang_file, 'r', encoding='utf-8') as f:
+            markers = lang_markers[lang] = read_markers(f.read())
+        strings = lang_strings[lang] = parse_translation_file(lang_file)
+        todo[lang] = {
+            key: en_value for key, en_value in en_strings.items()
+            if en_value.strip() and (
+                key not in strings
+                or (strings[key] == en_value and markers.get(key, '').startswith(NEW_MARKER))
+            )
+        }
+
+    cache = MTCache(cache_path) if cache_path else None
+    try:
+        translations = translate_texts(backend, {lang: keys.values() for lang, keys in todo.items()},
+                                       cache, workers, rate)
+    finally:
+        if cache:
+            cache.close()
+
+    marker = PRETRANSLATED_MARKER.format(backend=backend.name)
+    results = {}
+    for lang in sorted(todo):
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        strings = lang_strings[lang]
+        known = translations.get(lang, {})
+        filled = [key for key, value in todo[lang].items() if known.get(value, value) != value]
+
+        written = False
+        if filled:
+            markers = lang_markers[lang]
+            for key in filled:
+                strings[key] = known[todo[lang][key]]
+                markers[key] = marker
+            written = write_translation_file(lang_file, lang, strings, markers,
+                                             {'source': f'PRETRANSLATE ({backend.name})'},
+                                             backup=True)
+
+        results[lang] = {
+            'candidates': len(todo[lang]),
+            'translated': len(filled),
+            'written': written
+        }
+
+    return results
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+TM_prune.py
+
+Module PRUNE pour TranslationManager.
+Détecte les clés mortes : présentes dans TranslatedStrings_en.txt ou dans
+une langue, mais plus référencées par aucun fichier .lua du plugin.
+
+- Les sources sont parcourues une seule fois (même parcours et mêmes
+  exclusions que l'Extractor, voir common/lua_sources.py)
+- Les clés construites dynamiquement ("$$$/Prefixe/" .. nom) protègent
+  toutes les clés du préfixe
+- Option --remove : suppression des clés mortes dans tous les fichiers
+"""
+
+import os
+from typing import Dict, List
+
+from TM_common import (
+    parse_translation_file, write_translation_file, find_languages, c
+)
+from TM_merge import save_base_snapshot
+from TM_writer import read_markers
+from common.lua_sources import scan_key_references
+
+
+def find_dead_keys(keys, referenced, dynamic_prefixes) -> List[str]:
+    """Clés ni référencées ni couvertes par un préfixe dynamique (triées)."""
+    prefixes = tuple(dynamic_prefixes)
+    return sorted(
+        key for key in keys
+        if key not in referenced and not (prefixes and key.startswith(prefixes))
+    )
+
+
+def run_prune(plugin_path: str, locales_dir: str = None,
+              exclude_files: List[str] = None, remove: bool = False) -> Dict:
+    """
+    Compare les clés référencées dans les sources aux fichiers de traduction.
+
+    Args:
+        plugin_path: Répertoire du plugin (sources .lua)
+        locales_dir: Répertoire des fichiers TranslatedStrings (défaut: plugin_path)
+        exclude_files: Fichiers .lua à ignorer (en plus de JSON.lua)
+        remove: Supprimer les clés mortes des fichiers
+
+    Returns:
+        Dict avec 'referenced', 'dynamic_prefixes', 'dead' (EN),
+        'missing' (référencées mais absentes de l'EN) et 'files'
+        ({langue: {'dead': [...], 'written': bool}})
+    """
+    locales_dir = locales_dir or plugin_path
+    en_file = os.path.join(locales_dir, 'TranslatedStrings_en.txt')
+    if not os.path.isfile(en_file):
+        raise FileNotFoundError(f"Fichier EN introuvable: {en_file}")
+
+    referenced, dynamic_prefixes = scan_key_references(plugin_path, exclude_files)
+    en_strings = parse_translation_file(en_file)
+
+    files = {}
+    for lang in ['en'] + find_languages(locales_dir, exclude_en=True):
+        lang_file = en_file if lang == 'en' else \
+            os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        strings = en_strings if lang == 'en' else parse_translation_file(lang_file)
+        dead = find_dead_keys(strings, referenced, dynamic_prefixes)
+
+        written = False
+        if remove and dead:
+            with open(lang_file, 'r', encoding='utf-8') as f:
+                markers = read_markers(f.read())
+            dead_set = set(dead)
+            kept = {key: value for key, value in strings.items() if key not in dead_set}
+            written = write_translation_file(lang_file, lang, kept, markers,
+                                             {'source': 'PRUNE'}, backup=True)
+            if lang != 'en':
+                save_base_snapshot(lang_file, kept)
+
+        files[lang] = {'dead': dead, 'written': written}
+
+    return {
+        'referenced': len(referenced),
+        'dynamic_prefixes': sorted(dynamic_prefixes),
+        'dead': files['en']['dead'],
+        'missing': sorted(key for key in referenced if key not in en_strings),
+        'files': files
+    }
+
+
+def generate_prune_report(result: Dict, max_keys: int = 30) -> str:
+    """Génère le rapport des clés mortes avec couleurs."""
+    lines = []
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append(f"{c.TITLE}CLÉS MORTES{c.RESET}")
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append("")
+
+    dead = result['dead']
+    if dead:
+        lines.append(f"{c.YELLOW}{len(dead)}{c.RESET} clé(s) EN non référencée(s) dans les sources :")
+        for key in dead[:max_keys]:
+            lines.append(f"  {c.YELLOW}-{c.RESET} {c.DIM}{key}{c.RESET}")
+        if len(dead) > max_keys:
+            lines.append(f"  {c.DIM}... et {len(dead) - max_keys} autres{c.RESET}")
+        lines.append("")
+
+    if result['dynamic_prefixes']:
+        lines.append(f"{c.INFO}[INFO]{c.RESET} Préfixes dynamiques (clés conservées) :")
+        for prefix in result['dynamic_prefixes']:
+            lines.append(f"  {c.DIM}{prefix}*{c.RESET}")
+        lines.append("")
+
+    if result['missing']:
+        lines.append(f"{c.WARNING}[ATTENTION]{c.RESET} {len(result['missing'])} clé(s) référencée(s) "
+                     f"mais absente(s) de TranslatedStrings_en.txt")
+        lines.append("")
+
+    lines.append(f"{c.separator()}")
+    lines.append(f"  {c.KEY}Clés référencées{c.RESET}: {c.WHITE}{result['referenced']}{c.RESET}")
+    for lang, data in sorted(result['files'].items()):
+        status = f" {c.GREEN}(supprimées){c.RESET}" if data['written'] else ""
+        count_color = c.YELLOW if data['dead'] else c.GREEN
+        lines.append(f"  {c.KEY}{lang.upper():<16}{c.RESET}: {count_color}{len(data['dead'])}{c.RESET} "
+                     f"clé(s) morte(s){status}")
+
+    return "\n".join(lines)
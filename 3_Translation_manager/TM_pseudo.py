@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+TM_pseudo.py
+
+Module PSEUDO pour TranslationManager.
+Génère un fichier TranslatedStrings_xx.txt pseudo-localisé à partir du
+fichier EN, pour tester la mise en page des dialogues Lightroom avant
+l'arrivée des vraies traductions :
+
+    "$$$/App/UI/Cancel=Cancel"  →  "$$$/App/UI/Cancel=[Çåñçéľ ţ]"
+
+- Allongement réglable (+30 % par défaut), caractères accentués, crochets
+  qui rendent visibles les textes tronqués ou concaténés
+- Conservés tels quels (voir TRANSLATION_WARNING_NOTE) : placeholders
+  (%s, %1, \\n...), "...", termes techniques en MAJUSCULES, espaces en
+  début et fin de texte
+- Lecture et écriture ligne par ligne : mémoire constante quelle que soit
+  la taille du fichier
+- Remplissage dérivé du hash de chaque clé (et d'une graine optionnelle) :
+  le résultat est identique d'une exécution à l'autre et ne dépend pas de
+  l'ordre des clés
+"""
+
+import os
+import re
+import hashlib
+import tempfile
+from datetime import datetime
+from typing import Dict
+
+from TM_common import GENERATED_LINE_PREFIX, invalidate_parse_cache, resolve_path, c
+from TM_parser import parse_line
+from common.placeholders import PLACEHOLDER_PATTERN
+
+
+# Allongement par défaut (+30 %)
+DEFAULT_EXPANSION = 0.3
+
+# Segments à conserver : placeholders, substitutions LOC (^1), points de
+# suspension, termes techniques en majuscules (groupe capturant : split()
+# retourne les segments conservés aux indices impairs)
+PROTECTED_PATTERN = re.compile(
+    rf'({PLACEHOLDER_PATTERN.pattern}|\^\d|\.\.\.|\b[A-Z][A-Z0-9]+\b)'
+)
+
+ACCENTS = str.maketrans(
+    'abcdeghijklnorstuwyzABCDEGHIJKLNORSTUWYZ',
+    'åƀçðéĝĥîĵķľñöŕšţûŵýžÅƁÇÐÉĜĤÎĴĶĽÑÖŔŠŢÛŴÝŽ'
+)
+
+# Mots de remplissage (accentués, sans guillemet ni antislash)
+FILLER_WORDS = ('ļöŕéɱ', 'îþšûɱ', 'ðöļõŕ', 'šîţ', 'åɱéţ', 'çöñ', 'šéç', 'ţéţûŕ',
+                'åðîþ', 'éļîţ', 'šéð', 'ðö', 'éîûš', 'ɱöð', 'ţéɱþöŕ', 'îñ')
+
+# Ligne d'entête indiquant la langue (voir _header_info_lines)
+LANGUAGE_LINE_PREFIX = "-- Plugin Localization - "
+
+
+def parse_expansion(value: str) -> float:
+    """
+    Lit un allongement : '30%', '+50%' ou '0.3'.
+
+    Raises:
+        ValueError: Valeur invalide ou négative
+    """
+    text = str(value).strip().lstrip('+')
+    expansion = float(text[:-1]) / 100 if text.endswith('%') else float(text)
+    if expansion < 0:
+        raise ValueError(f"Allongement négatif: {value}")
+    return expansion
+
+
+def _filler(digest: bytes, length: int) -> str:
+    """
+    Remplissage de longueur exacte (mots séparés par des espaces).
+
+    Les mots sont choisis par les octets du hash de la clé (prolongé par
+    re-hachage) : déterministe et bien plus rapide qu'un générateur aléatoire.
+    """
+    out = []
+    size = 0
+    index = 0
+    while size < length:
+        if index == len(digest):
+            digest = hashlib.sha256(digest).digest()
+            index = 0
+        word = ' ' + FILLER_WORDS[digest[index] % len(FILLER_WORDS)]
+        index += 1
+        out.append(word)
+        size += len(word)
+    filler = ''.join(out)[:length]
+    # Pas d'espace final : il serait pris pour un espace de concaténation
+    return filler[:-1] + 'ö' if filler.endswith(' ') else filler
+
+
+def pseudo_localize(text: str, key: str = '', expansion: float = DEFAULT_EXPANSION,
+                    accents: bool = True, brackets: bool = True, seed: str = '') -> str:
+    """
+    Pseudo-localise un texte.
+
+    Args:
+        text: Valeur EN (telle qu'écrite dans le fichier)
+        key: Clé, dont le hash choisit les mots du remplissage
+        expansion: Allongement relatif (0.3 = +30 %)
+        accents: Remplacer les lettres par des lettres accentuées
+        brackets: Encadrer le texte par [ ]
+        seed: Graine commune (change tous les remplissages)
+
+    Example:
+        >>> pseudo_localize("  %d photos", expansion=0)
+        '  [%d pĥöţöš]'
+    """
+    core = text.strip(' ')
+    if not core:
+        return text
+    lead = text[:len(text) - len(text.lstrip(' '))]
+    trail = text[len(text.rstrip(' ')):]
+
+    parts = PROTECTED_PATTERN.split(core)
+    if accents:
+        parts[::2] = [segment.translate(ACCENTS) for segment in parts[::2]]
+
+    extra = round(len(core) * expansion)
+    if extra:
+        parts.append(_filler(hashlib.sha256(f"{seed}|{key}".encode('utf-8')).digest(), extra))
+
+    body = ''.join(parts)
+    if brackets:
+        body = f"[{body}]"
+    return f"{lead}{body}{trail}"
+
+
+def generate_pseudo_file(en_file: str, output_file: str, lang: str,
+                         expansion: float = DEFAULT_EXPANSION, accents: bool = True,
+                         brackets: bool = True, seed: str = '') -> Dict:
+    """
+    Écrit le fichier pseudo-localisé en lisant le fichier EN ligne par ligne.
+
+    Les commentaires, lignes vides et l'ordre des clés du fichier EN sont
+    conservés ; l'entête indique la langue et la date de génération.
+
+    Returns:
+        Statistiques {'keys', 'chars_en', 'chars_pseudo', 'output'}
+    """
+    stats = {'keys': 0, 'chars_en': 0, 'chars_pseudo': 0, 'output': output_file}
+    directory = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(output_file) + '.',
+                                    suffix='.tmp')
+    try:
+        with open(en_file, 'r', encoding='utf-8') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8') as dst:
+            for line in src:
+                stripped = line.strip()
+                parsed = parse_line(stripped) if stripped.startswith('"') else None
+                if parsed:
+                    key, value = parsed
+                    pseudo = pseudo_localize(value, key, expansion, accents, brackets, seed)
+                    dst.write(f'"{key}={pseudo}"\n')
+                    stats['keys'] += 1
+                    stats['chars_en'] += len(value)
+                    stats['chars_pseudo'] += len(pseudo)
+                elif line.startswith(LANGUAGE_LINE_PREFIX):
+                    dst.write(f"{LANGUAGE_LINE_PREFIX}{lang.upper()} (pseudo)\n")
+                elif line.startswith(GENERATED_LINE_PREFIX):
+                    dst.write(f"{GENERATED_LINE_PREFIX} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                else:
+                    dst.write(line)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    invalidate_parse_cache(output_file)
+    return stats
+
+
+def run_pseudo(reference_path: str, lang: str, output_file: str = None,
+               expansion: float = DEFAULT_EXPANSION, accents: bool = True,
+               brackets: bool = True, seed: str = '', force: bool = False) -> Dict:
+    """
+    Génère TranslatedStrings_<lang>.txt pseudo-localisé à côté du fichier EN.
+
+    Args:
+        reference_path: Fichier EN de référence (ou répertoire)
+        lang: Code langue du fichier généré
+        output_file: Fichier de sortie (défaut: TranslatedStrings_<lang>.txt)
+        force: Remplacer un fichier existant (une vraie traduction serait perdue)
+
+    Raises:
+        FileExistsError: Le fichier de sortie existe déjà (sans force)
+    """
+    ref_dir, ref_file = resolve_path(reference_path)
+    output_file = output_file or os.path.join(ref_dir, f'TranslatedStrings_{lang}.txt')
+    if os.path.abspath(output_file) == os.path.abspath(ref_file):
+        raise ValueError("Le fichier de sortie ne peut pas être le fichier EN")
+    if os.path.exists(output_file) and not force:
+        raise FileExistsError(f"Fichier existant (utilisez --force pour le remplacer): {output_file}")
+    return generate_pseudo_file(ref_file, output_file, lang, expansion, accents, brackets, seed)
+
+
+def generate_pseudo_report(stats: Dict) -> str:
+    """Résumé de la génération avec couleurs."""
+    growth = (stats['chars_pseudo'] / stats['chars_en'] - 1) * 100 if stats['chars_en'] else 0.0
+    lines = []
+    lines.append(f"{c.KEY}Clés générées   {c.RESET}: {c.WHITE}{stats['keys']}{c.RESET}")
+    lines.append(f"{c.KEY}Allongement réel{c.RESET}: {c.YELLOW}{growth:+.0f}%{c.RESET}  "
+                 f"{c.DIM}(crochets compris){c.RESET}")
+    lines.append(c.success(f"Fichier pseudo-localisé: {c.VALUE}{stats['output']}{c.RESET}"))
+    return "\n".join(lines)
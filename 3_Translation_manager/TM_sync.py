@@ -7,14 +7,75 @@ Synchronise les langues étrangères avec le fichier EN de référence.
 """
 
 import os
-import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 
 from TM_common import (
     parse_translation_file, write_translation_file,
-    resolve_path, load_update_json, find_languages, c
+    resolve_path, load_update_json, find_update_reference, find_languages,
+    PLACEHOLDER_MARKER, c
 )
+from TM_memory import TranslationMemory, open_memory, get_memory_path, set_memory_path
+from TM_parser import get_parse_cache_dir, set_parse_cache_dir
+from TM_merge import (
+    merge_synced_strings, next_base, load_base_snapshot, save_base_snapshot,
+    write_conflicts, conflict_markers
+)
+from TM_writer import read_markers
+from TM_coverage import update_coverage
+from common.snapshots import register_snapshot
+from common.placeholders import placeholder_signatures, check_placeholders, find_placeholder_issues
+
+
+# Volume cumulé des fichiers de langues en dessous duquel SYNC reste séquentiel
+# par défaut : le démarrage des processus coûterait plus que la synchronisation
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# Marqueurs des traductions non relues (jamais enregistrées dans la mémoire)
+UNREVIEWED_MARKER_PREFIXES = tuple(f"-- ## {kind} ##" for kind in ('NEW', 'NEEDS_REVIEW', 'CONFLICT'))
+
+# Données partagées (lecture seule) dans chaque processus du pool
+_worker_shared = None
+_worker_memory = None
+
+
+def _init_worker(shared: tuple, memory_path: str = None, parse_cache_dir: str = None,
+                 stdout_to_stderr: bool = False):
+    """
+    Initialise un processus du pool avec les données EN (transmises une seule fois).
+
+    La configuration du processus principal est reprise explicitement : avec
+    le démarrage 'spawn' (Windows, macOS), les modules sont réimportés et
+    l'état global (cache de parsing, mémoire, redirection de stdout du mode
+    --job) serait perdu.
+    """
+    global _worker_shared, _worker_memory
+    _worker_shared = shared
+    set_parse_cache_dir(parse_cache_dir)
+    set_memory_path(memory_path)
+    _worker_memory = open_memory()
+    if stdout_to_stderr:
+        sys.stdout = sys.stderr
+
+
+def default_jobs(lang_files: List[str]) -> int:
+    """Nombre de processus par défaut : 1 pour des fichiers de langues de petite taille."""
+    total = sum(os.path.getsize(path) for path in lang_files if os.path.isfile(path))
+    return (os.cpu_count() or 1) if total >= PARALLEL_MIN_BYTES else 1
+
+
+def _sync_language_worker(lang: str, lang_file: str, output_dir: str,
+                          lang_strings: Dict[str, str] = None) -> Dict:
+    """Exécute _sync_language dans un processus du pool."""
+    (en_strings, en_keys, added_keys, changed_keys, deleted_keys,
+     update_data, en_signatures) = _worker_shared
+    return _sync_language(
+        lang, lang_file, en_strings, en_keys,
+        added_keys, changed_keys, deleted_keys,
+        output_dir, update_data, _worker_memory, lang_strings, en_signatures
+    )
 
 
 # =============================================================================
@@ -22,7 +83,8 @@ from TM_common import (
 # =============================================================================
 
 def run_sync(reference_path: str = None, locales_dir: str = None, 
-             update_dir: str = None) -> Dict[str, Dict]:
+             update_dir: str = None, jobs: int = None,
+             plugin_path: str = None) -> Dict[str, Dict]:
     """
     Synchronise les langues étrangères avec le fichier EN.
     
@@ -34,17 +96,19 @@ def run_sync(reference_path: str = None, locales_dir: str = None,
         reference_path: Fichier EN de référence (ou répertoire)
         locales_dir: Répertoire des fichiers de langues
         update_dir: Répertoire contenant UPDATE_en.json (optionnel)
+        jobs: Nombre de processus (défaut: voir default_jobs, 1 = séquentiel)
+        plugin_path: Plugin dont l'historique EN reçoit la référence (optionnel)
     
     Returns:
-        Dict par langue avec les statistiques
+        Dict par langue avec les statistiques (ordre alphabétique des langues)
     """
     # Charger les données de mise à jour si disponibles
     update_data = None
     if update_dir:
         update_data = load_update_json(update_dir)
-        # Utiliser le fichier EN du dossier update comme référence
-        ref_in_update = os.path.join(update_dir, 'TranslatedStrings_en.txt')
-        if os.path.isfile(ref_in_update):
+        # Utiliser le fichier EN de référence du dossier update (copie v1 ou new_file v2)
+        ref_in_update = find_update_reference(update_dir, update_data, locales_dir)
+        if ref_in_update:
             reference_path = ref_in_update
     
     # Résoudre le chemin de référence
@@ -59,14 +123,40 @@ def run_sync(reference_path: str = None, locales_dir: str = None,
     
     # Charger le fichier EN de référence
     en_strings = parse_translation_file(ref_file)
-    en_keys = set(en_strings.keys())
+    register_snapshot(plugin_path, en_strings, 'SYNC', ref_file)
     
     # Trouver les langues étrangères
     other_languages = find_languages(locales_dir, exclude_en=True)
     
-    if not other_languages:
+    return sync_languages(en_strings, other_languages, locales_dir, update_data, jobs)
+
+
+def sync_languages(en_strings: Dict[str, str], languages: List[str], locales_dir: str,
+                   update_data: Dict = None, jobs: int = None,
+                   preloaded: Dict[str, Dict[str, str]] = None) -> Dict[str, Dict]:
+    """
+    Synchronise des langues avec des données EN déjà chargées.
+    
+    Args:
+        en_strings: Chaînes EN de référence
+        languages: Codes langue à synchroniser
+        locales_dir: Répertoire des fichiers de langues
+        update_data: Données UPDATE (fichier ou construites en mémoire)
+        jobs: Nombre de processus (défaut: nombre de cœurs si les fichiers de
+              langues dépassent PARALLEL_MIN_BYTES, sinon 1 = séquentiel)
+        preloaded: {langue: chaînes déjà parsées} pour éviter une relecture
+    
+    Returns:
+        Dict par langue avec les statistiques (ordre alphabétique des langues)
+    """
+    if not languages:
         return {}
     
+    preloaded = preloaded or {}
+    en_keys = set(en_strings.keys())
+    # Signatures des placeholders EN, calculées une fois pour toutes les langues
+    en_signatures = placeholder_signatures(en_strings)
+    
     # Préparer les infos de changement depuis update_data
     added_keys = set()
     changed_keys = set()
@@ -77,16 +167,45 @@ def run_sync(reference_path: str = None, locales_dir: str = None,
         changed_keys = set(update_data.get('changed', {}).keys())
         deleted_keys = set(update_data.get('deleted', []))
     
+    languages = sorted(languages)
+    lang_files = [os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt') for lang in languages]
+    
+    if jobs is None:
+        jobs = default_jobs(lang_files)
+    jobs = max(1, min(jobs, len(languages)))
+    
     results = {}
     
-    for lang in sorted(other_languages):
-        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
-        result = _sync_language(
-            lang, lang_file, en_strings, en_keys,
-            added_keys, changed_keys, deleted_keys,
-            locales_dir, update_data
-        )
-        results[lang] = result
+    if jobs == 1:
+        memory = open_memory()
+        try:
+            for lang, lang_file in zip(languages, lang_files):
+                results[lang] = _sync_language(
+                    lang, lang_file, en_strings, en_keys,
+                    added_keys, changed_keys, deleted_keys,
+                    locales_dir, update_data, memory, preloaded.get(lang), en_signatures
+                )
+        finally:
+            if memory:
+                memory.close()
+    else:
+        # Une langue par tâche ; les données EN sont envoyées une fois par processus
+        shared = (en_strings, en_keys, added_keys, changed_keys, deleted_keys,
+                  update_data, en_signatures)
+        initargs = (shared, get_memory_path(), get_parse_cache_dir(),
+                    sys.stdout is not sys.__stdout__)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            futures = [
+                pool.submit(_sync_language_worker, lang, lang_file, locales_dir, preloaded.get(lang))
+                for lang, lang_file in zip(languages, lang_files)
+            ]
+            # Résultats collectés dans l'ordre de soumission (stable)
+            for lang, future in zip(languages, futures):
+                results[lang] = future.result()
+    
+    # Couverture : seules les langues écrites sont recalculées
+    update_coverage(locales_dir, [lang for lang, r in results.items() if r['written']], en_strings)
     
     return results
 
@@ -94,24 +213,53 @@ def run_sync(reference_path: str = None, locales_dir: str = None,
 def _sync_language(lang: str, lang_file: str, en_strings: Dict[str, str],
                    en_keys: Set[str], added_keys: Set[str], changed_keys: Set[str],
                    deleted_keys: Set[str], output_dir: str,
-                   update_data: Dict = None) -> Dict:
-    """Synchronise une langue avec le fichier EN."""
+                   update_data: Dict = None,
+                   memory: TranslationMemory = None,
+                   lang_strings: Dict[str, str] = None,
+                   en_signatures: Dict[str, Tuple[str, ...]] = None) -> Dict:
+    """
+    Synchronise une langue avec le fichier EN.
+    
+    Si une mémoire de traduction est fournie, les clés [NEW] dont le texte EN
+    y est connu sont pré-remplies, et les traductions conservées y sont enregistrées.
+    
+    Les traductions conservées dont les placeholders diffèrent de l'EN sont
+    marquées [NEEDS_REVIEW] ; une traduction de la mémoire non conforme n'est
+    pas utilisée.
     
-    # Charger la langue actuelle
-    if os.path.isfile(lang_file):
+    Le résultat est fusionné à trois voies avec le contenu actuel du fichier,
+    la base étant le dernier état écrit (base enregistrée, comme INJECT ; à
+    défaut, les chaînes lues) : une édition directe faite pendant SYNC ou
+    depuis la lecture des chaînes préchargées par PIPELINE n'est pas écrasée.
+    L'ensemble des clés reste celui de l'EN.
+    """
+    
+    # Charger la langue actuelle (sauf si déjà parsée par l'appelant)
+    if lang_strings is not None:
+        lang_strings = dict(lang_strings)
+    elif os.path.isfile(lang_file):
         lang_strings = parse_translation_file(lang_file)
-        # Créer backup
-        shutil.copy2(lang_file, lang_file + '.bak')
     else:
         lang_strings = {}
     
     lang_keys = set(lang_strings.keys())
+    if en_signatures is None:
+        en_signatures = placeholder_signatures(en_strings)
     
     # Calculer les différences
     missing_in_lang = en_keys - lang_keys
     extra_in_lang = lang_keys - en_keys
     common_keys = en_keys & lang_keys
     
+    # Clés renommées (COMPARE) : la traduction suit la nouvelle clé
+    renamed = {}
+    if update_data:
+        for new_key, rename in update_data.get('renamed', {}).items():
+            if new_key in missing_in_lang and rename['from'] in extra_in_lang:
+                renamed[new_key] = rename['from']
+    missing_in_lang -= renamed.keys()
+    extra_in_lang -= set(renamed.values())
+    
     # Construire le nouveau dictionnaire
     new_strings = {}
     markers = {}
@@ -120,6 +268,9 @@ def _sync_language(lang: str, lang_file: str, en_strings: Dict[str, str],
         'kept': 0,
         'added': 0,
         'needs_review': 0,
+        'renamed': 0,
+        'from_memory': 0,
+        'placeholders': 0,
         'removed': 0
     }
     
@@ -133,12 +284,49 @@ def _sync_language(lang: str, lang_file: str, en_strings: Dict[str, str],
             markers[key] = f"-- ## NEEDS_REVIEW ## Texte EN modifié"
             stats['needs_review'] += 1
     
-    # Clés manquantes : ajouter avec valeur EN
+    # Clés renommées : reprendre la traduction de l'ancienne clé
+    for new_key, old_key in renamed.items():
+        new_strings[new_key] = lang_strings[old_key]
+        stats['renamed'] += 1
+    
+    # Traductions déjà connues pour les clés manquantes
+    known = {}
+    if memory and missing_in_lang:
+        known = memory.lookup_many((en_strings[key] for key in missing_in_lang), lang)
+    
+    # Clés manquantes : ajouter avec valeur EN (ou traduction de la mémoire)
     for key in missing_in_lang:
-        new_strings[key] = en_strings[key]  # Valeur EN par défaut
-        markers[key] = f"-- ## NEW ## À traduire"
+        en_value = en_strings[key]
+        if en_value in known and not check_placeholders(en_signatures[key], known[en_value]):
+            new_strings[key] = known[en_value]
+            markers[key] = f"-- ## NEW ## Pré-rempli (mémoire de traduction)"
+            stats['from_memory'] += 1
+        else:
+            new_strings[key] = en_value  # Valeur EN par défaut
+            markers[key] = f"-- ## NEW ## À traduire"
         stats['added'] += 1
     
+    # Placeholders des traductions conservées (texte EN inchangé)
+    unchanged = (common_keys - changed_keys) | renamed.keys()
+    issues = find_placeholder_issues(en_signatures, {key: new_strings[key] for key in unchanged})
+    for key, issue in issues.items():
+        markers[key] = PLACEHOLDER_MARKER.format(detail=issue.describe())
+    stats['placeholders'] = len(issues)
+    
+    # Alimenter la mémoire avec les traductions conservées (texte EN actuel),
+    # sauf celles encore marquées à relire dans le fichier (pré-traduites, etc.)
+    if memory:
+        unreviewed = set()
+        if os.path.isfile(lang_file):
+            with open(lang_file, 'r', encoding='utf-8') as f:
+                unreviewed = {key for key, marker in read_markers(f.read()).items()
+                              if marker.startswith(UNREVIEWED_MARKER_PREFIXES)}
+        memory.store_many(lang, (
+            (en_strings[key], new_strings[key], key)
+            for key in unchanged
+            if key not in unreviewed and (key not in issues or not issues[key].blocking)
+        ))
+    
     # Clés en trop : ne pas copier (= supprimées)
     stats['removed'] = len(extra_in_lang)
     
@@ -149,14 +337,34 @@ def _sync_language(lang: str, lang_file: str, en_strings: Dict[str, str],
         'source': 'SYNC'
     }
     
-    # Écrire le fichier
+    # Fusion à trois voies : base (dernier état écrit) / fichier actuel / SYNC
     output_file = os.path.join(output_dir, f'TranslatedStrings_{lang}.txt')
-    write_translation_file(output_file, lang, new_strings, markers, metadata)
+    conflicts = {}
+    if os.path.isfile(output_file):
+        base = load_base_snapshot(output_file)
+        if base is None:
+            base = lang_strings
+        new_strings, conflicts = merge_synced_strings(
+            base, lang_strings, parse_translation_file(output_file), new_strings
+        )
+        markers.update(conflict_markers(output_file, conflicts))
+        write_conflicts(output_file, conflicts, 'SYNC')
+    
+    # Écrire le fichier (backup .bak seulement s'il change)
+    written = write_translation_file(output_file, lang, new_strings, markers, metadata,
+                                     backup=True)
+    save_base_snapshot(output_file, next_base(new_strings, conflicts))
     
     return {
+        'written': written,
+        'conflicts': len(conflicts),
         'kept': stats['kept'],
         'added': stats['added'],
         'needs_review': stats['needs_review'],
+        'renamed': stats['renamed'],
+        'from_memory': stats['from_memory'],
+        'placeholders': stats['placeholders'],
+        'placeholder_keys': sorted(issues),
         'removed': stats['removed'],
         'total': len(new_strings),
         'added_keys': sorted(list(missing_in_lang)),
@@ -185,9 +393,20 @@ def generate_sync_report(results: Dict[str, Dict]) -> str:
         lines.append(f"{c.CYAN}[{lang.upper()}]{c.RESET}")
         lines.append(f"  {c.KEY}Clés conservées  {c.RESET}: {c.WHITE}{data['kept']}{c.RESET}")
         lines.append(f"  {c.KEY}Clés ajoutées    {c.RESET}: {c.GREEN}{data['added']}{c.RESET}  {c.DIM}[NEW] à traduire{c.RESET}")
+        if data.get('from_memory'):
+            lines.append(f"  {c.KEY}  dont mémoire   {c.RESET}: {c.GREEN}{data['from_memory']}{c.RESET}  {c.DIM}pré-remplies (à vérifier){c.RESET}")
         lines.append(f"  {c.KEY}Clés à réviser   {c.RESET}: {c.YELLOW}{data['needs_review']}{c.RESET}  {c.DIM}[NEEDS_REVIEW]{c.RESET}")
+        if data.get('placeholders'):
+            lines.append(f"  {c.KEY}Placeholders     {c.RESET}: {c.YELLOW}{data['placeholders']}{c.RESET}  {c.DIM}différents de l'EN [NEEDS_REVIEW]{c.RESET}")
+        if data.get('renamed'):
+            lines.append(f"  {c.KEY}Clés renommées   {c.RESET}: {c.CYAN}{data['renamed']}{c.RESET}  {c.DIM}traduction conservée{c.RESET}")
         lines.append(f"  {c.KEY}Clés supprimées  {c.RESET}: {c.RED}{data['removed']}{c.RESET}")
         lines.append(f"  {c.KEY}Total            {c.RESET}: {c.WHITE}{data['total']}{c.RESET}")
+        if not data.get('written', True):
+            lines.append(f"  {c.DIM}Fichier inchangé (non réécrit){c.RESET}")
+        if data.get('conflicts'):
+            lines.append(f"  {c.WARNING}[ATTENTION]{c.RESET} {data['conflicts']} conflit(s) : "
+                         f"{c.DIM}voir CONFLICTS_{lang}.txt{c.RESET}")
 
         if data['added_keys']:
             lines.append(f"  {c.DIM}Nouvelles clés:{c.RESET}")
@@ -273,7 +492,7 @@ def menu_sync(plugin_path: str = ""):
 
     try:
         print(f"\n{c.INFO}[INFO]{c.RESET} Synchronisation en cours...")
-        results = run_sync(ref_path, locales_dir, update_dir)
+        results = run_sync(ref_path, locales_dir, update_dir, plugin_path=plugin_path)
 
         if not results:
             print(c.warning("Aucune langue étrangère trouvée."))
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+TM_workspace.py
+
+Module WORKSPACE pour TranslationManager.
+Synchronise plusieurs plugins en une passe et propage entre eux les
+traductions des textes EN identiques.
+
+1. Chaque fichier de chaque plugin est lu une seule fois (pool de processus
+   au-delà de PARALLEL_MIN_BYTES, comme SYNC)
+2. Un index combiné par langue associe chaque texte EN normalisé à sa
+   traduction majoritaire (seules les traductions relues votent : différentes
+   de l'EN et sans marqueur ; les égalités ne sont pas tranchées)
+3. Chaque fichier de langue est synchronisé avec l'EN de son plugin (clés
+   ajoutées / supprimées comme SYNC) ; les clés non traduites dont le texte EN
+   est dans l'index reçoivent la traduction, marquée [NEW] à vérifier. Comme
+   SYNC, le résultat est fusionné à trois voies avec le fichier actuel (base
+   enregistrée) : une édition directe n'est pas écrasée
+"""
+
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from TM_common import parse_translation_file, write_translation_file, find_languages, c
+from TM_memory import normalize_text, get_memory_path
+from TM_merge import (
+    merge_synced_strings, next_base, load_base_snapshot, save_base_snapshot,
+    write_conflicts, conflict_markers
+)
+from TM_parser import parse_lines, get_parse_cache_dir
+from TM_sync import default_jobs, _init_worker
+from TM_writer import read_markers
+from TM_coverage import update_coverage
+from common.placeholders import placeholder_signature, check_placeholders
+
+
+# Marqueurs des clés ajoutées ou reprises d'un autre plugin
+NEW_MARKER = "-- ## NEW ## À traduire"
+PROPAGATED_MARKER = "-- ## NEW ## Repris de {plugin} (à vérifier)"
+
+
+def plugin_names(plugin_paths: List[str]) -> Dict[str, str]:
+    """{nom: chemin} (nom du dossier, chemin complet si deux plugins portent le même nom)."""
+    basenames = Counter(os.path.basename(os.path.normpath(path)) for path in plugin_paths)
+    names = {}
+    for path in plugin_paths:
+        name = os.path.basename(os.path.normpath(path))
+        names[name if basenames[name] == 1 else os.path.normpath(path)] = path
+    return names
+
+
+def load_plugin(locales_dir: str, languages: List[str] = None) -> Dict:
+    """
+    Lit les fichiers d'un plugin (une lecture par fichier).
+
+    Returns:
+        {'en': {clé: valeur}, 'languages': {langue: (chaînes, marqueurs)}}
+    """
+    en_file = os.path.join(locales_dir, 'TranslatedStrings_en.txt')
+    if not os.path.isfile(en_file):
+        raise FileNotFoundError(f"Fichier EN introuvable: {en_file}")
+
+    loaded = {}
+    for lang in find_languages(locales_dir, exclude_en=True):
+        if languages and lang not in languages:
+            continue
+        with open(os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt'), 'r', encoding='utf-8') as f:
+            content = f.read()
+        loaded[lang] = (parse_lines(content.splitlines()).strings, read_markers(content))
+
+    return {'en': parse_translation_file(en_file), 'languages': loaded}
+
+
+def build_workspace_index(plugins: Dict[str, Dict]) -> Dict[str, Dict[str, Tuple[str, str]]]:
+    """
+    Index combiné des traductions relues de tous les plugins.
+
+    Args:
+        plugins: {nom: données de load_plugin}
+
+    Returns:
+        {langue: {texte EN normalisé: (traduction majoritaire, plugin d'origine)}}
+    """
+    votes = defaultdict(lambda: defaultdict(Counter))
+    origins = {}
+    for name, data in plugins.items():
+        en_strings = data['en']
+        for lang, (strings, markers) in data['languages'].items():
+            for key, value in strings.items():
+                en_value = en_strings.get(key)
+                if en_value is None or key in markers or not value.strip() or value == en_value:
+                    continue
+                text = normalize_text(en_value)
+                votes[lang][text][value] += 1
+                origins.setdefault((lang, text, value), name)
+
+    index = {}
+    for lang, texts in votes.items():
+        index[lang] = {}
+        for text, counter in texts.items():
+            ranked = counter.most_common(2)
+            if len(ranked) == 1 or ranked[0][1] > ranked[1][1]:
+                index[lang][text] = (ranked[0][0], origins[(lang, text, ranked[0][0])])
+    return index
+
+
+def sync_plugin_language(locales_dir: str, lang: str, en_strings: Dict[str, str],
+                         lang_strings: Dict[str, str], markers: Dict[str, str],
+                         index: Dict[str, Tuple[str, str]], dry_run: bool = False) -> Dict:
+    """
+    Synchronise une langue d'un plugin avec son EN et l'index du workspace.
+
+    Les traductions existantes et leurs marqueurs sont conservés ; une clé
+    manquante ou identique à l'EN reprend la traduction de l'index si ses
+    placeholders sont conformes.
+
+    Le résultat est fusionné avec le contenu actuel du fichier comme dans SYNC
+    (base enregistrée, à défaut les chaînes lues) ; les conflits sont écrits
+    dans CONFLICTS_xx.txt.
+    """
+    new_strings = {}
+    new_markers = {}
+    stats = {'kept': 0, 'added': 0, 'propagated': 0}
+
+    for key, en_value in en_strings.items():
+        value = lang_strings.get(key)
+        if value is not None and value != en_value:
+            new_strings[key] = value
+            if key in markers:
+                new_markers[key] = markers[key]
+            stats['kept'] += 1
+            continue
+
+        if value is None:
+            stats['added'] += 1
+        match = index.get(normalize_text(en_value))
+        if match and not check_placeholders(placeholder_signature(en_value), match[0]):
+            new_strings[key] = match[0]
+            new_markers[key] = PROPAGATED_MARKER.format(plugin=match[1])
+            stats['propagated'] += 1
+        elif value is None:
+            new_strings[key] = en_value
+            new_markers[key] = NEW_MARKER
+        else:
+            new_strings[key] = value
+            if key in markers:
+                new_markers[key] = markers[key]
+            stats['kept'] += 1
+
+    stats['removed'] = len(lang_strings.keys() - en_strings.keys())
+    stats['total'] = len(new_strings)
+    stats['written'] = False
+    stats['conflicts'] = 0
+
+    if not dry_run:
+        # Fusion à trois voies : base (dernier état écrit) / fichier actuel / WORKSPACE
+        lang_file = os.path.join(locales_dir, f'TranslatedStrings_{lang}.txt')
+        conflicts = {}
+        if os.path.isfile(lang_file):
+            base = load_base_snapshot(lang_file)
+            if base is None:
+                base = lang_strings
+            new_strings, conflicts = merge_synced_strings(
+                base, lang_strings, parse_translation_file(lang_file), new_strings
+            )
+            new_markers.update(conflict_markers(lang_file, conflicts))
+            write_conflicts(lang_file, conflicts, 'WORKSPACE')
+        stats['conflicts'] = len(conflicts)
+
+        metadata = {'new_keys': stats['added'], 'source': 'WORKSPACE'}
+        stats['written'] = write_translation_file(lang_file, lang, new_strings, new_markers,
+                                                  metadata, backup=True)
+        save_base_snapshot(lang_file, next_base(new_strings, conflicts))
+    return stats
+
+
+def run_workspace_sync(plugin_paths: List[str], languages: List[str] = None,
+                       jobs: int = None, dry_run: bool = False) -> Dict:
+    """
+    Synchronise un ensemble de plugins en une passe.
+
+    Args:
+        plugin_paths: Répertoires des plugins (contenant TranslatedStrings_*.txt)
+        languages: Langues à traiter (défaut: toutes)
+        jobs: Nombre de processus (défaut: nombre de cœurs si les fichiers de
+              langues dépassent PARALLEL_MIN_BYTES, sinon 1 = séquentiel)
+        dry_run: Calculer sans écrire
+
+    Returns:
+        {'plugins': {nom: {langue: statistiques}}, 'index': {langue: nombre de textes EN}}
+    """
+    names = plugin_names(plugin_paths)
+    if jobs is None:
+        jobs = default_jobs([
+            os.path.join(path, f'TranslatedStrings_{lang}.txt')
+            for path in names.values() for lang in find_languages(path, exclude_en=False)
+        ])
+    jobs = max(1, jobs)
+
+    # Même initialisation que les processus de SYNC (cache de parsing, stdout de --job)
+    pool: Optional[ProcessPoolExecutor] = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=((), get_memory_path(), get_parse_cache_dir(),
+                                             sys.stdout is not sys.__stdout__))
+    try:
+        def _run(function, tasks):
+            if pool is None:
+                return [function(*task) for task in tasks]
+            futures = [pool.submit(function, *task) for task in tasks]
+            return [future.result() for future in futures]
+
+        # 1. Lecture de tous les fichiers
+        loaded = dict(zip(names, _run(load_plugin, [(path, languages) for path in names.values()])))
+
+        # 2. Index combiné par langue
+        index = build_workspace_index(loaded)
+
+        # 3. Synchronisation : une tâche par plugin et par langue
+        tasks = [
+            (names[name], lang, data['en'], strings, markers, index.get(lang, {}), dry_run)
+            for name, data in loaded.items()
+            for lang, (strings, markers) in sorted(data['languages'].items())
+        ]
+        outcomes = iter(_run(sync_plugin_language, tasks))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    results = {}
+    for name, data in loaded.items():
+        results[name] = {lang: next(outcomes) for lang in sorted(data['languages'])}
+        written = [lang for lang, stats in results[name].items() if stats['written']]
+        if written:
+            update_coverage(names[name], written, data['en'])
+
+    return {
+        'plugins': results,
+        'index': {lang: len(texts) for lang, texts in sorted(index.items())}
+    }
+
+
+def generate_workspace_report(result: Dict) -> str:
+    """Génère le rapport de synchronisation du workspace avec couleurs."""
+    lines = []
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append(f"{c.TITLE}SYNCHRONISATION DU WORKSPACE{c.RESET}")
+    lines.append(f"{c.HEADER}{'=' * 70}{c.RESET}")
+    lines.append("")
+
+    total_propagated = 0
+    for name, languages in result['plugins'].items():
+        lines.append(f"{c.CYAN}{name}{c.RESET}")
+        for lang, stats in languages.items():
+            total_propagated += stats['propagated']
+            status = "" if stats['written'] else f"  {c.DIM}(non réécrit){c.RESET}"
+            lines.append(f"  {c.KEY}[{lang.upper()}]{c.RESET} "
+                         f"{c.GREEN}{stats['propagated']}{c.RESET} reprises, "
+                         f"{c.YELLOW}{stats['added']}{c.RESET} ajoutées, "
+                         f"{c.RED}{stats['removed']}{c.RESET} supprimées, "
+                         f"{c.WHITE}{stats['total']}{c.RESET} clés{status}")
+        if not languages:
+            lines.append(f"  {c.DIM}(aucune langue){c.RESET}")
+        lines.append("")
+
+    lines.append(f"{c.separator()}")
+    lines.append(f"  {c.KEY}Plugins          {c.RESET}: {c.WHITE}{len(result['plugins'])}{c.RESET}")
+    shared = ', '.join(f"{lang}={count}" for lang, count in result['index'].items()) or '-'
+    lines.append(f"  {c.KEY}Textes indexés   {c.RESET}: {c.WHITE}{shared}{c.RESET}")
+    lines.append(f"  {c.KEY}Reprises         {c.RESET}: {c.GREEN}{total_propagated}{c.RESET}")
+
+    return "\n".join(lines)
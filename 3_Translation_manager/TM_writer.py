@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+TM_writer.py
+
+Écriture incrémentale des fichiers TranslatedStrings_*.txt pour TranslationManager.
+
+Le fichier existant est chargé dans un modèle ligne à ligne (clés,
+commentaires, lignes vides) puis seules les lignes concernées sont modifiées :
+
+- Valeur modifiée : la ligne de la clé est remplacée sur place
+- Clé supprimée : sa ligne (et son marqueur ## NEW/NEEDS_REVIEW/... ##) est retirée
+- Nouvelle clé : insérée dans le bloc de sa catégorie, à sa place alphabétique
+  (nouveau bloc en fin de fichier si la catégorie n'existe pas encore)
+- Commentaires des traducteurs, ordre des clés et lignes inconnues conservés
+
+L'entête (-- Total keys, -- Generated, ...) est mis à jour s'il est présent.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from TM_parser import parse_line
+
+
+# Marqueurs gérés par TranslationManager (ex: "-- ## NEW ## À traduire") ; les
+# autres commentaires, même commençant par "-- ## ", appartiennent aux traducteurs
+MARKER_KINDS = ('NEW', 'NEEDS_REVIEW', 'CONFLICT', 'HARMONIZED')
+MARKER_PREFIXES = tuple(f"-- ## {kind} ##" for kind in MARKER_KINDS)
+
+# Ligne de séparation encadrant l'entête
+HEADER_RULE_PREFIX = "-- ====="
+
+
+def key_category(key: str) -> str:
+    """
+    Catégorie d'une clé ($$$/Prefix/Category/Name → Category).
+
+    Les clés sans catégorie ($$$/Prefix/Name) sont rangées dans 'General'.
+    """
+    parts = key.split('/')
+    return parts[2] if len(parts) >= 4 else 'General'
+
+
+class LocaleDocument:
+    """
+    Modèle ligne à ligne d'un fichier TranslatedStrings_*.txt.
+
+    Usage:
+        doc = LocaleDocument(content)
+        doc.apply(translations, markers)
+        new_content = doc.render()
+    """
+
+    def __init__(self, content: str):
+        self.lines: List[Optional[str]] = content.splitlines(keepends=True)
+        if self.lines and not self.lines[-1].endswith('\n'):
+            self.lines[-1] += '\n'
+
+        # Clé -> index de sa ligne (première occurrence)
+        self.key_index: Dict[str, int] = {}
+        # Index des doublons (supprimés à l'écriture)
+        self.duplicates: List[int] = []
+
+        for index, line in enumerate(self.lines):
+            parsed = parse_line(line.strip())
+            if not parsed:
+                continue
+            if parsed[0] in self.key_index:
+                self.duplicates.append(index)
+            else:
+                self.key_index[parsed[0]] = index
+
+        # Lignes insérées avant / après un index existant
+        self._before = defaultdict(list)
+        self._after = defaultdict(list)
+        # Marqueurs ajoutés au-dessus d'une clé existante
+        self._markers: Dict[int, str] = {}
+        # Blocs de nouvelles catégories (fin de fichier)
+        self._new_blocks: Dict[str, List[str]] = {}
+
+    def _marker_index(self, key_index: int) -> Optional[int]:
+        """Index du marqueur placé juste au-dessus d'une clé, s'il existe."""
+        previous = key_index - 1
+        if previous >= 0 and self.lines[previous] is not None \
+                and self.lines[previous].startswith(MARKER_PREFIXES):
+            return previous
+        return None
+
+    def _key_lines(self, key: str, value: str, marker: str = None) -> List[str]:
+        lines = [f'{marker}\n'] if marker else []
+        lines.append(f'"{key}={value}"\n')
+        return lines
+
+    def apply(self, translations: Dict[str, str], markers: Dict[str, str] = None) -> None:
+        """
+        Applique l'état souhaité au document.
+
+        Args:
+            translations: Dict {clé: valeur} complet (les clés absentes sont retirées)
+            markers: Dict {clé: marqueur} ; les marqueurs des autres clés sont retirés
+        """
+        markers = markers or {}
+
+        for index in self.duplicates:
+            self._remove_key_line(index)
+
+        # Clés existantes : mise à jour sur place ou suppression
+        for key, index in self.key_index.items():
+            if key not in translations:
+                self._remove_key_line(index)
+                continue
+
+            current = parse_line(self.lines[index].strip())
+            if current[1] != translations[key]:
+                self.lines[index] = f'"{key}={translations[key]}"\n'
+
+            marker_index = self._marker_index(index)
+            wanted = markers.get(key)
+            if marker_index is not None:
+                if not wanted:
+                    self.lines[marker_index] = None
+                elif self.lines[marker_index].rstrip('\n') != wanted:
+                    self.lines[marker_index] = f'{wanted}\n'
+            elif wanted:
+                self._markers[index] = f'{wanted}\n'
+
+        # Nouvelles clés : insertion dans le bloc de leur catégorie
+        existing_by_category = defaultdict(list)
+        for key in sorted(self.key_index):
+            existing_by_category[key_category(key)].append(key)
+
+        new_keys = sorted(key for key in translations if key not in self.key_index)
+        for key in new_keys:
+            category = key_category(key)
+            lines = self._key_lines(key, translations[key], markers.get(key))
+            neighbours = existing_by_category.get(category)
+
+            if not neighbours:
+                self._new_blocks.setdefault(category, []).extend(lines)
+                continue
+
+            position = bisect_left(neighbours, key)
+            if position > 0:
+                # Après la clé existante précédente (ordre alphabétique)
+                self._after[self.key_index[neighbours[position - 1]]].extend(lines)
+            else:
+                # Avant la première clé de la catégorie (et son marqueur)
+                anchor = self.key_index[neighbours[0]]
+                marker_index = self._marker_index(anchor)
+                self._before[anchor if marker_index is None else marker_index].extend(lines)
+
+    def _remove_key_line(self, index: int) -> None:
+        marker_index = self._marker_index(index)
+        if marker_index is not None:
+            self.lines[marker_index] = None
+        self.lines[index] = None
+
+    def replace_header(self, header_lines: List[str]) -> None:
+        """
+        Remplace les lignes d'information de l'entête (entre les deux
+        premières lignes -- =====). Sans entête, le fichier est laissé tel quel.
+        """
+        rules = []
+        for index, line in enumerate(self.lines):
+            if line is None:
+                continue
+            if line.startswith(HEADER_RULE_PREFIX):
+                rules.append(index)
+                if len(rules) == 2:
+                    break
+            elif not line.startswith('--'):
+                break
+
+        if len(rules) < 2:
+            return
+
+        start, end = rules
+        for index in range(start + 1, end):
+            self.lines[index] = None
+        self._after[start] = list(header_lines) + self._after[start]
+
+    def render(self) -> str:
+        """Reconstruit le contenu du fichier."""
+        out = []
+        for index, line in enumerate(self.lines):
+            out.extend(self._before.get(index, ()))
+            if index in self._markers:
+                out.append(self._markers[index])
+            if line is not None:
+                out.append(line)
+            out.extend(self._after.get(index, ()))
+
+        for category in sorted(self._new_blocks):
+            if out and out[-1].strip():
+                out.append("\n")
+            out.append(f"-- {category}\n")
+            out.extend(self._new_blocks[category])
+            out.append("\n")
+
+        return ''.join(out)
+
+
+def patch_translation_content(content: str, translations: Dict[str, str],
+                              markers: Dict[str, str] = None,
+                              header_lines: List[str] = None) -> str:
+    """
+    Applique des traductions à un contenu existant en modifiant le minimum de lignes.
+
+    Args:
+        content: Contenu actuel du fichier
+        translations: Dict {clé: valeur} complet
+        markers: Dict {clé: marqueur}
+        header_lines: Nouvelles lignes d'information de l'entête (optionnel)
+
+    Returns:
+        Nouveau contenu
+    """
+    document = LocaleDocument(content)
+    document.apply(translations, markers)
+    if header_lines is not None:
+        document.replace_header(header_lines)
+    return document.render()
+
+
+def read_markers(content: str) -> Dict[str, str]:
+    """
+    Marqueurs présents dans un contenu existant.
+
+    Returns:
+        Dict {clé: marqueur} (ex: "-- ## NEW ## À traduire")
+    """
+    document = LocaleDocument(content)
+    markers = {}
+    for key, index in document.key_index.items():
+        marker_index = document._marker_index(index)
+        if marker_index is not None:
+            markers[key] = document.lines[marker_index].rstrip('\n')
+    return markers
@@ -12,6 +12,16 @@ COMMANDES
   extract   Génère mini fichiers TRANSLATE_xx.txt pour traduction
   inject    Réinjecte les traductions (valeur EN par défaut si non traduit)
   sync      Met à jour les langues avec EN
+  pipeline  COMPARE + EXTRACT + SYNC en une passe
+  pretranslate  Pré-traduit les clés non traduites (traduction automatique)
+  check     Vérifie le glossaire (termes imposés / interdits) dans toutes les langues
+  consistency  Même texte EN traduit différemment (option: harmoniser)
+  prune     Clés plus référencées dans les sources .lua (option: supprimer)
+  coverage  Couverture par langue et catégorie (tableau, CSV, JSON)
+  workspace  Synchronise plusieurs plugins et partage les traductions communes
+  pseudo    Génère une langue pseudo-localisée (tests de mise en page)
+
+  --job fichier.json  Suite d'opérations sans interaction, résultat JSON sur stdout
 
 ================================================================================
 WORKFLOW
@@ -43,9 +53,21 @@ Mode interactif:
 
 Mode CLI (avec --plugin-path pour structure __i18n_tmp__):
     python TranslationManager.py compare --old ancien.txt --new nouveau.txt --plugin-path ./plugin.lrplugin
+    python TranslationManager.py compare --plugin-path ./plugin.lrplugin --from latest~1 --to latest
     python TranslationManager.py extract --plugin-path ./plugin.lrplugin --locales ./Locales
     python TranslationManager.py inject --plugin-path ./plugin.lrplugin --locales ./Locales
     python TranslationManager.py sync --plugin-path ./plugin.lrplugin --locales ./Locales
+    python TranslationManager.py pipeline --old ancien.txt --new nouveau.txt --plugin-path ./plugin.lrplugin --locales ./Locales
+    python TranslationManager.py pretranslate --backend dictionary --dictionary glossaire.json --locales ./Locales
+    python TranslationManager.py check --glossary glossaire.json --locales ./Locales
+    python TranslationManager.py consistency --locales ./Locales --apply
+    python TranslationManager.py prune --plugin-path ./plugin.lrplugin --remove
+    python TranslationManager.py coverage --locales ./Locales --format csv --output coverage.csv
+    python TranslationManager.py workspace --plugins ./a.lrplugin ./b.lrplugin
+    python TranslationManager.py pseudo --ref ./Locales/TranslatedStrings_en.txt --lang de --expansion 50%
+
+Mode job (CI, sans interaction):
+    python TranslationManager.py --job release.json > result.json
 
 Mode CLI (legacy):
     python TranslationManager.py compare --old ancien.txt --new nouveau.txt
@@ -70,12 +92,25 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.paths import get_tool_output_path, find_latest_tool_output
 from common.colors import Colors
+from common.snapshots import SnapshotStore
 
-from TM_common import clear_screen, print_header
-from TM_compare import run_compare, menu_compare
-from TM_extract import run_extract, run_extract_all, menu_extract
+from TM_common import clear_screen, print_header, enable_parse_cache, load_update_json
+from TM_memory import set_memory_path, DEFAULT_MEMORY_PATH
+from TM_compare import run_compare, run_compare_snapshots, menu_compare
+from TM_extract import run_extract, run_extract_chunks, run_extract_all, menu_extract
 from TM_inject import run_inject, run_inject_from_dir, menu_inject
 from TM_sync import run_sync, generate_sync_report, menu_sync
+from TM_pipeline import run_pipeline
+from TM_pretranslate import run_pretranslate, create_backend, DEFAULT_MT_CACHE_PATH
+from TM_glossary import run_check, generate_check_report
+from TM_consistency import run_consistency, generate_consistency_report
+from TM_prune import run_prune, generate_prune_report
+from TM_coverage import (
+    update_coverage, coverage_matrix, render_coverage_table, render_coverage_csv, render_coverage_json
+)
+from TM_workspace import run_workspace_sync, generate_workspace_report
+from TM_pseudo import run_pseudo, parse_expansion, generate_pseudo_report, DEFAULT_EXPANSION
+from TM_jobs import run_job_file
 
 # Instance couleurs
 c = Colors()
@@ -116,6 +151,9 @@ def main_menu(default_plugin_path: str = ""):
             plugin_path = ""
             input(f"{c.DIM}Appuyez sur Entrée pour continuer...{c.RESET}")
 
+    enable_parse_cache(plugin_path)
+    set_memory_path(DEFAULT_MEMORY_PATH)
+
     while True:
         clear_screen()
         print_header()
@@ -187,6 +225,8 @@ def main_menu(default_plugin_path: str = ""):
                 plugin_path = ""
                 print(c.success("Plugin désactivé - utilise répertoires locaux"))
 
+            enable_parse_cache(plugin_path)
+
             input(f"\n{c.DIM}Appuyez sur Entrée pour continuer...{c.RESET}")
         elif choice == '0':
             print(f"\n{c.SUCCESS}  Au revoir!{c.RESET}")
@@ -233,14 +273,21 @@ Exemples:
         """
     )
     
+    parser.add_argument('--job', help='Fichier job JSON (suite d operations, resultat JSON sur stdout)')
+    
     subparsers = parser.add_subparsers(dest='command', help='Commande')
     
     # compare
     compare_parser = subparsers.add_parser('compare', help='Compare deux versions EN')
-    compare_parser.add_argument('--old', required=True, help='Ancien fichier EN')
-    compare_parser.add_argument('--new', required=True, help='Nouveau fichier EN')
+    compare_parser.add_argument('--old', help='Ancien fichier EN')
+    compare_parser.add_argument('--new', help='Nouveau fichier EN')
+    compare_parser.add_argument('--from', dest='from_snapshot',
+                                help='Ancien snapshot EN (id, prefixe, latest, latest~N ; requiert --plugin-path)')
+    compare_parser.add_argument('--to', dest='to_snapshot', help='Nouveau snapshot EN (defaut: latest)')
+    compare_parser.add_argument('--list', action='store_true', help='Lister les snapshots EN du plugin')
     compare_parser.add_argument('--plugin-path', help='Chemin plugin (sortie: __i18n_tmp__/3_TranslationManager/)')
     compare_parser.add_argument('--output', help='Override repertoire de sortie')
+    compare_parser.add_argument('--gzip', action='store_true', help='Ecrire UPDATE_en.json.gz (compresse)')
     
     # extract
     extract_parser = subparsers.add_parser('extract', help='Genere fichiers TRANSLATE_*.txt')
@@ -249,6 +296,9 @@ Exemples:
     extract_parser.add_argument('--locales', help='Repertoire des traductions existantes')
     extract_parser.add_argument('--lang', help='Langue specifique (defaut: toutes)')
     extract_parser.add_argument('--output', help='Override repertoire de sortie')
+    chunk_group = extract_parser.add_mutually_exclusive_group()
+    chunk_group.add_argument('--chunks', type=int, help='Decouper chaque langue en N parties (une par traducteur)')
+    chunk_group.add_argument('--chunk-size', type=int, help='Decouper en parties de K caracteres EN environ')
     
     # inject
     inject_parser = subparsers.add_parser('inject', help='Injecte les traductions')
@@ -265,11 +315,112 @@ Exemples:
     sync_parser.add_argument('--plugin-path', help='Chemin plugin (auto-detection __i18n_tmp__/)')
     sync_parser.add_argument('--locales', help='Repertoire des fichiers de langues')
     sync_parser.add_argument('--update', help='Dossier UPDATE (avec UPDATE_en.json)')
+    sync_parser.add_argument('--jobs', type=int, help='Nombre de processus (defaut: sequentiel sous 4 Mo de fichiers de langues, sinon nombre de coeurs)')
+    
+    # pipeline
+    pipeline_parser = subparsers.add_parser('pipeline', help='COMPARE + EXTRACT + SYNC en une passe')
+    pipeline_parser.add_argument('--old', required=True, help='Ancien fichier EN')
+    pipeline_parser.add_argument('--new', required=True, help='Nouveau fichier EN')
+    pipeline_parser.add_argument('--plugin-path', help='Chemin plugin (sortie: __i18n_tmp__/3_TranslationManager/)')
+    pipeline_parser.add_argument('--locales', help='Repertoire des fichiers de langues (defaut: celui du nouveau EN)')
+    pipeline_parser.add_argument('--output', help='Override repertoire de sortie')
+    pipeline_parser.add_argument('--jobs', type=int, help='Nombre de processus pour SYNC')
+    pipeline_parser.add_argument('--gzip', action='store_true', help='Ecrire UPDATE_en.json.gz (compresse)')
+    
+    # pretranslate
+    pretranslate_parser = subparsers.add_parser('pretranslate', help='Pre-traduit les cles non traduites (traduction automatique)')
+    pretranslate_parser.add_argument('--backend', required=True, help="Backend: pseudo, dictionary ou module:Classe")
+    pretranslate_parser.add_argument('--dictionary', help='Fichier JSON {langue: {EN: traduction}} (backend dictionary)')
+    pretranslate_parser.add_argument('--ref', help='Fichier EN de reference (defaut: celui de --locales)')
+    pretranslate_parser.add_argument('--locales', help='Repertoire des fichiers de langues')
+    pretranslate_parser.add_argument('--lang', help='Langues a traiter, separees par des virgules (defaut: toutes)')
+    pretranslate_parser.add_argument('--workers', type=int, default=4, help='Requetes simultanees (defaut: 4)')
+    pretranslate_parser.add_argument('--rate', type=float, help='Requetes par seconde (defaut: limite du backend)')
+    pretranslate_parser.add_argument('--no-cache', action='store_true', help='Ne pas utiliser le cache disque')
+    
+    # check
+    check_parser = subparsers.add_parser('check', help='Verifie le glossaire dans toutes les langues')
+    check_parser.add_argument('--glossary', required=True, help='Fichier glossaire JSON')
+    check_parser.add_argument('--ref', help='Fichier EN de reference (defaut: celui de --locales)')
+    check_parser.add_argument('--locales', help='Repertoire des fichiers de langues')
+    check_parser.add_argument('--lang', help='Langues a verifier, separees par des virgules (defaut: toutes)')
+    check_parser.add_argument('--json', help='Ecrire aussi les problemes dans ce fichier JSON')
+    
+    # consistency
+    consistency_parser = subparsers.add_parser('consistency', help='Traductions divergentes pour un meme texte EN')
+    consistency_parser.add_argument('--ref', help='Fichier EN de reference (defaut: celui de --locales)')
+    consistency_parser.add_argument('--locales', help='Repertoire des fichiers de langues')
+    consistency_parser.add_argument('--lang', help='Langues a analyser, separees par des virgules (defaut: toutes)')
+    consistency_parser.add_argument('--apply', action='store_true', help='Propager la traduction majoritaire')
+    
+    # prune
+    prune_parser = subparsers.add_parser('prune', help='Cles non referencees dans les sources .lua')
+    prune_parser.add_argument('--plugin-path', required=True, help='Chemin du plugin (sources .lua)')
+    prune_parser.add_argument('--locales', help='Repertoire des fichiers de langues (defaut: le plugin)')
+    prune_parser.add_argument('--exclude', help='Fichiers .lua a ignorer, separes par des virgules')
+    prune_parser.add_argument('--remove', action='store_true', help='Supprimer les cles mortes de tous les fichiers')
+    
+    # coverage
+    coverage_parser = subparsers.add_parser('coverage', help='Couverture par langue et par categorie')
+    coverage_parser.add_argument('--locales', required=True, help='Repertoire des fichiers de langues')
+    coverage_parser.add_argument('--lang', help='Langues a afficher, separees par des virgules (defaut: toutes)')
+    coverage_parser.add_argument('--format', choices=['table', 'csv', 'json'], default='table',
+                                 help='Format de sortie (defaut: table)')
+    coverage_parser.add_argument('--output', help='Ecrire le resultat dans ce fichier')
+    coverage_parser.add_argument('--summary', action='store_true', help='Totaux par langue seulement (table)')
+    coverage_parser.add_argument('--refresh', action='store_true', help='Recalculer toutes les langues')
+    
+    # workspace
+    workspace_parser = subparsers.add_parser('workspace', help='Synchronise plusieurs plugins (traductions partagees)')
+    workspace_parser.add_argument('--plugins', nargs='+', required=True, help='Repertoires des plugins')
+    workspace_parser.add_argument('--lang', help='Langues a traiter, separees par des virgules (defaut: toutes)')
+    workspace_parser.add_argument('--jobs', type=int, help='Nombre de processus (defaut: sequentiel sous 4 Mo de fichiers de langues, sinon nombre de coeurs)')
+    workspace_parser.add_argument('--dry-run', action='store_true', help='Afficher le resultat sans ecrire')
+    
+    # pseudo
+    pseudo_parser = subparsers.add_parser('pseudo', help='Genere une langue pseudo-localisee')
+    pseudo_parser.add_argument('--ref', required=True, help='Fichier EN de reference (ou repertoire)')
+    pseudo_parser.add_argument('--lang', required=True, help='Code langue du fichier genere (ex: de)')
+    pseudo_parser.add_argument('--output', help='Fichier genere (defaut: TranslatedStrings_<lang>.txt a cote du EN)')
+    pseudo_parser.add_argument('--expansion', default=f'{DEFAULT_EXPANSION:.0%}',
+                               help='Allongement du texte: 30%%, 50%%, 0.3... (defaut: 30%%)')
+    pseudo_parser.add_argument('--seed', default='', help='Graine du remplissage (defaut: aucune)')
+    pseudo_parser.add_argument('--no-accents', action='store_true', help='Ne pas accentuer les lettres')
+    pseudo_parser.add_argument('--no-brackets', action='store_true', help='Ne pas encadrer les textes par [ ]')
+    pseudo_parser.add_argument('--force', action='store_true', help='Remplacer un fichier existant')
+    
+    # Memoire de traduction (extract, inject, sync)
+    for sub in (extract_parser, inject_parser, sync_parser, pipeline_parser):
+        sub.add_argument('--memory', help=f'Base de la memoire de traduction (defaut: {DEFAULT_MEMORY_PATH})')
+        sub.add_argument('--no-memory', action='store_true', help='Desactiver la memoire de traduction')
     
     args = parser.parse_args()
+
+    if args.job:
+        sys.exit(run_job_file(args.job))
+
+    enable_parse_cache(getattr(args, 'plugin_path', None))
+    if not getattr(args, 'no_memory', False):
+        set_memory_path(getattr(args, 'memory', None) or DEFAULT_MEMORY_PATH)
     
     if args.command == 'compare':
         try:
+            if (args.list or args.from_snapshot) and not args.plugin_path:
+                print(c.error("--list et --from requierent --plugin-path"))
+                sys.exit(1)
+            if args.list:
+                snapshots = SnapshotStore(args.plugin_path).snapshots()
+                for snap in snapshots:
+                    print(f"  {c.VALUE}{snap['id']}{c.RESET}  {snap['created']}  "
+                          f"{c.KEY}{snap['source']:<9}{c.RESET} {snap['keys']:>5} clés  "
+                          f"{c.DIM}{snap.get('file') or ''}{c.RESET}")
+                if not snapshots:
+                    print(c.warning("Aucun snapshot EN enregistré."))
+                sys.exit(0)
+            if not args.from_snapshot and not (args.old and args.new):
+                print(c.error("--old et --new (ou --from/--to avec --plugin-path) requis"))
+                sys.exit(1)
+
             print(f"{c.INFO}[INFO]{c.RESET} Comparaison...")
             # Determiner le repertoire de sortie
             if args.output:
@@ -278,11 +429,14 @@ Exemples:
                 output_dir = get_tool_output_path(args.plugin_path, "TranslationManager", create=True)
             else:
                 output_dir = None  # run_compare creera un dossier timestampe local
-            output_dir = run_compare(args.old, args.new, output_dir)
-
-            import json
-            with open(os.path.join(output_dir, 'UPDATE_en.json'), 'r', encoding='utf-8') as f:
-                result = json.load(f)
+            if args.from_snapshot:
+                output_dir = run_compare_snapshots(args.plugin_path, args.from_snapshot,
+                                                   args.to_snapshot or 'latest', output_dir,
+                                                   compress=args.gzip)
+            else:
+                output_dir = run_compare(args.old, args.new, output_dir, compress=args.gzip,
+                                         plugin_path=args.plugin_path)
+            result = load_update_json(output_dir)
 
             summary = result['summary']
             print(f"\n{c.HEADER}{'=' * 60}{c.RESET}")
@@ -291,6 +445,7 @@ Exemples:
             print(f"{c.KEY}Clés ajoutées   {c.RESET}: {c.GREEN}{summary['added']}{c.RESET}")
             print(f"{c.KEY}Clés modifiées  {c.RESET}: {c.YELLOW}{summary['changed']}{c.RESET}")
             print(f"{c.KEY}Clés supprimées {c.RESET}: {c.RED}{summary['deleted']}{c.RESET}")
+            print(f"{c.KEY}Clés renommées  {c.RESET}: {c.CYAN}{summary.get('renamed', 0)}{c.RESET}")
             print(f"{c.KEY}Clés inchangées {c.RESET}: {c.DIM}{summary['unchanged']}{c.RESET}")
             print(c.success(f"Fichiers générés dans: {c.VALUE}{output_dir}{c.RESET}"))
 
@@ -316,11 +471,16 @@ Exemples:
                 sys.exit(1)
 
             output_dir = args.output
-            if args.lang:
+            if args.lang and not (args.chunks or args.chunk_size):
                 output_file = run_extract(update_dir, args.lang, args.locales, output_dir)
                 print(c.success(f"Généré: {c.VALUE}{output_file}{c.RESET}"))
             else:
-                generated = run_extract_all(update_dir, args.locales, output_dir)
+                if args.lang:
+                    generated = run_extract_chunks(update_dir, args.lang, args.locales, output_dir,
+                                                   args.chunks, args.chunk_size)
+                else:
+                    generated = run_extract_all(update_dir, args.locales, output_dir,
+                                                args.chunks, args.chunk_size)
                 print(f"\n{c.OK}[OK]{c.RESET} {c.WHITE}{len(generated)}{c.RESET} fichier(s) généré(s):")
                 for f in generated:
                     print(f"  {c.DIM}-{c.RESET} {c.VALUE}{os.path.basename(f)}{c.RESET}")
@@ -344,6 +504,10 @@ Exemples:
                 print(f"{c.INFO}[INFO]{c.RESET} Injection...")
                 stats = run_inject(args.translate, args.target, update_dir)
                 print(c.success(f"{c.GREEN}{stats['injected']}{c.RESET} traduites + {c.CYAN}{stats['from_en']}{c.RESET} EN par défaut"))
+                if stats.get('conflicts'):
+                    print(c.warning(f"{stats['conflicts']} conflit(s) avec des modifications directes: {stats['conflicts_file']}"))
+                if stats.get('placeholder_rejected') or stats.get('placeholder_flagged'):
+                    print(c.warning(f"Placeholders: {stats['placeholder_rejected']} rejetée(s), {stats['placeholder_flagged']} ordre différent [NEEDS_REVIEW]"))
             elif translate_dir and args.locales:
                 print(f"{c.INFO}[INFO]{c.RESET} Injection...")
                 results = run_inject_from_dir(translate_dir, args.locales, update_dir)
@@ -352,6 +516,12 @@ Exemples:
                         print(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.ERROR}[ERREUR]{c.RESET}: {stats['error']}")
                     else:
                         print(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.OK}[OK]{c.RESET}: {c.GREEN}{stats['injected']}{c.RESET} traduites + {c.CYAN}{stats['from_en']}{c.RESET} EN")
+                        if 'parts_total' in stats:
+                            print(f"  {c.DIM}Parties reçues: {len(stats['parts'])}/{stats['parts_total']} {stats['parts']}{c.RESET}")
+                        if stats.get('conflicts'):
+                            print(c.warning(f"{stats['conflicts']} conflit(s) avec des modifications directes: {stats['conflicts_file']}"))
+                        if stats.get('placeholder_rejected') or stats.get('placeholder_flagged'):
+                            print(c.warning(f"Placeholders: {stats['placeholder_rejected']} rejetée(s), {stats['placeholder_flagged']} ordre différent [NEEDS_REVIEW]"))
             else:
                 print(c.error("Spécifiez --translate + --target OU --translate-dir + --locales OU --plugin-path + --locales"))
                 sys.exit(1)
@@ -374,7 +544,8 @@ Exemples:
                 sys.exit(1)
 
             print(f"{c.INFO}[INFO]{c.RESET} Synchronisation...")
-            results = run_sync(args.ref, args.locales, update_dir)
+            results = run_sync(args.ref, args.locales, update_dir, jobs=args.jobs,
+                               plugin_path=args.plugin_path)
 
             if not results:
                 print(c.warning("Aucune langue étrangère trouvée."))
@@ -386,6 +557,165 @@ Exemples:
             print(c.error(f"Erreur: {e}"))
             sys.exit(1)
     
+    elif args.command == 'pipeline':
+        try:
+            if args.output:
+                output_dir = args.output
+            elif args.plugin_path:
+                output_dir = get_tool_output_path(args.plugin_path, "TranslationManager", create=True)
+            else:
+                output_dir = None
+
+            print(f"{c.INFO}[INFO]{c.RESET} COMPARE → EXTRACT → SYNC...")
+            pipeline = run_pipeline(args.old, args.new, args.locales, output_dir,
+                                    jobs=args.jobs, compress=args.gzip,
+                                    plugin_path=args.plugin_path)
+
+            summary = pipeline['summary']
+            print(f"{c.KEY}Clés ajoutées   {c.RESET}: {c.GREEN}{summary['added']}{c.RESET}")
+            print(f"{c.KEY}Clés modifiées  {c.RESET}: {c.YELLOW}{summary['changed']}{c.RESET}")
+            print(f"{c.KEY}Clés supprimées {c.RESET}: {c.RED}{summary['deleted']}{c.RESET}")
+            print(f"{c.KEY}Clés renommées  {c.RESET}: {c.CYAN}{summary['renamed']}{c.RESET}")
+
+            if pipeline['sync']:
+                print()
+                print(generate_sync_report(pipeline['sync']))
+            else:
+                print(c.warning("Aucune langue étrangère trouvée."))
+
+            print(c.success(f"Fichiers générés dans: {c.VALUE}{pipeline['output_dir']}{c.RESET}"))
+            for f in pipeline['translate_files']:
+                print(f"  {c.DIM}-{c.RESET} {c.VALUE}{os.path.basename(f)}{c.RESET}")
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'pretranslate':
+        try:
+            reference = args.ref or args.locales
+            if not reference:
+                print(c.error("--ref ou --locales requis"))
+                sys.exit(1)
+
+            backend = create_backend(args.backend, dictionary_file=args.dictionary)
+            languages = [l.strip() for l in args.lang.split(',')] if args.lang else None
+
+            print(f"{c.INFO}[INFO]{c.RESET} Pré-traduction ({backend.name})...")
+            results = run_pretranslate(reference, args.locales, backend, languages,
+                                       cache_path=None if args.no_cache else DEFAULT_MT_CACHE_PATH,
+                                       workers=args.workers, rate=args.rate)
+
+            if not results:
+                print(c.warning("Aucune langue étrangère trouvée."))
+            for lang, stats in sorted(results.items()):
+                print(f"{c.CYAN}[{lang.upper()}]{c.RESET} {c.OK}[OK]{c.RESET}: {c.GREEN}{stats['translated']}{c.RESET}/{stats['candidates']} clés pré-traduites")
+            print(f"{c.DIM}  Recherchez '## NEW ## Pré-traduit' dans les fichiers pour relire.{c.RESET}")
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'check':
+        try:
+            reference = args.ref or args.locales
+            if not reference:
+                print(c.error("--ref ou --locales requis"))
+                sys.exit(1)
+
+            languages = [l.strip() for l in args.lang.split(',')] if args.lang else None
+            results = run_check(args.glossary, reference, args.locales, languages)
+            print(generate_check_report(results))
+
+            if args.json:
+                import json
+                from dataclasses import asdict
+                with open(args.json, 'w', encoding='utf-8') as f:
+                    json.dump({lang: [asdict(v) for v in violations] for lang, violations in results.items()},
+                              f, indent=2, ensure_ascii=False)
+                print(c.success(f"Rapport JSON: {c.VALUE}{args.json}{c.RESET}"))
+
+            # Code de sortie non nul si problèmes (intégration continue)
+            if any(results.values()):
+                sys.exit(1)
+
+        except (OSError, ValueError) as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(2)
+    
+    elif args.command == 'consistency':
+        try:
+            reference = args.ref or args.locales
+            if not reference:
+                print(c.error("--ref ou --locales requis"))
+                sys.exit(1)
+
+            languages = [l.strip() for l in args.lang.split(',')] if args.lang else None
+            results = run_consistency(reference, args.locales, languages, apply=args.apply)
+            print(generate_consistency_report(results))
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'prune':
+        try:
+            exclude = [f.strip() for f in args.exclude.split(',')] if args.exclude else None
+            result = run_prune(args.plugin_path, args.locales, exclude, remove=args.remove)
+            print(generate_prune_report(result))
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'coverage':
+        try:
+            index = update_coverage(args.locales, refresh=args.refresh)
+            if index is None:
+                print(c.error(f"TranslatedStrings_en.txt introuvable dans {args.locales}"))
+                sys.exit(1)
+
+            languages = [l.strip() for l in args.lang.split(',')] if args.lang else None
+            matrix = coverage_matrix(index, languages)
+            if args.format == 'csv':
+                output = render_coverage_csv(matrix)
+            elif args.format == 'json':
+                output = render_coverage_json(matrix)
+            else:
+                output = render_coverage_table(matrix, categories=not args.summary)
+
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(output)
+                print(c.success(f"Couverture: {c.VALUE}{args.output}{c.RESET}"))
+            else:
+                print(output)
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'workspace':
+        try:
+            languages = [l.strip() for l in args.lang.split(',')] if args.lang else None
+            result = run_workspace_sync(args.plugins, languages, jobs=args.jobs, dry_run=args.dry_run)
+            print(generate_workspace_report(result))
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
+    elif args.command == 'pseudo':
+        try:
+            stats = run_pseudo(args.ref, args.lang, args.output, parse_expansion(args.expansion),
+                               accents=not args.no_accents, brackets=not args.no_brackets,
+                               seed=args.seed, force=args.force)
+            print(generate_pseudo_report(stats))
+
+        except Exception as e:
+            print(c.error(f"Erreur: {e}"))
+            sys.exit(1)
+    
     else:
         parser.print_help()
 
@@ -19,19 +19,21 @@ Version : 1.0
 
 import os
 import re
+import sys
 import json
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Ajouter le répertoire parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.placeholders import PLACEHOLDER_PATTERN, placeholder_signature  # noqa: F401
+
 
 # Regex pour parser les lignes LOC du format Lightroom SDK
 # Format: "$$$/Prefix/Category/Key=Value"
 LOC_LINE_PATTERN = re.compile(r'"(\$\$\$/[^/]+)/([^/]+)/([^=]+)=([^"]*)"')
 
-# Regex pour détecter les placeholders de format
-# Supporte: %s, %d, %f, %x, etc. et séquences d'échappement \n, \t, \", \\
-PLACEHOLDER_PATTERN = re.compile(r'%[sdfuxXoceEgG\d]|\\[nt"\\]')
-
 # Suffixes courants à détecter
 COMMON_SUFFIXES = [" -", " :", ":", "...", " - ", ": "]
 
@@ -131,7 +133,7 @@ def extract_placeholders(text: str) -> Set[str]:
         >>> extract_placeholders("Error on line %d\\nPlease check")
         {'%d', '\\n'}
     """
-    return set(PLACEHOLDER_PATTERN.findall(text))
+    return set(placeholder_signature(text))
 
 
 def compare_placeholders(en_text: str, target_text: str) -> Tuple[bool, Set[str], Set[str]]:
@@ -144,20 +146,21 @@ def compare_placeholders(en_text: str, target_text: str) -> Tuple[bool, Set[str]
 
     Returns:
         Tuple (match, en_only, target_only)
-        - match: True si les placeholders sont identiques
-        - en_only: Placeholders présents uniquement en EN
-        - target_only: Placeholders présents uniquement dans la cible
+        - match: True si les placeholders sont identiques (nombre d'occurrences
+          compris, l'ordre peut varier)
+        - en_only: Placeholders manquants dans la cible
+        - target_only: Placeholders en trop dans la cible
 
     Example:
         >>> compare_placeholders("Error: %s on line %d", "Erreur: %s")
         (False, {'%d'}, set())
     """
-    en_placeholders = extract_placeholders(en_text)
-    target_placeholders = extract_placeholders(target_text)
+    en_placeholders = Counter(placeholder_signature(en_text))
+    target_placeholders = Counter(placeholder_signature(target_text))
 
     match = en_placeholders == target_placeholders
-    en_only = en_placeholders - target_placeholders
-    target_only = target_placeholders - en_placeholders
+    en_only = set(en_placeholders - target_placeholders)
+    target_only = set(target_placeholders - en_placeholders)
 
     return match, en_only, target_only
 
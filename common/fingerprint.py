@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+common/fingerprint.py
+
+Empreintes de fichiers (taille, mtime, hash) partagées entre les outils.
+
+L'Extractor enregistre l'empreinte de chaque fichier source dans
+replacements.json ; l'Applicator la compare avec un simple stat() pour
+éviter de relire les fichiers déjà traités. Le hash n'est recalculé que
+si la taille correspond mais que la date de modification a changé.
+
+Fonctions :
+    - compute_fingerprint(path) : Calcule {size, mtime_ns, sha256} d'un fichier
+    - hash_file(path) : Calcule le SHA-256 d'un fichier (lecture par blocs)
+    - fingerprint_matches(path, fingerprint, st=None) : Vérifie qu'un fichier correspond à une empreinte
+
+Auteur : Claude (Anthropic) pour Julien Moreau
+Date : 2026-10-18
+Version : 1.0
+"""
+
+import os
+import hashlib
+from typing import Dict, Optional
+
+
+# Taille des blocs de lecture pour le calcul du hash
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """
+    Calcule le SHA-256 d'un fichier en le lisant par blocs.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Hash hexadécimal
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_fingerprint(path: str) -> Dict:
+    """
+    Calcule l'empreinte complète d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        {'size': int, 'mtime_ns': int, 'sha256': str}
+
+    Example:
+        >>> compute_fingerprint("PWDialogs.lua")
+        {'size': 10432, 'mtime_ns': 1769688622000000000, 'sha256': '3f2a...'}
+    """
+    st = os.stat(path)
+    return {
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'sha256': hash_file(path),
+    }
+
+
+def fingerprint_matches(path: str, fingerprint: Optional[Dict],
+                        st: os.stat_result = None) -> bool:
+    """
+    Vérifie qu'un fichier correspond à une empreinte enregistrée.
+
+    - Taille différente : ne correspond pas (aucune lecture)
+    - Taille et mtime identiques : correspond (aucune lecture)
+    - Taille identique, mtime différent : comparaison du hash
+
+    Si le hash correspond alors que le mtime a changé, l'empreinte est
+    mise à jour en place avec le nouveau mtime pour que le prochain
+    contrôle se limite de nouveau à un stat().
+
+    Args:
+        path: Chemin du fichier
+        fingerprint: Empreinte enregistrée (ou None)
+        st: Résultat de os.stat() déjà disponible (optionnel)
+
+    Returns:
+        True si le contenu du fichier correspond à l'empreinte
+    """
+    if not fingerprint:
+        return False
+
+    try:
+        if st is None:
+            st = os.stat(path)
+    except OSError:
+        return False
+
+    if st.st_size != fingerprint.get('size'):
+        return False
+
+    if st.st_mtime_ns == fingerprint.get('mtime_ns'):
+        return True
+
+    expected_hash = fingerprint.get('sha256')
+    if not expected_hash or hash_file(path) != expected_hash:
+        return False
+
+    fingerprint['mtime_ns'] = st.st_mtime_ns
+    return True
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+common/lua_sources.py
+
+Parcours des sources Lua d'un plugin et repérage des clés LOC, partagés
+entre l'Extractor (chaînes déjà localisées) et le TranslationManager
+(commande PRUNE : clés mortes).
+
+Fonctions :
+    - iter_lua_files(plugin_path, exclude_files=None) : Fichiers .lua du plugin (triés)
+    - scan_key_references(plugin_path, exclude_files=None) : Clés référencées dans les sources
+
+Auteur : Claude (Anthropic) pour Julien Moreau
+Date : 2026-10-18
+Version : 1.0
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Set, Tuple
+
+
+# Fichiers jamais analysés (bibliothèques tierces)
+DEFAULT_EXCLUDED_FILES = {'JSON.lua'}
+
+# LOC "$$$/Clé=Valeur" (clé et valeur par défaut)
+LOC_PATTERN = re.compile(r'LOC\s*["\'](\$\$\$/[^=]+)=([^"\']+)["\']')
+
+# Toute chaîne "$$$/Clé=..." : LOC "...", LOC("..."), ou clé rangée dans une
+# table puis passée à LOC via une variable
+KEY_REFERENCE_PATTERN = re.compile(r'["\'](\$\$\$/[^"\'=\s]+)=')
+
+# Clé construite dynamiquement : "$$$/Prefixe/" .. variable
+DYNAMIC_KEY_PATTERN = re.compile(r'["\'](\$\$\$/[^"\'=\s]*)["\']\s*\.\.')
+
+
+def iter_lua_files(plugin_path: str, exclude_files: Iterable[str] = None) -> List[Path]:
+    """
+    Liste les fichiers .lua du plugin (récursif, ordre stable).
+
+    Args:
+        plugin_path: Répertoire du plugin
+        exclude_files: Noms de fichiers à ignorer (en plus de DEFAULT_EXCLUDED_FILES)
+
+    Returns:
+        Chemins triés
+    """
+    excluded = DEFAULT_EXCLUDED_FILES | set(exclude_files or [])
+    return [path for path in sorted(Path(plugin_path).rglob('*.lua'))
+            if path.name not in excluded]
+
+
+def scan_key_references(plugin_path: str,
+                        exclude_files: Iterable[str] = None) -> Tuple[Set[str], Set[str]]:
+    """
+    Relève les clés référencées dans les sources Lua (un seul passage).
+
+    Returns:
+        (clés référencées, préfixes de clés construites dynamiquement)
+
+    Example:
+        >>> scan_key_references("./piwigoPublish.lrplugin")
+        ({'$$$/Piwigo/Dialog/Cancel', ...}, {'$$$/Piwigo/Status/'})
+    """
+    keys = set()
+    prefixes = set()
+    for path in iter_lua_files(plugin_path, exclude_files):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+        keys.update(KEY_REFERENCE_PATTERN.findall(content))
+        prefixes.update(DYNAMIC_KEY_PATTERN.findall(content))
+    return keys, prefixes
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+common/placeholders.py
+
+Placeholders de format (%s, %d, %1...) et séquences d'échappement (\\n, \\t,
+\\", \\\\) partagés entre les outils.
+
+Avant d'envoyer un texte à un service de traduction, les placeholders sont
+remplacés par des jetons neutres (⟦0⟧, ⟦1⟧...) puis restaurés dans la
+traduction : le service ne peut ni les traduire ni les déplacer hors du texte.
+
+La validation compare la signature (placeholders dans l'ordre) de chaque
+traduction à celle du texte EN, calculée une seule fois par clé et réutilisée
+pour toutes les langues.
+
+Fonctions / classes :
+    - protect_placeholders(text) : Remplace les placeholders par des jetons
+    - restore_placeholders(text, placeholders) : Restaure les placeholders
+    - placeholder_signature(text) : Placeholders d'un texte, dans l'ordre
+    - placeholder_signatures(strings) : Signatures de toutes les clés
+    - PlaceholderIssue : Écart entre une traduction et l'EN
+    - check_placeholders(expected, text) : Contrôle d'une traduction
+    - find_placeholder_issues(signatures, translations) : Contrôle d'un lot de traductions
+
+Auteur : Claude (Anthropic) pour Julien Moreau
+Date : 2026-10-18
+Version : 1.0
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+# Placeholders de format et séquences d'échappement (voir TRANSLATION_WARNING_NOTE)
+PLACEHOLDER_PATTERN = re.compile(r'%\d+|%[sdifuxXoceEgG]|\\[nt"\\]')
+
+# Jeton de remplacement
+TOKEN_FORMAT = "⟦{}⟧"
+TOKEN_PATTERN = re.compile(r'⟦(\d+)⟧')
+
+
+def protect_placeholders(text: str) -> Tuple[str, List[str]]:
+    """
+    Remplace les placeholders par des jetons numérotés.
+
+    Returns:
+        (texte protégé, placeholders dans l'ordre)
+
+    Example:
+        >>> protect_placeholders("Error %s\\nRetry")
+        ('Error ⟦0⟧⟦1⟧Retry', ['%s', '\\\\n'])
+    """
+    placeholders = []
+
+    def _replace(match):
+        placeholders.append(match.group(0))
+        return TOKEN_FORMAT.format(len(placeholders) - 1)
+
+    return PLACEHOLDER_PATTERN.sub(_replace, text), placeholders
+
+
+def restore_placeholders(text: str, placeholders: List[str]) -> Optional[str]:
+    """
+    Restaure les placeholders dans un texte traduit.
+
+    Returns:
+        Texte restauré, ou None si un jeton a été perdu, dupliqué ou inventé
+    """
+    found = [int(index) for index in TOKEN_PATTERN.findall(text)]
+    if sorted(found) != list(range(len(placeholders))):
+        return None
+    return TOKEN_PATTERN.sub(lambda match: placeholders[int(match.group(1))], text)
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def placeholder_signature(text: str) -> Tuple[str, ...]:
+    """
+    Placeholders d'un texte, dans l'ordre.
+
+    Example:
+        >>> placeholder_signature("%d photos in %s")
+        ('%d', '%s')
+    """
+    # Raccourci : la plupart des textes ne contiennent aucun placeholder
+    if '%' not in text and '\\' not in text:
+        return ()
+    return tuple(PLACEHOLDER_PATTERN.findall(text))
+
+
+def placeholder_signatures(strings: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """Signatures de toutes les clés ({clé: placeholders})."""
+    return {key: placeholder_signature(text) for key, text in strings.items()}
+
+
+@dataclass
+class PlaceholderIssue:
+    """Écart entre les placeholders d'une traduction et ceux de l'EN."""
+    kind: str                       # 'mismatch' (ensemble différent) ou 'order'
+    expected: Tuple[str, ...]
+    found: Tuple[str, ...]
+
+    @property
+    def blocking(self) -> bool:
+        """Un ensemble différent casse l'affichage : la traduction est rejetée."""
+        return self.kind == 'mismatch'
+
+    def describe(self) -> str:
+        """Description courte (ex: 'manquant: %d ; en trop: %s')."""
+        if self.kind == 'order':
+            return f"ordre différent de l'EN ({' '.join(self.expected)})"
+        missing = Counter(self.expected) - Counter(self.found)
+        extra = Counter(self.found) - Counter(self.expected)
+        parts = []
+        if missing:
+            parts.append("manquant: " + ' '.join(sorted(missing.elements())))
+        if extra:
+            parts.append("en trop: " + ' '.join(sorted(extra.elements())))
+        return ' ; '.join(parts)
+
+
+def _positional(signature: Tuple[str, ...]) -> List[str]:
+    """Placeholders dont la position compte (%1, %2... peuvent être réordonnés)."""
+    return [p for p in signature if not p[1:].isdigit()]
+
+
+def check_placeholders(expected: Tuple[str, ...], text: str) -> Optional[PlaceholderIssue]:
+    """
+    Contrôle une traduction par rapport à la signature EN.
+
+    Returns:
+        None si les placeholders sont conformes, sinon l'écart
+    """
+    found = placeholder_signature(text)
+    if found == expected:
+        return None
+    if Counter(found) != Counter(expected):
+        return PlaceholderIssue('mismatch', expected, found)
+    if _positional(found) == _positional(expected):
+        return None
+    return PlaceholderIssue('order', expected, found)
+
+
+def find_placeholder_issues(signatures: Dict[str, Tuple[str, ...]],
+                            translations: Dict[str, str]) -> Dict[str, PlaceholderIssue]:
+    """
+    Contrôle un lot de traductions (clés sans signature EN ignorées).
+
+    Args:
+        signatures: Signatures EN (voir placeholder_signatures)
+        translations: {clé: traduction}
+
+    Returns:
+        {clé: écart} pour les traductions non conformes
+    """
+    issues = {}
+    for key, text in translations.items():
+        expected = signatures.get(key)
+        if expected is None:
+            continue
+        issue = check_placeholders(expected, text)
+        if issue:
+            issues[key] = issue
+    return issues
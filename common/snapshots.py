@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+common/snapshots.py
+
+Historique des versions EN d'un plugin (snapshots), partagé entre
+l'Extractor et le TranslationManager.
+
+Chaque exécution enregistre son jeu de clés EN dans
+<plugin>/__i18n_tmp__/snapshots/ :
+
+    entries.jsonl   Entrées [hash, clé, valeur], ajoutées une seule fois et
+                    partagées par tous les snapshots
+    <id>.json       Snapshot : liste triée des hash de ses entrées
+    index.json      Liste des snapshots (date, source, fichier, nombre de clés)
+
+L'identifiant d'un snapshot est dérivé de son contenu : enregistrer deux
+fois le même fichier EN ne crée pas de doublon. Deux snapshots se comparent
+par leurs hash ; seules les entrées différentes sont relues.
+
+Fonctions / classes :
+    - entry_hash(key, value) : Hash d'une entrée clé=valeur
+    - SnapshotStore(plugin_path) : Enregistrement, résolution et lecture des snapshots
+    - register_snapshot(plugin_path, strings, source, file) : Enregistrement sans erreur bloquante
+
+Auteur : Claude (Anthropic) pour Julien Moreau
+Date : 2026-10-18
+Version : 1.0
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from common.fingerprint import hash_file
+from common.paths import get_i18n_kit_path
+
+
+# Sous-dossier de __i18n_tmp__ contenant les snapshots
+SNAPSHOT_DIR = "snapshots"
+ENTRIES_FILE = "entries.jsonl"
+INDEX_FILE = "index.json"
+
+# Longueur des identifiants de snapshot
+SNAPSHOT_ID_LENGTH = 12
+
+
+def entry_hash(key: str, value: str) -> str:
+    """
+    Hash d'une entrée (les clés ne contiennent pas de '=', la forme est non ambiguë).
+
+    Example:
+        >>> entry_hash("$$$/Piwigo/UI/Cancel", "Cancel")
+        '5b1c0e4f...'
+    """
+    return hashlib.sha1(f"{key}={value}".encode('utf-8')).hexdigest()
+
+
+class SnapshotStore:
+    """Magasin de snapshots EN d'un plugin."""
+
+    def __init__(self, plugin_path: str):
+        self.root = os.path.join(get_i18n_kit_path(plugin_path), SNAPSHOT_DIR)
+        self._entries: Optional[Dict[str, Tuple[str, str]]] = None
+
+    # -------------------------------------------------------------------------
+    # Lecture
+    # -------------------------------------------------------------------------
+
+    def snapshots(self) -> List[Dict]:
+        """Snapshots enregistrés, du plus ancien au plus récent."""
+        try:
+            with open(os.path.join(self.root, INDEX_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def resolve(self, ref: str) -> Dict:
+        """
+        Retrouve un snapshot.
+
+        Args:
+            ref: Identifiant (ou préfixe non ambigu), 'latest' ou 'latest~N'
+                 (N-ième avant le plus récent)
+
+        Raises:
+            ValueError: Snapshot inconnu ou préfixe ambigu
+        """
+        snapshots = self.snapshots()
+        if ref == 'latest' or ref.startswith('latest~'):
+            back = int(ref.partition('~')[2] or 0)
+            if back >= len(snapshots):
+                raise ValueError(f"Snapshot introuvable: {ref} ({len(snapshots)} enregistré(s))")
+            return snapshots[-1 - back]
+
+        matches = [snap for snap in snapshots if snap['id'].startswith(ref)]
+        if len(matches) != 1:
+            reason = "ambigu" if matches else "introuvable"
+            raise ValueError(f"Snapshot {reason}: {ref}")
+        return matches[0]
+
+    def load_hashes(self, snapshot_id: str) -> Set[str]:
+        """Hash des entrées d'un snapshot."""
+        with open(os.path.join(self.root, f"{snapshot_id}.json"), 'r', encoding='utf-8') as f:
+            return set(json.load(f))
+
+    def entries(self, hashes: Iterable[str]) -> Dict[str, str]:
+        """Résout des hash en {clé: valeur}."""
+        pool = self._load_entries()
+        return dict(pool[entry] for entry in hashes)
+
+    def _load_entries(self) -> Dict[str, Tuple[str, str]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(os.path.join(self.root, ENTRIES_FILE), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            entry, key, value = json.loads(line)
+                            self._entries[entry] = (key, value)
+            except OSError:
+                pass
+        return self._entries
+
+    # -------------------------------------------------------------------------
+    # Écriture
+    # -------------------------------------------------------------------------
+
+    def register(self, strings: Dict[str, str], source: str, file: str = None) -> Dict:
+        """
+        Enregistre un jeu de clés EN (sans doublon si le contenu est déjà connu).
+
+        Args:
+            strings: {clé: valeur} EN
+            source: Outil à l'origine (ex: 'Extractor', 'COMPARE', 'SYNC')
+            file: Fichier EN correspondant (conservé avec son hash pour SYNC)
+
+        Returns:
+            Entrée d'index du snapshot
+        """
+        hashes = {entry_hash(key, value): (key, value) for key, value in strings.items()}
+        ordered = sorted(hashes)
+        snapshot_id = hashlib.sha256('\n'.join(ordered).encode('ascii')).hexdigest()[:SNAPSHOT_ID_LENGTH]
+
+        snapshots = self.snapshots()
+        for snap in snapshots:
+            if snap['id'] == snapshot_id:
+                return snap
+
+        os.makedirs(self.root, exist_ok=True)
+        pool = self._load_entries()
+        new_entries = [entry for entry in ordered if entry not in pool]
+        if new_entries:
+            with open(os.path.join(self.root, ENTRIES_FILE), 'a', encoding='utf-8') as f:
+                for entry in new_entries:
+                    f.write(json.dumps([entry, *hashes[entry]], ensure_ascii=False) + '\n')
+                    pool[entry] = hashes[entry]
+
+        with open(os.path.join(self.root, f"{snapshot_id}.json"), 'w', encoding='utf-8') as f:
+            json.dump(ordered, f, separators=(',', ':'))
+
+        snap = {
+            'id': snapshot_id,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': source,
+            'file': os.path.abspath(file) if file else None,
+            'file_sha256': hash_file(file) if file and os.path.isfile(file) else None,
+            'keys': len(ordered),
+        }
+        snapshots.append(snap)
+        with open(os.path.join(self.root, INDEX_FILE), 'w', encoding='utf-8') as f:
+            json.dump(snapshots, f, ensure_ascii=False, indent=1)
+        return snap
+
+
+def register_snapshot(plugin_path: str, strings: Dict[str, str], source: str,
+                      file: str = None) -> Optional[Dict]:
+    """
+    Enregistre un snapshot EN ; un échec d'écriture n'interrompt pas l'outil appelant.
+
+    Returns:
+        Entrée d'index, ou None si plugin_path est vide ou en cas d'erreur
+    """
+    if not plugin_path:
+        return None
+    try:
+        return SnapshotStore(plugin_path).register(strings, source, file)
+    except OSError:
+        return None
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+helpers.py
+
+Fonctions communes aux tests unitaires (importées par les fichiers test_*.py,
+qui s'exécutent avec tests/ en tête de sys.path, via python ou pytest)
+"""
+
+
+def write_file(path: str, content: str):
+    """Écrit un fichier texte UTF-8 (fins de ligne de la plateforme)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+test_applicator.py
+
+Tests unitaires pour Applicator_main.py (patch dry-run, journal JSONL, sélection)
+
+Usage:
+    python tests/test_applicator.py
+    pytest tests/test_applicator.py  (si pytest installé)
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tempfile
+
+# Ajouter le parent et Applicator au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "2_Applicator"))
+
+from Applicator_main import (process_plugin_directory, LocalizationReport, build_selection_index,
+                             APPLY_STATE_FILE, PATCH_FILE)
+from common.paths import find_latest_tool_output
+from helpers import write_file
+
+
+def _make_plugin(tmpdir: str, sources: dict, files_data: dict) -> tuple:
+    """Crée un plugin (fichiers binaires tels quels) et son dossier Extractor."""
+    plugin = os.path.join(tmpdir, 'test.lrplugin')
+    extraction = os.path.join(tmpdir, 'extraction')
+    os.makedirs(plugin)
+    os.makedirs(extraction)
+    for name, content in sources.items():
+        with open(os.path.join(plugin, name), 'wb') as f:
+            f.write(content)
+    write_file(os.path.join(extraction, 'replacements.json'), json.dumps({'files': files_data}))
+    return plugin, extraction
+
+
+def _replacement(line_num: int, text: str, key: str, pattern: str = 'title') -> dict:
+    return {'line_num': line_num, 'pattern': pattern,
+            'members': [{'original_text': text, 'loc_key': key, 'base_text': text}]}
+
+
+def test_dry_run_patch_crlf():
+    """Test que le patch dry-run d'un fichier CRLF est accepté par git apply."""
+    print("TEST 1: Patch dry-run (fichier CRLF)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = b'local a = "Hello"\r\nlocal b = 1\r\nlocal c = "World"\r\n'
+        plugin, extraction = _make_plugin(tmpdir, {'Main.lua': source}, {
+            'Main.lua': {'replacements': [_replacement(1, 'Hello', '$$$/Test/Hello'),
+                                          _replacement(3, 'World', '$$$/Test/World')]}
+        })
+
+        assert process_plugin_directory(plugin, extraction, dry_run=True)
+
+        with open(os.path.join(plugin, 'Main.lua'), 'rb') as f:
+            assert f.read() == source, "Le dry-run ne doit pas modifier le fichier"
+        with open(os.path.join(extraction, APPLY_STATE_FILE), 'r', encoding='utf-8') as f:
+            assert json.load(f)['files'] == {}, "Aucune empreinte en dry-run"
+
+        patch = os.path.join(find_latest_tool_output(plugin, "Applicator"), PATCH_FILE)
+        with open(patch, 'rb') as f:
+            assert b'+local a = LOC "$$$/Test/Hello=Hello"\r\n' in f.read(), "Fin de ligne CRLF perdue"
+
+        result = subprocess.run(['git', 'apply', '--check', patch], cwd=plugin,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert result.returncode == 0, result.stderr.decode('utf-8', errors='replace')
+
+        print("  [OK] Patch CRLF accepté par git apply --check, fichier et empreintes intacts")
+
+
+def test_report_jsonl_round_trip():
+    """Test que generate() relit le journal JSONL écrit au fil de l'eau."""
+    print("\nTEST 2: LocalizationReport (JSONL → rapport texte)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report = LocalizationReport(os.path.join(tmpdir, 'application_report.jsonl'))
+        member = {'original_text': 'Hello', 'loc_key': '$$$/Test/Hello', 'base_text': 'Hello'}
+        report.add_change('Main.lua', 1, 'a = "Hello"\n', 'a = LOC "$$$/Test/Hello=Hello"\n', [member])
+        report.add_skip('Main.lua', 3, 'Chaine non trouvee ou deja localisee', 'b = "Wörld"\n')
+        report.add_error('Other.lua', 0, 'Fichier introuvable')
+        report.generate(os.path.join(tmpdir, 'application_report.txt'))
+
+        with open(report.records_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [r['type'] for r in records] == ['change', 'skip', 'error', 'summary'], records
+        assert records[-1]['stats']['strings_replaced'] == 1 and records[-1]['stats']['errors'] == 1
+
+        with open(os.path.join(tmpdir, 'application_report.txt'), 'r', encoding='utf-8') as f:
+            text = f.read()
+        assert '"Hello" -> $$$/Test/Hello' in text, "Modification absente du rapport"
+        assert 'Contenu: b = "Wörld"' in text, "Chaîne ignorée absente du rapport"
+        assert 'Other.lua:0' in text and 'Fichier introuvable' in text, "Erreur absente du rapport"
+
+        print("  [OK] 4 enregistrements (change, skip, error, summary) relus dans le rapport texte")
+
+
+def test_build_selection_index():
+    """Test des filtres de sélection (fichiers, préfixes, patterns, max_lines)."""
+    print("\nTEST 3: build_selection_index")
+
+    files_data = {
+        'PWDialogs.lua': {'replacements': [
+            _replacement(1, 'OK', '$$$/Piwigo/Dialogs/OK', 'LrDialogs.message'),
+            _replacement(2, 'Title', '$$$/Piwigo/Dialogs/Title', 'title'),
+        ]},
+        'dialogs/Upload.lua': {'replacements': [
+            {'line_num': 5, 'pattern': 'LrDialogs.confirm', 'members': [
+                {'original_text': 'Upload', 'loc_key': '$$$/Piwigo/Dialogs/Upload', 'base_text': 'Upload'},
+                {'original_text': 'Cancel', 'loc_key': '$$$/Piwigo/Common/Cancel', 'base_text': 'Cancel'},
+            ]},
+        ]},
+        'Main.lua': {'replacements': [_replacement(3, 'Hello', '$$$/Piwigo/Main/Hello')]},
+    }
+
+    # Glob sur le chemin complet ou sur le nom du fichier
+    index, partial = build_selection_index(files_data, only_files=['dialogs/*.lua', 'Main.lua'])
+    assert sorted(index) == ['Main.lua', 'dialogs/Upload.lua'], f"Fichiers: {sorted(index)}"
+    assert not partial, f"Aucun fichier partiel attendu: {partial}"
+
+    # Pattern : une seule ligne de PWDialogs.lua → fichier partiel
+    index, partial = build_selection_index(files_data, patterns=['LrDialogs.*'])
+    assert sorted(index) == ['PWDialogs.lua', 'dialogs/Upload.lua'], f"Fichiers: {sorted(index)}"
+    assert index['PWDialogs.lua']['total_replacements'] == 1
+    assert partial == {'PWDialogs.lua'}, f"Partiels: {partial}"
+
+    # Préfixe de clé : un seul membre de la ligne d'Upload.lua → fichier partiel
+    index, partial = build_selection_index(files_data, key_prefixes=['$$$/Piwigo/Dialogs/'])
+    members = index['dialogs/Upload.lua']['replacements'][0]['members']
+    assert [m['loc_key'] for m in members] == ['$$$/Piwigo/Dialogs/Upload'], members
+    assert partial == {'dialogs/Upload.lua'}, f"Partiels: {partial}"
+    assert len(files_data['dialogs/Upload.lua']['replacements'][0]['members']) == 2, "Entrée modifiée"
+
+    # max_lines : ordre des fichiers triés, arrêt au milieu d'un fichier
+    index, partial = build_selection_index(files_data, max_lines=2)
+    assert sorted(index) == ['Main.lua', 'PWDialogs.lua'], f"Fichiers: {sorted(index)}"
+    assert index['PWDialogs.lua']['total_replacements'] == 1
+    assert partial == {'PWDialogs.lua'}, f"Partiels: {partial}"
+
+    print("  [OK] Globs chemin/nom, patterns, préfixes, max_lines et fichiers partiels")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: Applicator_main.py")
+    print("=" * 80)
+
+    tests = [
+        test_dry_run_patch_crlf,
+        test_report_jsonl_round_trip,
+        test_build_selection_index
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+test_applicator_git.py
+
+Tests unitaires pour Applicator_git.py (mode git)
+
+Usage:
+    python tests/test_applicator_git.py
+    pytest tests/test_applicator_git.py  (si pytest installé)
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+
+# Ajouter le parent et Applicator au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "2_Applicator"))
+
+from Applicator_git import GitCommitWriter
+
+
+def _git(repo: str, *args: str) -> bytes:
+    return subprocess.run(['git', *args], cwd=repo, check=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
+
+
+def _make_repo(tmpdir: str, files: dict) -> str:
+    """Crée un dépôt avec un commit initial contenant files (contenus binaires)."""
+    repo = os.path.join(tmpdir, 'repo')
+    os.makedirs(repo)
+    _git(repo, 'init', '-q')
+    _git(repo, 'config', 'user.name', 'Test')
+    _git(repo, 'config', 'user.email', 'test@example.com')
+    _git(repo, 'config', 'core.autocrlf', 'false')
+    for name, content in files.items():
+        path = os.path.join(repo, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+    _git(repo, 'add', '-A')
+    _git(repo, 'commit', '-q', '-m', 'initial')
+    return repo
+
+
+def test_commit_writer():
+    """Test du commit sur une branche jetable (HEAD, index et fichiers intacts)."""
+    print("TEST 1: GitCommitWriter.commit")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        rel = 'plugin.lrplugin/dir é/My File.lua'
+        repo = _make_repo(tmpdir, {
+            '.gitattributes': b'*.lua text eol=lf\n',
+            rel: b'a = "Hello"\n',
+        })
+        plugin = os.path.join(repo, 'plugin.lrplugin')
+        head = _git(repo, 'rev-parse', 'HEAD').strip()
+
+        writer = GitCommitWriter(plugin, 'i18n/applicator-test')
+        assert writer.dirty_files([os.path.join(repo, rel)]) == [], "Fichier propre attendu"
+
+        # Fin de ligne CRLF : normalisée par .gitattributes comme avec git add
+        writer.add_file(os.path.join(repo, rel), ['a = LOC "$$$/Test/Hello=Hello"\r\n'])
+        commit = writer.commit("i18n: apply LOC replacements")
+
+        assert _git(repo, 'rev-parse', 'i18n/applicator-test').strip().decode() == commit
+        assert _git(repo, 'show', f'{commit}:{rel}') == b'a = LOC "$$$/Test/Hello=Hello"\n', \
+            ".gitattributes non appliqué au blob"
+        assert _git(repo, 'rev-parse', 'HEAD').strip() == head, "HEAD ne doit pas bouger"
+        assert _git(repo, 'status', '--porcelain') == b'', "Index ou work tree modifié"
+        with open(os.path.join(repo, rel), 'rb') as f:
+            assert f.read() == b'a = "Hello"\n', "Le fichier ne doit pas être réécrit"
+
+        print("  [OK] Commit sur la branche jetable, blob normalisé, HEAD et work tree intacts")
+
+
+def test_dirty_files():
+    """Test de la détection des fichiers non commités (chemins avec espaces / accents)."""
+    print("\nTEST 2: GitCommitWriter.dirty_files")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = {
+            'plugin.lrplugin/dir é/My File.lua': b'a = "Hello"\n',
+            'plugin.lrplugin/Clean.lua': b'b = "World"\n',
+            'plugin.lrplugin/Old Name.lua': b'c = "Moved"\n',
+        }
+        repo = _make_repo(tmpdir, files)
+        plugin = os.path.join(repo, 'plugin.lrplugin')
+
+        with open(os.path.join(plugin, 'dir é', 'My File.lua'), 'ab') as f:
+            f.write(b'-- edit\n')
+        with open(os.path.join(plugin, 'Nouveau fichier.lua'), 'wb') as f:
+            f.write(b'd = "New"\n')
+        _git(repo, 'mv', 'plugin.lrplugin/Old Name.lua', 'plugin.lrplugin/New Name.lua')
+
+        writer = GitCommitWriter(plugin, 'i18n/applicator-test')
+        candidates = [os.path.join(repo, name) for name in (
+            'plugin.lrplugin/Clean.lua', 'plugin.lrplugin/dir é/My File.lua',
+            'plugin.lrplugin/Nouveau fichier.lua', 'plugin.lrplugin/New Name.lua',
+        )]
+        dirty = writer.dirty_files(candidates)
+
+        assert dirty == ['plugin.lrplugin/dir é/My File.lua', 'plugin.lrplugin/Nouveau fichier.lua',
+                         'plugin.lrplugin/New Name.lua'], f"Fichiers modifiés: {dirty}"
+
+        print("  [OK] Modification, fichier non suivi et renommage détectés, fichier propre ignoré")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: Applicator_git.py")
+    print("=" * 80)
+
+    tests = [
+        test_commit_writer,
+        test_dirty_files
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
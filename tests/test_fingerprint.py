@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+test_fingerprint.py
+
+Tests unitaires pour le module common/fingerprint.py
+
+Usage:
+    python tests/test_fingerprint.py
+    pytest tests/test_fingerprint.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent au path pour importer common
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.fingerprint import compute_fingerprint, fingerprint_matches
+from helpers import write_file
+
+
+def test_compute_fingerprint():
+    """Test que l'empreinte contient taille, mtime et hash."""
+    print("TEST 1: compute_fingerprint")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.lua")
+        write_file(path, "title = \"Hello\"\n")
+
+        fp = compute_fingerprint(path)
+
+        assert fp['size'] == os.path.getsize(path), "Taille incorrecte"
+        assert fp['mtime_ns'] == os.stat(path).st_mtime_ns, "mtime incorrect"
+        assert len(fp['sha256']) == 64, "Hash SHA-256 invalide"
+
+        print(f"  [OK] Empreinte: {fp['size']} octets, {fp['sha256'][:12]}...")
+
+
+def test_fingerprint_matches_unchanged():
+    """Test qu'un fichier inchangé correspond à son empreinte."""
+    print("\nTEST 2: fingerprint_matches (inchangé)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.lua")
+        write_file(path, "title = \"Hello\"\n")
+        fp = compute_fingerprint(path)
+
+        assert fingerprint_matches(path, fp), "Devrait correspondre"
+        assert not fingerprint_matches(path, None), "None ne doit jamais correspondre"
+
+        print("  [OK] Fichier inchangé détecté")
+
+
+def test_fingerprint_matches_touched():
+    """Test qu'un fichier touché (mtime seul) correspond via le hash."""
+    print("\nTEST 3: fingerprint_matches (mtime modifié, contenu identique)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.lua")
+        write_file(path, "title = \"Hello\"\n")
+        fp = compute_fingerprint(path)
+
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        assert fingerprint_matches(path, fp), "Le hash aurait dû correspondre"
+        assert fp['mtime_ns'] == os.stat(path).st_mtime_ns, "mtime non rafraîchi"
+
+        print("  [OK] Contenu identique reconnu, mtime rafraîchi")
+
+
+def test_fingerprint_matches_modified():
+    """Test qu'un fichier modifié ne correspond plus."""
+    print("\nTEST 4: fingerprint_matches (contenu modifié)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "file.lua")
+        write_file(path, "title = \"Hello\"\n")
+        fp = compute_fingerprint(path)
+
+        # Même taille, contenu différent
+        write_file(path, "title = \"Jello\"\n")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, fp['mtime_ns'] + 1))
+        assert not fingerprint_matches(path, fp), "Contenu modifié non détecté"
+
+        # Taille différente
+        write_file(path, "title = \"Hello world\"\n")
+        assert not fingerprint_matches(path, fp), "Taille modifiée non détectée"
+
+        # Fichier supprimé
+        os.remove(path)
+        assert not fingerprint_matches(path, fp), "Fichier absent non détecté"
+
+        print("  [OK] Modifications détectées")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: common/fingerprint.py")
+    print("=" * 80)
+
+    tests = [
+        test_compute_fingerprint,
+        test_fingerprint_matches_unchanged,
+        test_fingerprint_matches_touched,
+        test_fingerprint_matches_modified
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+test_placeholders.py
+
+Tests unitaires pour la validation des placeholders (common/placeholders.py)
+et son utilisation par INJECT.
+
+Usage:
+    python tests/test_placeholders.py
+    pytest tests/test_placeholders.py  (si pytest installé)
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from common.placeholders import (placeholder_signature, placeholder_signatures, find_placeholder_issues,
+                                 protect_placeholders, restore_placeholders)
+from TM_common import UPDATE_FILE, parse_translation_file
+from TM_inject import run_inject_from_dir
+from helpers import write_file
+
+
+def test_find_placeholder_issues():
+    """Test du contrôle d'un lot de traductions."""
+    print("TEST 1: find_placeholder_issues")
+
+    signatures = placeholder_signatures({
+        'A': '%d photos in %s',
+        'B': 'Photo %1 of %2',
+        'C': 'Done\\n',
+        'D': 'Plain text',
+        'E': 'Item %10 of %11'
+    })
+    issues = find_placeholder_issues(signatures, {
+        'A': '%s : %d photos',        # même ensemble, ordre différent
+        'B': 'Photo %2 sur %1',       # numérotés : ordre libre
+        'C': 'Terminé',               # \n manquant
+        'D': 'Texte simple',
+        'E': 'Élément %11 : %10',     # numérotés à plusieurs chiffres
+        'X': 'Sans EN %s'             # clé inconnue : ignorée
+    })
+
+    assert set(issues) == {'A', 'C'}, f"Écarts: {issues}"
+    assert issues['A'].kind == 'order' and not issues['A'].blocking
+    assert issues['C'].blocking and 'manquant' in issues['C'].describe()
+
+    # %10 est un seul placeholder, pas %1 suivi de 0
+    assert placeholder_signature('Item %10 of %2') == ('%10', '%2')
+    protected, placeholders = protect_placeholders('Item %10')
+    assert protected == 'Item ⟦0⟧' and restore_placeholders(protected, placeholders) == 'Item %10'
+    assert find_placeholder_issues(signatures, {'E': 'Élément %1 de %11'})['E'].blocking
+
+    # %i fait partie des spécificateurs listés dans TRANSLATION_WARNING_NOTE
+    issues = find_placeholder_issues(placeholder_signatures({'F': '%i photos exported'}),
+                                     {'F': 'photos exportées'})
+    assert 'F' in issues and issues['F'].blocking, f"%i perdu non détecté: {issues}"
+
+    print("  [OK] Ordre signalé, placeholder manquant bloquant (dont %i), %1/%2 et %10/%11 réordonnables")
+
+
+def test_inject_rejects_mismatch():
+    """Test du rejet des traductions non conformes par INJECT."""
+    print("\nTEST 2: run_inject_from_dir (placeholders)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        update = {'added': {'$$$/App/UI/Count': '%d photos', '$$$/App/UI/Move': 'Move %s to %d'},
+                  'changed': {}, 'deleted': [], 'renamed': {}}
+        write_file(os.path.join(tmpdir, UPDATE_FILE), json.dumps(update))
+        write_file(os.path.join(tmpdir, "TRANSLATE_fr.txt"),
+                   "[KEY] $$$/App/UI/Count\n[FR] → des photos\n"
+                   "[KEY] $$$/App/UI/Move\n[FR] → Vers %d : déplacer %s\n")
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        write_file(fr_file, '"$$$/App/UI/Other=Autre"\n')
+
+        stats = run_inject_from_dir(tmpdir, tmpdir)['fr']
+        strings = parse_translation_file(fr_file)
+        with open(fr_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        assert stats['placeholder_rejected'] == 1 and stats['placeholder_flagged'] == 1, f"Stats: {stats}"
+        assert strings['$$$/App/UI/Count'] == '%d photos', "Traduction rejetée injectée"
+        assert strings['$$$/App/UI/Move'] == 'Vers %d : déplacer %s'
+        assert content.count('## NEEDS_REVIEW ## Placeholders') == 2, content
+
+        print("  [OK] Traduction sans %d rejetée (EN conservé), ordre différent injecté et signalé")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: common/placeholders.py (validation)")
+    print("=" * 80)
+
+    tests = [
+        test_find_placeholder_issues,
+        test_inject_rejects_mismatch
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
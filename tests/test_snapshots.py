@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+test_snapshots.py
+
+Tests unitaires pour le module common/snapshots.py
+
+Usage:
+    python tests/test_snapshots.py
+    pytest tests/test_snapshots.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from common.snapshots import SnapshotStore, ENTRIES_FILE
+from TM_compare import run_compare_snapshots
+from TM_common import load_update_json, find_update_reference, parse_translation_file
+from helpers import write_file
+
+
+def test_register_shares_entries():
+    """Test de l'enregistrement et du partage des entrées."""
+    print("TEST 1: SnapshotStore.register")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SnapshotStore(tmpdir)
+        first = store.register({'$$$/App/UI/A': 'Apple', '$$$/App/UI/B': 'Banana'}, 'TEST')
+        second = store.register({'$$$/App/UI/A': 'Apple', '$$$/App/UI/B': 'Blueberry'}, 'TEST')
+        again = store.register({'$$$/App/UI/B': 'Banana', '$$$/App/UI/A': 'Apple'}, 'TEST')
+
+        assert again['id'] == first['id'], "Même contenu : même snapshot attendu"
+        assert len(store.snapshots()) == 2, f"Snapshots: {store.snapshots()}"
+        assert store.resolve('latest')['id'] == second['id']
+        assert store.resolve('latest~1')['id'] == first['id']
+
+        with open(os.path.join(store.root, ENTRIES_FILE), 'r', encoding='utf-8') as f:
+            assert len(f.readlines()) == 3, "L'entrée commune doit être stockée une seule fois"
+
+        print("  [OK] 2 snapshots, 3 entrées partagées, 'latest' et 'latest~1' résolus")
+
+
+def test_compare_snapshots():
+    """Test de COMPARE entre deux snapshots."""
+    print("\nTEST 2: run_compare_snapshots")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = SnapshotStore(tmpdir)
+        store.register({'$$$/App/UI/A': 'Apple', '$$$/App/UI/B': 'Banana',
+                        '$$$/App/UI/Old': 'Cherry'}, 'TEST')
+        new_strings = {'$$$/App/UI/A': 'Apple', '$$$/App/UI/B': 'Blueberry',
+                       '$$$/App/UI/New': 'Cherry', '$$$/App/UI/D': 'Date'}
+        store.register(new_strings, 'TEST')
+
+        output_dir = run_compare_snapshots(tmpdir, 'latest~1', 'latest',
+                                           os.path.join(tmpdir, 'out'))
+        update = load_update_json(output_dir)
+
+        assert update['added'] == {'$$$/App/UI/D': 'Date'}, f"Ajoutées: {update['added']}"
+        assert list(update['changed']) == ['$$$/App/UI/B'], f"Modifiées: {update['changed']}"
+        assert update['renamed']['$$$/App/UI/New']['from'] == '$$$/App/UI/Old'
+        assert update['summary']['unchanged'] == 1 and update['summary']['total_new'] == 4
+
+        # Snapshots sans fichier : pas de faux chemin, référence EN écrite dans UPDATE
+        assert update['old_file'] is None and update['new_file'] is None, update
+        reference = find_update_reference(output_dir, update)
+        assert reference and parse_translation_file(reference) == new_strings, "Référence EN absente"
+
+        # Snapshot avec fichier inchangé : le fichier sert de référence
+        en_file = os.path.join(tmpdir, 'TranslatedStrings_en.txt')
+        write_file(en_file, '"$$$/App/UI/A=Apple"\n')
+        store.register({'$$$/App/UI/A': 'Apple'}, 'TEST', en_file)
+        output_dir = run_compare_snapshots(tmpdir, 'latest~1', 'latest', os.path.join(tmpdir, 'out2'))
+        assert find_update_reference(output_dir, load_update_json(output_dir)) == os.path.realpath(en_file)
+
+        print("  [OK] Ajout, modification, renommage et clé inchangée détectés, référence EN retrouvée")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: common/snapshots.py")
+    print("=" * 80)
+
+    tests = [
+        test_register_shares_entries,
+        test_compare_snapshots
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+test_tm_compare.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_compare.py
+
+Usage:
+    python tests/test_tm_compare.py
+    pytest tests/test_tm_compare.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+import json
+
+from TM_compare import run_compare
+from TM_common import load_update_json, find_update_reference
+from helpers import write_file
+
+
+def _make_versions(tmpdir: str):
+    old_file = os.path.join(tmpdir, "old_en.txt")
+    new_file = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+    write_file(old_file, '"$$$/A/Title=Hello"\n"$$$/A/Old=Gone"\n"$$$/A/Same=Same"\n')
+    write_file(new_file, '"$$$/A/Title=Hello!"\n"$$$/A/New=Fresh"\n"$$$/A/Same=Same"\n')
+    return old_file, new_file
+
+
+def test_compact_update():
+    """Test que UPDATE_en.json ne contient que les différences + le hash EN."""
+    print("TEST 1: UPDATE_en.json compact (+ gzip)")
+
+    for compress in (False, True):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_file, new_file = _make_versions(tmpdir)
+            output_dir = run_compare(old_file, new_file, os.path.join(tmpdir, "out"), compress=compress)
+
+            expected = "UPDATE_en.json.gz" if compress else "UPDATE_en.json"
+            assert sorted(os.listdir(output_dir)) == ["CHANGELOG.txt", expected], os.listdir(output_dir)
+
+            data = load_update_json(output_dir)
+            assert data['added'] == {'$$$/A/New': 'Fresh'}, data['added']
+            assert data['deleted'] == ['$$$/A/Old'], data['deleted']
+            assert '$$$/A/Title' in data['changed'], data['changed']
+            assert 'all_new_strings' not in data and 'unchanged_keys' not in data, "Format non compact"
+            assert data['summary']['unchanged'] == 1, data['summary']
+
+            # Le fichier EN de référence est retrouvé grâce à son hash
+            assert find_update_reference(output_dir, data) == os.path.realpath(new_file), \
+                "Référence EN non retrouvée"
+
+    print("  [OK] Différences seules, JSON et gzip")
+
+
+def test_legacy_update():
+    """Test de la lecture de l'ancien format (v1)."""
+    print("\nTEST 2: ancien format UPDATE_en.json")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy = {
+            'summary': {'added': 1, 'changed': 0, 'deleted': 0, 'unchanged': 0},
+            'added': {'$$$/A/New': 'Fresh'}, 'changed': {}, 'deleted': [],
+            'unchanged_keys': [], 'all_new_strings': {'$$$/A/New': 'Fresh'}
+        }
+        with open(os.path.join(tmpdir, "UPDATE_en.json"), 'w', encoding='utf-8') as f:
+            json.dump(legacy, f, indent=2)
+        copy = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+        write_file(copy, '"$$$/A/New=Fresh"\n')
+
+        data = load_update_json(tmpdir)
+        assert data['added'] == legacy['added'], "Ancien format mal lu"
+        assert find_update_reference(tmpdir, data) == copy, "Copie EN (v1) non utilisée"
+
+    print("  [OK] Ancien format lu, copie EN utilisée")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_compare.py")
+    print("=" * 80)
+
+    tests = [
+        test_compact_update,
+        test_legacy_update
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+test_tm_consistency.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_consistency.py
+
+Usage:
+    python tests/test_tm_consistency.py
+    pytest tests/test_tm_consistency.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_consistency import find_inconsistencies, run_consistency, HARMONIZED_MARKER
+from helpers import write_file
+
+
+def test_find_inconsistencies():
+    """Test du regroupement par texte EN et du vote majoritaire."""
+    print("TEST 1: find_inconsistencies")
+
+    en = {'a/Cancel': 'Cancel', 'b/Cancel': 'Cancel ', 'c/Cancel': 'Cancel',
+          'a/OK': 'OK', 'b/OK': 'OK', 'a/Save': 'Save', 'b/Save': 'Save'}
+    fr = {'a/Cancel': 'Annuler', 'b/Cancel': 'Annuler', 'c/Cancel': 'Abandonner',
+          'a/OK': "D'accord", 'b/OK': 'Valider', 'a/Save': 'Enregistrer', 'b/Save': 'Enregistrer'}
+
+    groups = {g.en_text.strip(): g for g in find_inconsistencies(en, fr)}
+
+    assert set(groups) == {'Cancel', 'OK'}, f"Groupes: {list(groups)}"
+    assert groups['Cancel'].majority == 'Annuler', f"Majorité: {groups['Cancel'].majority}"
+    assert groups['OK'].majority is None, "Égalité : pas de majorité attendue"
+
+    print("  [OK] Cancel → Annuler, OK sans majorité, Save cohérent ignoré")
+
+
+def test_apply_propagates_majority():
+    """Test de la propagation de la traduction majoritaire."""
+    print("\nTEST 2: run_consistency(apply=True)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"),
+                   '"$$$/App/A/Cancel=Cancel"\n"$$$/App/B/Cancel=Cancel"\n"$$$/App/C/Cancel=Cancel"\n')
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        write_file(fr_file,
+                   '"$$$/App/A/Cancel=Annuler"\n"$$$/App/B/Cancel=Annuler"\n"$$$/App/C/Cancel=Cancel"\n')
+
+        results = run_consistency(tmpdir, apply=True)
+        result = parse_translation_file(fr_file)
+
+        assert results['fr']['propagated'] == 1, f"Résultat: {results['fr']}"
+        assert result['$$$/App/C/Cancel'] == 'Annuler', "Clé non traduite non harmonisée"
+        with open(fr_file, 'r', encoding='utf-8') as f:
+            assert HARMONIZED_MARKER in f.read(), "Marqueur de relecture absent"
+
+        print("  [OK] Clé non traduite harmonisée et marquée pour relecture")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_consistency.py")
+    print("=" * 80)
+
+    tests = [
+        test_find_inconsistencies,
+        test_apply_propagates_majority
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+test_tm_coverage.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_coverage.py
+
+Usage:
+    python tests/test_tm_coverage.py
+    pytest tests/test_tm_coverage.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_coverage import language_coverage, update_coverage, coverage_matrix, render_coverage_csv
+from helpers import write_file
+
+
+def test_language_coverage():
+    """Test du comptage par catégorie."""
+    print("TEST 1: language_coverage")
+
+    en = {'$$$/App/UI/A': 'Apple', '$$$/App/UI/B': 'Banana', '$$$/App/UI/C': 'Cherry',
+          '$$$/App/Dialog/D': 'Date'}
+    fr = {'$$$/App/UI/A': 'Pomme', '$$$/App/UI/B': 'Banana', '$$$/App/UI/C': 'Cerise'}
+    markers = {'$$$/App/UI/B': '-- ## NEW ## À traduire',
+               '$$$/App/UI/C': '-- ## NEEDS_REVIEW ## Texte EN modifié'}
+
+    result = language_coverage(en, fr, markers)
+
+    assert result['UI'] == {'total': 3, 'translated': 2, 'identical': 1,
+                            'new': 1, 'needs_review': 1, 'missing': 0}, f"UI: {result['UI']}"
+    assert result['Dialog']['missing'] == 1, f"Dialog: {result['Dialog']}"
+
+    print("  [OK] Traduites, identiques, NEW, NEEDS_REVIEW et manquantes par catégorie")
+
+
+def test_update_coverage_incremental():
+    """Test de la mise à jour incrémentale de l'index."""
+    print("\nTEST 2: update_coverage (incrémental)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"),
+                   '"$$$/App/UI/A=Apple"\n"$$$/App/UI/B=Banana"\n')
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        write_file(fr_file, '"$$$/App/UI/A=Pomme"\n"$$$/App/UI/B=Banana"\n')
+        write_file(os.path.join(tmpdir, "TranslatedStrings_de.txt"), '"$$$/App/UI/A=Apfel"\n')
+
+        update_coverage(tmpdir)
+        write_file(fr_file, '"$$$/App/UI/A=Pomme"\n"$$$/App/UI/B=Banane jaune"\n')
+        matrix = coverage_matrix(update_coverage(tmpdir))
+
+        assert matrix['fr']['totals']['translated'] == 2, "Modification de fr non prise en compte"
+        assert matrix['de']['totals']['missing'] == 1, f"de: {matrix['de']['totals']}"
+        assert render_coverage_csv(matrix).splitlines()[1] == 'de,*,2,1,0,0,0,1'
+
+        print("  [OK] Fichier modifié recalculé, CSV conforme")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_coverage.py")
+    print("=" * 80)
+
+    tests = [
+        test_language_coverage,
+        test_update_coverage_incremental
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+test_tm_extract.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_extract.py
+
+Usage:
+    python tests/test_tm_extract.py
+    pytest tests/test_tm_extract.py  (si pytest installé)
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_extract import plan_chunks, run_extract_chunks
+from TM_inject import run_inject_from_dir
+from helpers import write_file
+
+
+def test_plan_chunks():
+    """Test du découpage équilibré par catégorie."""
+    print("TEST 1: plan_chunks")
+
+    weights = {'A': 50, 'B': 40, 'C': 30, 'D': 20, 'E': 10}
+    plan = plan_chunks(weights, 3)
+
+    assert sorted(cat for part in plan for cat in part) == sorted(weights), "Catégorie perdue"
+    loads = sorted(sum(weights[cat] for cat in part) for part in plan)
+    assert loads == [50, 50, 50], f"Parties déséquilibrées: {loads}"
+    assert len(plan_chunks({'A': 1}, 4)) == 1, "Plus de parties que de catégories"
+
+    print(f"  [OK] {plan}")
+
+
+def test_chunks_inject_subset():
+    """Test qu'INJECT accepte un sous-ensemble des parties, de façon idempotente."""
+    print("\nTEST 2: EXTRACT --chunks puis INJECT partiel")
+
+    update_data = {
+        'format': 2,
+        'added': {f'$$$/P/Cat{c}/Key{i}': f'Text {c}{i}' for c in range(4) for i in range(2)},
+        'changed': {}, 'deleted': [], 'renamed': {}
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        update_dir = os.path.join(tmpdir, 'update')
+        locales = os.path.join(tmpdir, 'locales')
+        os.makedirs(update_dir)
+        os.makedirs(locales)
+        write_file(os.path.join(update_dir, 'UPDATE_en.json'), json.dumps(update_data))
+        fr_file = os.path.join(locales, 'TranslatedStrings_fr.txt')
+        write_file(fr_file, '"$$$/P/Old=Ancien"\n')
+
+        files = run_extract_chunks(update_dir, 'fr', locales, chunks=2)
+        parts = [f for f in files if f.endswith('.txt')]
+        assert len(parts) == 2, f"Parties: {files}"
+
+        # Seule la 2e partie est rendue (traduite)
+        with open(parts[0], 'r', encoding='utf-8') as f:
+            first_part = f.read()
+        os.remove(parts[0])
+        with open(parts[1], 'r', encoding='utf-8') as f:
+            content = f.read().replace('[FR] → \n', '[FR] → Traduit\n')
+        write_file(parts[1], content)
+
+        results = run_inject_from_dir(update_dir, locales)
+        assert results['fr']['parts'] == [2] and results['fr']['parts_total'] == 2, results
+        translated = parse_translation_file(fr_file)
+
+        # Réinjection : aucun changement
+        again = run_inject_from_dir(update_dir, locales)
+        assert again['fr']['written'] is False, "Réinjection non idempotente"
+
+        # La 1re partie arrive ensuite
+        write_file(parts[0], first_part)
+        run_inject_from_dir(update_dir, locales)
+        final = parse_translation_file(fr_file)
+
+        assert final['$$$/P/Old'] == 'Ancien', "Traduction existante perdue"
+        assert all(final[k] == 'Traduit' for k, v in translated.items() if v == 'Traduit'), \
+            "Partie 2 écrasée par la partie 1"
+        assert set(update_data['added']) <= set(final), "Clés manquantes après toutes les parties"
+
+        print("  [OK] Parties injectées dans le désordre, réinjection sans effet")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_extract.py")
+    print("=" * 80)
+
+    tests = [
+        test_plan_chunks,
+        test_chunks_inject_subset
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
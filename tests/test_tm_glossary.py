@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+test_tm_glossary.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_glossary.py
+
+Usage:
+    python tests/test_tm_glossary.py
+    pytest tests/test_tm_glossary.py  (si pytest installé)
+"""
+
+import os
+import sys
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_glossary import AhoCorasick, Glossary, TermRule
+
+
+def test_aho_corasick():
+    """Test de la recherche multi-motifs (mots entiers, insensible à la casse)."""
+    print("TEST 1: AhoCorasick")
+
+    matcher = AhoCorasick(["album", "publish service", "service", "he", "she"])
+
+    assert matcher.find("Publish Service for this album") == {0, 1, 2}
+    assert matcher.find("Albums and photoalbum") == set(), "Mot partiel accepté"
+    assert matcher.find("she said he") == {3, 4}, "Motifs imbriqués manqués"
+
+    print("  [OK] Mots entiers trouvés, mots partiels ignorés")
+
+
+def test_glossary_check():
+    """Test des termes imposés et interdits."""
+    print("\nTEST 2: Glossary.check")
+
+    glossary = Glossary({
+        'Piwigo': {'*': TermRule(required=['Piwigo'])},
+        'album': {'de': TermRule(required=['Album'], forbidden=['Fotoalbum'])},
+    })
+    en = {'$$$/P/A': 'Create album on Piwigo', '$$$/P/B': 'Open Piwigo', '$$$/P/C': 'Albums'}
+    de = {'$$$/P/A': 'Fotoalbum auf Piwigo erstellen', '$$$/P/B': 'Piwigo öffnen', '$$$/P/C': 'Albums'}
+    fr = {'$$$/P/A': 'Créer un album sur Piwigo', '$$$/P/B': 'Ouvrir PWG', '$$$/P/C': 'Albums'}
+
+    de_kinds = sorted(v.kind for v in glossary.check('de', en, de))
+    assert de_kinds == ['forbidden', 'missing'], f"DE: {de_kinds}"
+
+    fr_violations = glossary.check('fr', en, fr)
+    assert [(v.key, v.term) for v in fr_violations] == [('$$$/P/B', 'Piwigo')], fr_violations
+
+    print("  [OK] Forme interdite et forme manquante détectées")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_glossary.py")
+    print("=" * 80)
+
+    tests = [
+        test_aho_corasick,
+        test_glossary_check
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+test_tm_jobs.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_jobs.py
+
+Usage:
+    python tests/test_tm_jobs.py
+    pytest tests/test_tm_jobs.py  (si pytest installé)
+"""
+
+import io
+import os
+import sys
+import json
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_jobs import load_job, run_job
+from helpers import write_file
+
+
+def test_load_job_validation():
+    """Test de la validation des commandes et paramètres."""
+    print("TEST 1: load_job")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        job_file = os.path.join(tmpdir, "job.json")
+        write_file(job_file, json.dumps([{"command": "coverage", "locales": tmpdir}]))
+        assert load_job(job_file) == {'steps': [{"command": "coverage", "locales": tmpdir}]}
+
+        for step, expected in (({"command": "deploy"}, "commande inconnue"),
+                               ({"command": "sync", "lcoales": tmpdir}, "lcoales")):
+            write_file(job_file, json.dumps({"steps": [step]}))
+            try:
+                load_job(job_file)
+                assert False, f"Étape invalide acceptée: {step}"
+            except ValueError as e:
+                assert expected in str(e), f"Message: {e}"
+
+        print("  [OK] Liste d'étapes acceptée, commande et paramètre inconnus refusés")
+
+
+def test_run_job():
+    """Test de l'exécution d'une suite d'étapes."""
+    print("\nTEST 2: run_job")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"), '"$$$/App/UI/A=Apple"\n"$$$/App/UI/B=Banana"\n')
+        write_file(os.path.join(tmpdir, "TranslatedStrings_fr.txt"), '"$$$/App/UI/A=Pomme"\n')
+        csv_file = os.path.join(tmpdir, "coverage.csv")
+        job = {"memory": None, "defaults": {"jobs": 1}, "steps": [
+            {"command": "sync", "ref": os.path.join(tmpdir, "TranslatedStrings_en.txt")},
+            {"command": "coverage", "locales": tmpdir, "format": "csv", "output": csv_file},
+            {"command": "prune", "locales": tmpdir},
+            {"command": "coverage", "locales": tmpdir}
+        ]}
+
+        log = io.StringIO()
+        result = run_job(job, log=log)
+        steps = result['steps']
+
+        assert not result['ok'] and len(steps) == 3, "Le job doit s'arrêter à la première erreur"
+        assert steps[0]['result']['fr']['added'] == 1, f"SYNC: {steps[0]}"
+        assert steps[0]['outputs'] == [os.path.join(tmpdir, "TranslatedStrings_fr.txt")]
+        assert steps[1]['outputs'] == [csv_file] and os.path.isfile(csv_file)
+        assert 'plugin_path' in steps[2]['error'], f"Erreur: {steps[2]}"
+        assert all(isinstance(step['seconds'], float) for step in steps)
+        json.dumps(result)
+
+        print("  [OK] Statistiques, fichiers et durées par étape ; arrêt sur erreur")
+
+
+def test_workspace_outputs():
+    """Test des fichiers écrits par l'étape workspace (chemins en double)."""
+    print("\nTEST 3: run_job (workspace)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plugin_p = os.path.join(tmpdir, "x", "p")
+        plugin_q = os.path.join(tmpdir, "y", "q")
+        for path, prefix, fr in ((plugin_p, 'P', 'Annuler'), (plugin_q, 'Q', 'Cancel')):
+            os.makedirs(path)
+            write_file(os.path.join(path, "TranslatedStrings_en.txt"), f'"$$$/{prefix}/UI/C=Cancel"\n')
+            write_file(os.path.join(path, "TranslatedStrings_fr.txt"), f'"$$$/{prefix}/UI/C={fr}"\n')
+
+        job = {"memory": None, "steps": [
+            {"command": "workspace", "plugins": [plugin_p, plugin_p + os.sep, plugin_q], "jobs": 1}
+        ]}
+        result = run_job(job, log=io.StringIO())
+        step = result['steps'][0]
+
+        assert result['ok'], f"Erreur: {step}"
+        assert step['outputs'] == [os.path.join(plugin_q, "TranslatedStrings_fr.txt")], \
+            f"Fichiers: {step['outputs']}"
+
+        print("  [OK] Fichier écrit rattaché au bon plugin malgré le chemin en double")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_jobs.py")
+    print("=" * 80)
+
+    tests = [
+        test_load_job_validation,
+        test_run_job,
+        test_workspace_outputs
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_tm_memory.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_memory.py
+
+Usage:
+    python tests/test_tm_memory.py
+    pytest tests/test_tm_memory.py  (si pytest installé)
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_memory import TranslationMemory, normalize_text, get_memory_path, set_memory_path
+from TM_common import UPDATE_FILE
+from TM_inject import run_inject_from_dir
+from TM_sync import run_sync
+from helpers import write_file
+
+
+def test_store_and_lookup():
+    """Test de l'enregistrement et de la recherche (texte normalisé)."""
+    print("TEST 1: store_many + lookup_many")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with TranslationMemory(os.path.join(tmpdir, "tm.sqlite")) as memory:
+            stored = memory.store_many('fr', [
+                ("Hello  world", "Bonjour le monde", "$$$/App/Hello"),
+                ("Cancel", "Cancel", "$$$/App/Cancel"),   # Non traduit : ignoré
+                ("Empty", "", "$$$/App/Empty"),           # Vide : ignoré
+            ])
+            assert stored == 1, f"Entrées enregistrées: {stored}"
+
+            found = memory.lookup_many([" Hello world ", "Cancel", "Unknown"], 'fr')
+            assert found == {" Hello world ": "Bonjour le monde"}, f"Recherche: {found}"
+            assert memory.lookup("Hello world", 'de') is None, "Langue non isolée"
+            assert normalize_text("  a \t b ") == "a b", "Normalisation incorrecte"
+
+        print("  [OK] Traduction retrouvée malgré les espaces, langues isolées")
+
+
+def test_update_translation():
+    """Test qu'une nouvelle traduction remplace l'ancienne."""
+    print("\nTEST 2: mise à jour d'une traduction")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "tm.sqlite")
+        with TranslationMemory(path) as memory:
+            memory.store_many('fr', [("Upload", "Envoyer", None)])
+            memory.store_many('fr', [("Upload", "Téléverser", None)])
+
+        # Nouvelle connexion : données persistées
+        with TranslationMemory(path) as memory:
+            assert memory.lookup("Upload", 'fr') == "Téléverser", "Traduction non mise à jour"
+            assert memory.count() == 1, "Doublon créé"
+
+        print("  [OK] Traduction mise à jour et persistée")
+
+
+def test_inject_stores_injected_keys_only():
+    """Test qu'INJECT n'enregistre que les traductions de la partie injectée, retenues par la fusion."""
+    print("\nTEST 3: Alimentation par INJECT (une partie)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        update = {'added': {'$$$/App/Del': 'Delete'},
+                  'changed': {'$$$/App/Save': {'old': 'Save', 'new': 'Save as copy'}},
+                  'deleted': [], 'renamed': {}}
+        write_file(os.path.join(tmpdir, UPDATE_FILE), json.dumps(update))
+        write_file(os.path.join(tmpdir, "TRANSLATE_fr.part01.txt"),
+                   "[KEY] $$$/App/Del\n[FR] → Supprimer\n")
+        # Ancienne traduction de Save, absente de la partie injectée
+        write_file(os.path.join(tmpdir, "TranslatedStrings_fr.txt"), '"$$$/App/Save=Enregistrer"\n')
+
+        previous = get_memory_path()
+        set_memory_path(os.path.join(tmpdir, "tm.sqlite"))
+        try:
+            run_inject_from_dir(tmpdir, tmpdir)
+        finally:
+            set_memory_path(previous)
+
+        with TranslationMemory(os.path.join(tmpdir, "tm.sqlite")) as memory:
+            found = memory.lookup_many(['Delete', 'Save as copy'], 'fr')
+
+        assert found == {'Delete': 'Supprimer'}, f"Mémoire: {found}"
+
+        print("  [OK] Seule la traduction injectée de la partie est enregistrée")
+
+
+def test_sync_skips_unreviewed():
+    """Test que SYNC n'enregistre pas les traductions marquées à relire."""
+    print("\nTEST 4: Alimentation par SYNC (marqueurs)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"),
+                   '"$$$/App/A=Apple"\n"$$$/App/B=Banana"\n"$$$/App/C=Cherry"\n')
+        write_file(os.path.join(tmpdir, "TranslatedStrings_fr.txt"),
+                   '"$$$/App/A=Pomme"\n'
+                   '-- ## NEW ## Pré-traduit (pseudo, à relire)\n"$$$/App/B=[fr] Bànàñà"\n'
+                   '-- ## NEEDS_REVIEW ## Texte EN modifié\n"$$$/App/C=Cerise"\n')
+
+        previous = get_memory_path()
+        set_memory_path(os.path.join(tmpdir, "tm.sqlite"))
+        try:
+            run_sync(tmpdir, jobs=1)
+        finally:
+            set_memory_path(previous)
+
+        with TranslationMemory(os.path.join(tmpdir, "tm.sqlite")) as memory:
+            found = memory.lookup_many(['Apple', 'Banana', 'Cherry'], 'fr')
+
+        assert found == {'Apple': 'Pomme'}, f"Mémoire: {found}"
+
+        print("  [OK] Traductions [NEW] et [NEEDS_REVIEW] non enregistrées")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_memory.py")
+    print("=" * 80)
+
+    tests = [
+        test_store_and_lookup,
+        test_update_translation,
+        test_inject_stores_injected_keys_only,
+        test_sync_skips_unreviewed
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+test_tm_merge.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_merge.py
+
+Usage:
+    python tests/test_tm_merge.py
+    pytest tests/test_tm_merge.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_merge import three_way_merge, conflicts_path
+from TM_sync import run_sync
+from TM_inject import run_inject
+from helpers import write_file
+
+
+def test_three_way_merge():
+    """Test de la fusion clé par clé."""
+    print("TEST 1: three_way_merge")
+
+    base = {'a': 'A', 'b': 'B', 'c': 'C', 'd': 'D'}
+    ours = {'a': 'A', 'b': 'B local', 'c': 'C local', 'd': 'D'}
+    theirs = {'a': 'A new', 'b': 'B', 'c': 'C other', 'e': 'E'}
+
+    result = three_way_merge(base, ours, theirs)
+
+    assert result.merged == {'a': 'A new', 'b': 'B local', 'c': 'C local', 'e': 'E'}, \
+        f"Fusion incorrecte: {result.merged}"
+    assert list(result.conflicts) == ['c'], f"Conflits: {result.conflicts}"
+    assert result.conflicts['c'] == {'base': 'C', 'file': 'C local', 'incoming': 'C other'}
+    assert result.kept_local == ['b'], f"Modifications locales: {result.kept_local}"
+
+    print("  [OK] a ← entrant, b ← fichier, c en conflit, d supprimée, e ajoutée")
+
+
+def test_inject_keeps_direct_edits():
+    """Test qu'INJECT ne perd pas les modifications directes du fichier."""
+    print("\nTEST 2: INJECT après modification directe")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"),
+                   '"$$$/App/UI/A=Apple"\n"$$$/App/UI/B=Banana"\n"$$$/App/UI/C=Cherry"\n')
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        write_file(fr_file, '"$$$/App/UI/A=Pomme"\n"$$$/App/UI/B=Banane"\n"$$$/App/UI/C=Cherry"\n')
+
+        # SYNC enregistre la base
+        run_sync(tmpdir, jobs=1)
+
+        # Traducteur 1 : modification directe de A et B
+        with open(fr_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        content = content.replace('Pomme', 'Pomme (édité)').replace('Banane', 'Banane (édité)')
+        write_file(fr_file, content)
+
+        # Traducteur 2 : TRANSLATE_fr.txt pour A et C
+        translate = os.path.join(tmpdir, "TRANSLATE_fr.txt")
+        write_file(translate,
+                   '[KEY] $$$/App/UI/A\n[EN] Apple\n[FR] → Pomme rouge\n\n'
+                   '[KEY] $$$/App/UI/C\n[EN] Cherry\n[FR] → Cerise\n')
+
+        stats = run_inject(translate, fr_file)
+        result = parse_translation_file(fr_file)
+
+        assert result['$$$/App/UI/A'] == 'Pomme (édité)', "Conflit : la valeur du fichier doit rester"
+        assert result['$$$/App/UI/B'] == 'Banane (édité)', "Modification directe perdue"
+        assert result['$$$/App/UI/C'] == 'Cerise', "Traduction TRANSLATE non appliquée"
+        assert stats['conflicts'] == 1, f"Conflits: {stats}"
+
+        with open(conflicts_path(fr_file), 'r', encoding='utf-8') as f:
+            sidecar = f.read()
+        assert '[ENTRANT] Pomme rouge' in sidecar, "Conflit absent du fichier CONFLICTS"
+
+        print("  [OK] Modification directe conservée, conflit écrit dans CONFLICTS_fr.txt")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_merge.py")
+    print("=" * 80)
+
+    tests = [
+        test_three_way_merge,
+        test_inject_keeps_direct_edits
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+test_tm_parser.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_parser.py
+
+Usage:
+    python tests/test_tm_parser.py
+    pytest tests/test_tm_parser.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+import TM_parser
+from TM_parser import (
+    parse_translation_file, parse_translation_file_cached,
+    set_parse_cache_dir, invalidate_parse_cache
+)
+from helpers import write_file
+
+
+SAMPLE = (
+    '-- Header\n'
+    '\n'
+    '"$$$/App/Title=Hello"\n'
+    '"$$$/App/Msg=Value with = sign"\n'
+    'garbage line\n'
+    '"$$$/App/Empty="\n'
+)
+
+
+def test_parse_and_malformed():
+    """Test du parsing et du signalement des lignes mal formées."""
+    print("TEST 1: parsing + lignes mal formées")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+        write_file(path, SAMPLE)
+
+        parsed = parse_translation_file_cached(path)
+
+        assert parsed.strings == {
+            '$$$/App/Title': 'Hello',
+            '$$$/App/Msg': 'Value with = sign',
+            '$$$/App/Empty': '',
+        }, f"Parsing incorrect: {parsed.strings}"
+        assert parsed.malformed == [(5, 'garbage line')], f"Malformées: {parsed.malformed}"
+
+        print(f"  [OK] {len(parsed.strings)} clés, ligne 5 signalée")
+
+
+def test_memory_cache():
+    """Test que le cache mémoire est réutilisé puis invalidé si le fichier change."""
+    print("\nTEST 2: cache mémoire (mtime + taille)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+        write_file(path, SAMPLE)
+
+        first = parse_translation_file_cached(path)
+        assert parse_translation_file_cached(path) is first, "Le cache n'a pas été utilisé"
+
+        # La copie retournée est modifiable sans toucher au cache
+        copy = parse_translation_file(path)
+        copy['$$$/App/Title'] = 'Changed'
+        assert first.strings['$$$/App/Title'] == 'Hello', "Le cache a été modifié"
+
+        write_file(path, SAMPLE + '"$$$/App/New=New"\n')
+        second = parse_translation_file_cached(path)
+        assert second is not first, "Fichier modifié non détecté"
+        assert second.strings['$$$/App/New'] == 'New', "Nouvelle clé absente"
+
+        print("  [OK] Cache réutilisé puis invalidé")
+
+
+def test_disk_cache():
+    """Test du cache disque (pickle)."""
+    print("\nTEST 3: cache disque")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+        cache_dir = os.path.join(tmpdir, "parse_cache")
+        write_file(path, SAMPLE)
+
+        set_parse_cache_dir(cache_dir)
+        try:
+            invalidate_parse_cache()
+            parse_translation_file_cached(path)
+            assert len(os.listdir(cache_dir)) == 1, "Cache disque non écrit"
+
+            # Nouveau "processus" : seul le cache disque est disponible
+            invalidate_parse_cache()
+            original = TM_parser.parse_lines
+            TM_parser.parse_lines = None  # Ne doit pas être appelé
+            try:
+                parsed = parse_translation_file_cached(path)
+            finally:
+                TM_parser.parse_lines = original
+            assert parsed.strings['$$$/App/Title'] == 'Hello', "Cache disque incorrect"
+        finally:
+            set_parse_cache_dir(None)
+
+        print("  [OK] Résultat relu depuis le cache disque")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_parser.py")
+    print("=" * 80)
+
+    tests = [
+        test_parse_and_malformed,
+        test_memory_cache,
+        test_disk_cache
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+test_tm_pipeline.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_pipeline.py
+
+Usage:
+    python tests/test_tm_pipeline.py
+    pytest tests/test_tm_pipeline.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_pipeline import run_pipeline
+from TM_compare import run_compare
+from TM_extract import run_extract_all
+from TM_sync import run_sync
+from helpers import write_file
+
+
+OLD_EN = '"$$$/A/Title=Hello"\n"$$$/A/Msg=World"\n"$$$/A/Old=Gone"\n'
+NEW_EN = '"$$$/A/Title=Hello"\n"$$$/A/Msg=World!"\n"$$$/A/New=Fresh"\n'
+FR = '"$$$/A/Title=Bonjour"\n"$$$/A/Msg=Monde"\n"$$$/A/Old=Parti"\n'
+
+
+def _setup(root: str):
+    os.makedirs(os.path.join(root, "old"))
+    os.makedirs(os.path.join(root, "loc"))
+    write_file(os.path.join(root, "old", "TranslatedStrings_en.txt"), OLD_EN)
+    write_file(os.path.join(root, "loc", "TranslatedStrings_en.txt"), NEW_EN)
+    write_file(os.path.join(root, "loc", "TranslatedStrings_fr.txt"), FR)
+
+
+def _read(path: str) -> str:
+    """Lit un fichier sans les lignes d'horodatage / de source."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return ''.join(line for line in f
+                       if not line.startswith(('-- Generated:', '# Généré:', '# Source:')))
+
+
+def test_pipeline_matches_steps():
+    """Test que PIPELINE produit les mêmes fichiers que COMPARE + EXTRACT + SYNC."""
+    print("TEST 1: pipeline == compare + extract + sync")
+
+    with tempfile.TemporaryDirectory() as steps, tempfile.TemporaryDirectory() as piped:
+        _setup(steps)
+        _setup(piped)
+
+        out = run_compare(os.path.join(steps, "old"), os.path.join(steps, "loc"),
+                          os.path.join(steps, "out"))
+        run_extract_all(out, os.path.join(steps, "loc"))
+        run_sync(None, os.path.join(steps, "loc"), out, jobs=1)
+
+        result = run_pipeline(os.path.join(piped, "old"), os.path.join(piped, "loc"),
+                              output_dir=os.path.join(piped, "out"), jobs=1)
+
+        assert result['sync']['fr']['needs_review'] == 1, result['sync']
+        assert [os.path.basename(f) for f in result['translate_files']] == ["TRANSLATE_fr.txt"]
+
+        for rel in ("out/TRANSLATE_fr.txt", "out/CHANGELOG.txt", "loc/TranslatedStrings_fr.txt"):
+            expected = _read(os.path.join(steps, rel))
+            actual = _read(os.path.join(piped, rel))
+            if rel.endswith("CHANGELOG.txt"):
+                # Les chemins et dates diffèrent : comparer seulement les lignes de clés
+                expected = [l for l in expected.splitlines() if '$$$/' in l and 'python' not in l]
+                actual = [l for l in actual.splitlines() if '$$$/' in l and 'python' not in l]
+            assert expected == actual, f"Contenu différent: {rel}"
+
+        print("  [OK] TRANSLATE, CHANGELOG et langues identiques")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_pipeline.py")
+    print("=" * 80)
+
+    tests = [
+        test_pipeline_matches_steps
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+test_tm_pretranslate.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_pretranslate.py
+
+Usage:
+    python tests/test_tm_pretranslate.py
+    pytest tests/test_tm_pretranslate.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_merge import load_base_snapshot
+from TM_pretranslate import PseudoBackend, MTCache, translate_texts, run_pretranslate
+from helpers import write_file
+
+
+class CountingBackend(PseudoBackend):
+    """Pseudo-localisation qui compte les lots et perd le jeton de 'Broken %s'."""
+    name = 'counting'
+    batch_size = 2
+
+    def __init__(self):
+        self.batches = 0
+
+    def translate_batch(self, texts, lang):
+        self.batches += 1
+        results = super().translate_batch(texts, lang)
+        return [r.replace('⟦0⟧', '') if t.startswith('Broken') else r for t, r in zip(texts, results)]
+
+
+def test_translate_texts_batches_and_cache():
+    """Test du découpage en lots, de la protection des placeholders et du cache."""
+    print("TEST 1: translate_texts (lots + placeholders + cache)")
+
+    texts = ['Save %s\\n', 'Open', 'Close', 'Broken %s', 'Open']
+    backend = CountingBackend()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = MTCache(os.path.join(tmpdir, 'mt.sqlite'))
+        try:
+            first = translate_texts(backend, {'fr': texts, 'de': texts}, cache, workers=3)
+            assert backend.batches == 4, f"Lots: {backend.batches}"   # 4 textes uniques x 2 langues / 2
+            assert first['fr']['Save %s\\n'] == '[fr] Sàvé %s\\n', first['fr']
+            assert 'Broken %s' not in first['fr'], "Placeholder perdu accepté"
+
+            second = translate_texts(backend, {'fr': ['Open', 'Close']}, cache)
+            assert backend.batches == 4, "Le cache n'a pas été utilisé"
+            assert second['fr'] == {'Open': first['fr']['Open'], 'Close': first['fr']['Close']}
+        finally:
+            cache.close()
+
+    print("  [OK] 4 lots, placeholder perdu rejeté, 2e appel servi par le cache")
+
+
+def test_run_pretranslate():
+    """Test du pré-remplissage des clés [NEW] et des clés absentes."""
+    print("\nTEST 2: run_pretranslate")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, 'TranslatedStrings_en.txt'),
+                   '"$$$/P/UI/A=Hello"\n"$$$/P/UI/B=Cancel"\n"$$$/P/UI/C=OK"\n"$$$/P/UI/D=Open"\n')
+        fr_file = os.path.join(tmpdir, 'TranslatedStrings_fr.txt')
+        write_file(fr_file, '-- ## NEW ## À traduire\n"$$$/P/UI/A=Hello"\n'
+                            '"$$$/P/UI/B=Annuler"\n"$$$/P/UI/C=OK"\n')
+
+        results = run_pretranslate(tmpdir, backend=PseudoBackend(), cache_path=None)
+        fr = parse_translation_file(fr_file)
+
+        assert results['fr']['translated'] == 2, results
+        assert fr == {'$$$/P/UI/A': '[fr] Héllö', '$$$/P/UI/B': 'Annuler',
+                      '$$$/P/UI/C': 'OK', '$$$/P/UI/D': '[fr] Öpéñ'}, fr
+        with open(fr_file, 'r', encoding='utf-8') as f:
+            assert f.read().count('## NEW ## Pré-traduit (pseudo') == 2, "Marqueurs absents"
+        assert load_base_snapshot(fr_file) is None, "Base de fusion modifiée par des traductions non relues"
+
+    print("  [OK] Clés [NEW] et absentes pré-remplies, valeur identique à l'EN sans marqueur conservée")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_pretranslate.py")
+    print("=" * 80)
+
+    tests = [
+        test_translate_texts_batches_and_cache,
+        test_run_pretranslate
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+test_tm_prune.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_prune.py
+
+Usage:
+    python tests/test_tm_prune.py
+    pytest tests/test_tm_prune.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_prune import run_prune
+from common.lua_sources import scan_key_references
+from helpers import write_file
+
+
+LUA_SOURCE = '''local title = LOC "$$$/App/UI/Title=Hello"
+local other = LOC('$$$/App/UI/Other=Other')
+local status = LOC("$$$/App/Status/" .. name)
+local messages = { error = "$$$/App/UI/Error=Error" }
+'''
+
+
+def test_scan_key_references():
+    """Test du relevé des clés dans les sources Lua."""
+    print("TEST 1: scan_key_references")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "Main.lua"), LUA_SOURCE)
+        write_file(os.path.join(tmpdir, "JSON.lua"), 'local x = LOC "$$$/App/UI/Json=Json"\n')
+
+        keys, prefixes = scan_key_references(tmpdir)
+
+        assert keys == {'$$$/App/UI/Title', '$$$/App/UI/Other', '$$$/App/UI/Error'}, \
+            f"Clés: {keys}"
+        assert prefixes == {'$$$/App/Status/'}, f"Préfixes: {prefixes}"
+
+        print("  [OK] LOC \"...\", LOC('...'), table et préfixe dynamique ; JSON.lua ignoré")
+
+
+def test_prune_remove():
+    """Test de la suppression des clés mortes dans EN et les langues."""
+    print("\nTEST 2: run_prune(remove=True)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_file(os.path.join(tmpdir, "Main.lua"), LUA_SOURCE)
+        en_file = os.path.join(tmpdir, "TranslatedStrings_en.txt")
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        write_file(en_file, '"$$$/App/UI/Title=Hello"\n"$$$/App/UI/Dead=Dead"\n'
+                        '"$$$/App/Status/Done=Done"\n')
+        write_file(fr_file, '"$$$/App/UI/Title=Bonjour"\n"$$$/App/UI/Dead=Mort"\n'
+                        '"$$$/App/Status/Done=Terminé"\n')
+
+        result = run_prune(tmpdir, remove=True)
+
+        assert result['dead'] == ['$$$/App/UI/Dead'], f"Clés mortes: {result['dead']}"
+        assert '$$$/App/UI/Other' in result['missing'], "Clé absente de l'EN non signalée"
+        for path in (en_file, fr_file):
+            keys = parse_translation_file(path)
+            assert '$$$/App/UI/Dead' not in keys, f"Clé morte restée dans {path}"
+            assert '$$$/App/Status/Done' in keys, "Clé dynamique supprimée"
+
+        print("  [OK] Clé morte supprimée partout, clé du préfixe dynamique conservée")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_prune.py")
+    print("=" * 80)
+
+    tests = [
+        test_scan_key_references,
+        test_prune_remove
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+test_tm_pseudo.py
+
+Tests unitaires pour le module TM_pseudo.py (pseudo-localisation)
+
+Usage:
+    python tests/test_tm_pseudo.py
+    pytest tests/test_tm_pseudo.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_pseudo import pseudo_localize, parse_expansion, run_pseudo
+from TM_common import parse_translation_file
+
+
+def test_pseudo_localize():
+    """Test de la pseudo-localisation d'un texte."""
+    print("TEST 1: pseudo_localize")
+
+    text = "  Upload %s photos to API...\\n"
+    pseudo = pseudo_localize(text, '$$$/App/UI/Upload', expansion=0.5)
+
+    assert pseudo.startswith('  [') and pseudo.endswith(']'), f"Espaces / crochets: {pseudo!r}"
+    for segment in ('%s', 'API...', '\\n'):
+        assert segment in pseudo, f"{segment} doit être conservé: {pseudo!r}"
+    assert 'Upload' not in pseudo and 'Ûpľöåð' in pseudo, f"Accents: {pseudo!r}"
+    assert len(pseudo) >= len(text) * 1.5, f"Allongement insuffisant: {pseudo!r}"
+    assert pseudo == pseudo_localize(text, '$$$/App/UI/Upload', expansion=0.5), "Non déterministe"
+    assert pseudo_localize("Cancel", expansion=0, accents=False, brackets=False) == "Cancel"
+    assert parse_expansion('+50%') == 0.5 and parse_expansion('0.3') == 0.3
+
+    print("  [OK] Placeholders, '...', majuscules et espaces conservés, résultat déterministe")
+
+
+def test_run_pseudo():
+    """Test de la génération du fichier pseudo-localisé."""
+    print("\nTEST 2: run_pseudo")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        en_file = os.path.join(tmpdir, 'TranslatedStrings_en.txt')
+        with open(en_file, 'w', encoding='utf-8') as f:
+            f.write("-- Plugin Localization - EN\n"
+                    "-- Generated: 2026-01-01 00:00:00\n"
+                    "\n"
+                    "-- UI\n"
+                    '"$$$/App/UI/Cancel=Cancel"\n'
+                    '"$$$/App/UI/Count=%d photos"\n')
+
+        stats = run_pseudo(tmpdir, 'xx')
+        output = os.path.join(tmpdir, 'TranslatedStrings_xx.txt')
+
+        assert stats['keys'] == 2 and stats['output'] == output, f"Stats: {stats}"
+        strings = parse_translation_file(output)
+        assert list(strings) == ['$$$/App/UI/Cancel', '$$$/App/UI/Count'], f"Clés: {list(strings)}"
+        assert strings['$$$/App/UI/Count'].startswith('[%d pĥöţöš'), strings['$$$/App/UI/Count']
+
+        with open(output, 'r', encoding='utf-8') as f:
+            content = f.read()
+        assert content.startswith("-- Plugin Localization - XX (pseudo)\n"), content
+        assert "-- UI\n" in content, "Les commentaires doivent être conservés"
+
+        try:
+            run_pseudo(tmpdir, 'xx')
+            assert False, "FileExistsError attendue sans force"
+        except FileExistsError:
+            pass
+        assert run_pseudo(tmpdir, 'xx', force=True)['keys'] == 2
+
+        print("  [OK] 2 clés générées dans l'ordre EN, entête réécrit, écrasement refusé sans force")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: TM_pseudo.py")
+    print("=" * 80)
+
+    tests = [
+        test_pseudo_localize,
+        test_run_pseudo
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+test_tm_sync.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_sync.py
+
+Usage:
+    python tests/test_tm_sync.py
+    pytest tests/test_tm_sync.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+import TM_sync
+from TM_sync import run_sync, sync_languages, default_jobs, _init_worker
+from TM_parser import get_parse_cache_dir, set_parse_cache_dir, parse_translation_file
+from TM_merge import conflicts_path
+from TM_memory import get_memory_path, set_memory_path
+from helpers import write_file
+
+
+EN = (
+    '"$$$/App/Title=Hello"\n'
+    '"$$$/App/Msg=Message"\n'
+    '"$$$/App/New=Brand new"\n'
+)
+
+
+def _make_locales(tmpdir: str, languages):
+    write_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"), EN)
+    for lang in languages:
+        write_file(os.path.join(tmpdir, f"TranslatedStrings_{lang}.txt"),
+                   f'"$$$/App/Title=Title {lang}"\n"$$$/App/Old=Old {lang}"\n')
+
+
+def _read_without_header(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return ''.join(line for line in f if not line.startswith('-- Generated:'))
+
+
+def test_parallel_matches_sequential():
+    """Test que la synchronisation parallèle produit les mêmes résultats que la séquentielle."""
+    print("TEST 1: run_sync parallèle == séquentiel")
+
+    languages = ['de', 'es', 'fr', 'it', 'nl']
+
+    with tempfile.TemporaryDirectory() as seq_dir, tempfile.TemporaryDirectory() as par_dir:
+        _make_locales(seq_dir, languages)
+        _make_locales(par_dir, languages)
+
+        seq = run_sync(seq_dir, jobs=1)
+        par = run_sync(par_dir, jobs=3)
+
+        assert list(par.keys()) == languages, f"Ordre instable: {list(par.keys())}"
+        assert seq == par, "Statistiques différentes"
+        for lang in languages:
+            name = f"TranslatedStrings_{lang}.txt"
+            assert _read_without_header(os.path.join(seq_dir, name)) == \
+                _read_without_header(os.path.join(par_dir, name)), f"Contenu différent: {name}"
+
+        assert par['fr']['added_keys'] == ['$$$/App/Msg', '$$$/App/New'], par['fr']
+        assert par['fr']['removed_keys'] == ['$$$/App/Old'], par['fr']
+
+        print(f"  [OK] {len(languages)} langues, résultats identiques")
+
+
+def test_default_jobs_and_worker_init():
+    """Test du mode séquentiel par défaut et de l'initialisation des processus du pool."""
+    print("\nTEST 2: default_jobs + _init_worker")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_locales(tmpdir, ['de', 'fr'])
+        files = [os.path.join(tmpdir, f"TranslatedStrings_{lang}.txt") for lang in ('de', 'fr')]
+        assert default_jobs(files) == 1, "Petits fichiers : séquentiel attendu"
+
+        threshold = TM_sync.PARALLEL_MIN_BYTES
+        TM_sync.PARALLEL_MIN_BYTES = 1
+        try:
+            assert default_jobs(files) == (os.cpu_count() or 1), "Gros fichiers : un processus par cœur"
+        finally:
+            TM_sync.PARALLEL_MIN_BYTES = threshold
+
+        # Configuration reprise par le processus (cas 'spawn' : rien n'est hérité)
+        cache_dir = os.path.join(tmpdir, 'parse_cache')
+        previous = (get_parse_cache_dir(), get_memory_path(), sys.stdout)
+        try:
+            _init_worker((), None, cache_dir, True)
+            assert get_parse_cache_dir() == cache_dir, "Cache de parsing non transmis"
+            assert sys.stdout is sys.stderr, "stdout du mode --job non redirigé"
+        finally:
+            set_parse_cache_dir(previous[0])
+            set_memory_path(previous[1])
+            sys.stdout = previous[2]
+
+        print("  [OK] Séquentiel sous le seuil, cache de parsing et redirection transmis")
+
+
+def test_merge_with_saved_base():
+    """Test que SYNC fusionne avec la base enregistrée sans écraser une édition du traducteur."""
+    print("\nTEST 3: Fusion SYNC avec la base enregistrée")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_locales(tmpdir, ['fr'])
+        run_sync(tmpdir, jobs=1)  # Écrit le fichier et sa base de fusion
+
+        fr_file = os.path.join(tmpdir, "TranslatedStrings_fr.txt")
+        preloaded = parse_translation_file(fr_file)  # Lecture de PIPELINE, devenue périmée
+
+        # Édition du traducteur après la lecture : titre traduit, clé EN
+        # supprimée par erreur, clé hors EN ajoutée
+        with open(fr_file, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if not line.startswith('"$$$/App/Msg=')]
+        write_file(fr_file, ''.join(lines).replace('Title fr', 'Titre édité') + '"$$$/App/Extra=Extra"\n')
+
+        en_strings = parse_translation_file(os.path.join(tmpdir, "TranslatedStrings_en.txt"))
+        sync_languages(en_strings, ['fr'], tmpdir, jobs=1, preloaded={'fr': preloaded})
+
+        result = parse_translation_file(fr_file)
+        assert result['$$$/App/Title'] == 'Titre édité', f"Édition écrasée: {result}"
+        assert sorted(result) == sorted(en_strings), f"Clés différentes de l'EN: {sorted(result)}"
+        assert not os.path.exists(conflicts_path(fr_file)), "Aucun conflit attendu"
+
+        print("  [OK] Édition conservée, clés EN rétablies, clé hors EN retirée, sans conflit")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_sync.py")
+    print("=" * 80)
+
+    tests = [
+        test_parallel_matches_sequential,
+        test_default_jobs_and_worker_init,
+        test_merge_with_saved_base
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
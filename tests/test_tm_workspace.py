@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+test_tm_workspace.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_workspace.py
+
+Usage:
+    python tests/test_tm_workspace.py
+    pytest tests/test_tm_workspace.py  (si pytest installé)
+"""
+
+import os
+import sys
+import tempfile
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_common import parse_translation_file
+from TM_merge import save_base_snapshot, conflicts_path
+from TM_workspace import build_workspace_index, run_workspace_sync, sync_plugin_language
+from helpers import write_file
+
+
+def test_build_workspace_index():
+    """Test de l'index combiné (vote majoritaire, traductions relues seulement)."""
+    print("TEST 1: build_workspace_index")
+
+    plugins = {
+        'a': {'en': {'$$$/A/UI/Cancel': 'Cancel', '$$$/A/UI/Close': 'Close'},
+              'languages': {'fr': ({'$$$/A/UI/Cancel': 'Annuler', '$$$/A/UI/Close': 'Fermer'},
+                                   {'$$$/A/UI/Close': '-- ## NEEDS_REVIEW ## Texte EN modifié'})}},
+        'b': {'en': {'$$$/B/UI/Cancel': 'Cancel ', '$$$/B/UI/Abort': 'Cancel'},
+              'languages': {'fr': ({'$$$/B/UI/Cancel': 'Annuler', '$$$/B/UI/Abort': 'Abandonner'}, {})}},
+    }
+
+    index = build_workspace_index(plugins)
+
+    assert index['fr'] == {'Cancel': ('Annuler', 'a')}, f"Index: {index}"
+
+    print("  [OK] 'Annuler' majoritaire (2 voix), traduction marquée ignorée")
+
+
+def test_workspace_sync():
+    """Test de la propagation entre plugins et de la synchronisation des clés."""
+    print("\nTEST 2: run_workspace_sync")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plugin_a = os.path.join(tmpdir, 'a.lrplugin')
+        plugin_b = os.path.join(tmpdir, 'b.lrplugin')
+        os.makedirs(plugin_a)
+        os.makedirs(plugin_b)
+        write_file(os.path.join(plugin_a, 'TranslatedStrings_en.txt'),
+                   '"$$$/A/UI/Cancel=Cancel"\n"$$$/A/UI/Save=Save %s"\n')
+        write_file(os.path.join(plugin_a, 'TranslatedStrings_fr.txt'), '"$$$/A/UI/Cancel=Annuler"\n')
+        write_file(os.path.join(plugin_b, 'TranslatedStrings_en.txt'),
+                   '"$$$/B/UI/Cancel=Cancel"\n"$$$/B/UI/Save=Save %s"\n')
+        write_file(os.path.join(plugin_b, 'TranslatedStrings_fr.txt'),
+                   '"$$$/B/UI/Cancel=Cancel"\n"$$$/B/UI/Save=Enregistrer %s"\n"$$$/B/UI/Old=Vieux"\n')
+
+        result = run_workspace_sync([plugin_a, plugin_b], jobs=2)
+        fr_a = parse_translation_file(os.path.join(plugin_a, 'TranslatedStrings_fr.txt'))
+        fr_b = parse_translation_file(os.path.join(plugin_b, 'TranslatedStrings_fr.txt'))
+
+        assert fr_a == {'$$$/A/UI/Cancel': 'Annuler', '$$$/A/UI/Save': 'Enregistrer %s'}, f"a: {fr_a}"
+        assert fr_b == {'$$$/B/UI/Cancel': 'Annuler', '$$$/B/UI/Save': 'Enregistrer %s'}, f"b: {fr_b}"
+        assert result['plugins']['b.lrplugin']['fr']['removed'] == 1
+
+        # Sans --jobs, petits fichiers : synchronisation séquentielle, même résultat
+        again = run_workspace_sync([plugin_a, plugin_b])
+        assert not any(stats['written'] for langs in again['plugins'].values() for stats in langs.values())
+
+        print("  [OK] Traductions reprises dans les deux sens, clé obsolète supprimée")
+
+
+def test_sync_merges_direct_edits():
+    """Test que la synchronisation n'écrase pas une édition directe faite depuis la lecture."""
+    print("\nTEST 3: sync_plugin_language (fusion à trois voies)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        en_strings = {'$$$/A/UI/Cancel': 'Cancel', '$$$/A/UI/Save': 'Save'}
+        read = dict(en_strings)  # Lecture de la phase 1 (non traduit)
+        fr_file = os.path.join(tmpdir, 'TranslatedStrings_fr.txt')
+        write_file(fr_file, '"$$$/A/UI/Cancel=Cancel"\n"$$$/A/UI/Save=Save"\n')
+        save_base_snapshot(fr_file, read)
+
+        # Édition directe après la lecture
+        write_file(fr_file, '"$$$/A/UI/Cancel=Abandonner"\n"$$$/A/UI/Save=Enregistrer"\n')
+
+        stats = sync_plugin_language(tmpdir, 'fr', en_strings, read, {},
+                                     {'Cancel': ('Annuler', 'b')})
+        fr = parse_translation_file(fr_file)
+
+        assert fr == {'$$$/A/UI/Cancel': 'Abandonner', '$$$/A/UI/Save': 'Enregistrer'}, f"fr: {fr}"
+        assert stats['conflicts'] == 1 and os.path.isfile(conflicts_path(fr_file)), stats
+
+        print("  [OK] Édition conservée, conflit avec la reprise écrit dans CONFLICTS_fr.txt")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_workspace.py")
+    print("=" * 80)
+
+    tests = [
+        test_build_workspace_index,
+        test_workspace_sync,
+        test_sync_merges_direct_edits
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
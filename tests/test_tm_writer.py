@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_tm_writer.py
+
+Tests unitaires pour le module 3_Translation_manager/TM_writer.py
+
+Usage:
+    python tests/test_tm_writer.py
+    pytest tests/test_tm_writer.py  (si pytest installé)
+"""
+
+import os
+import sys
+
+# Ajouter le parent et TranslationManager au path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "3_Translation_manager"))
+
+from TM_writer import key_category, patch_translation_content, read_markers
+
+
+CONTENT = (
+    '-- =====\n'
+    '-- Plugin Localization - FR\n'
+    '-- Total keys: 4\n'
+    '-- =====\n'
+    '\n'
+    '-- UI\n'
+    '"$$$/Demo/UI/Title=Titre"\n'
+    '-- Commentaire du traducteur\n'
+    '"$$$/Demo/UI/Cancel=Annuler"\n'
+    '-- ## NEW ## À traduire\n'
+    '"$$$/Demo/UI/Save=Save"\n'
+    '\n'
+    '-- API\n'
+    '"$$$/Demo/API/Error=Erreur"\n'
+    '\n'
+)
+
+
+def test_key_category():
+    """Test de la catégorie d'une clé."""
+    print("TEST 1: key_category")
+
+    assert key_category('$$$/Demo/UI/Title') == 'UI'
+    assert key_category('$$$/Demo/Title') == 'General'
+
+    print("  [OK] $$$/Prefix/Category/Name → Category")
+
+
+def test_patch_minimal():
+    """Test que seules les lignes concernées sont modifiées."""
+    print("\nTEST 2: patch minimal (ordre et commentaires conservés)")
+
+    translations = {
+        '$$$/Demo/UI/Title': 'Titre',
+        '$$$/Demo/UI/Cancel': 'Annuler',
+        '$$$/Demo/UI/Save': 'Enregistrer',     # traduite : marqueur retiré
+        '$$$/Demo/UI/Close': 'Close',          # nouvelle clé UI
+        '$$$/Demo/Export/Start': 'Start',      # nouvelle catégorie
+    }                                          # API/Error supprimée
+    markers = {
+        '$$$/Demo/UI/Close': '-- ## NEW ## À traduire',
+        '$$$/Demo/Export/Start': '-- ## NEW ## À traduire',
+    }
+    header = ['-- Plugin Localization - FR\n', '-- Total keys: 5\n']
+
+    result = patch_translation_content(CONTENT, translations, markers, header)
+
+    expected = (
+        '-- =====\n'
+        '-- Plugin Localization - FR\n'
+        '-- Total keys: 5\n'
+        '-- =====\n'
+        '\n'
+        '-- UI\n'
+        '"$$$/Demo/UI/Title=Titre"\n'
+        '-- Commentaire du traducteur\n'
+        '"$$$/Demo/UI/Cancel=Annuler"\n'
+        '-- ## NEW ## À traduire\n'
+        '"$$$/Demo/UI/Close=Close"\n'
+        '"$$$/Demo/UI/Save=Enregistrer"\n'
+        '\n'
+        '-- API\n'
+        '\n'
+        '-- Export\n'
+        '-- ## NEW ## À traduire\n'
+        '"$$$/Demo/Export/Start=Start"\n'
+        '\n'
+    )
+    assert result == expected, f"Contenu inattendu:\n{result}"
+
+    # Réappliquer le même état ne change rien
+    again = patch_translation_content(result, translations, markers, header)
+    assert again == result, "Le patch n'est pas idempotent"
+
+    print("  [OK] Valeur, marqueurs, insertion et suppression appliqués sur place")
+
+
+def test_translator_comment_kept():
+    """Test qu'un commentaire "-- ## ..." inconnu n'est pas pris pour un marqueur."""
+    print("\nTEST 3: commentaire du traducteur au format marqueur")
+
+    content = (
+        '-- ## Note ## Garder le terme anglais\n'
+        '"$$$/Demo/UI/Sync=Sync"\n'
+        '-- ## NEEDS_REVIEW ## Texte EN modifié\n'
+        '"$$$/Demo/UI/Save=Enregistrer"\n'
+    )
+    assert read_markers(content) == {'$$$/Demo/UI/Save': '-- ## NEEDS_REVIEW ## Texte EN modifié'}
+
+    translations = {'$$$/Demo/UI/Sync': 'Sync', '$$$/Demo/UI/Save': 'Enregistrer'}
+    result = patch_translation_content(content, translations, {})
+
+    assert result == (
+        '-- ## Note ## Garder le terme anglais\n'
+        '"$$$/Demo/UI/Sync=Sync"\n'
+        '"$$$/Demo/UI/Save=Enregistrer"\n'
+    ), f"Contenu inattendu:\n{result}"
+
+    print("  [OK] Commentaire conservé, seul le marqueur NEEDS_REVIEW est retiré")
+
+
+def run_all_tests():
+    """Exécute tous les tests."""
+    print("=" * 80)
+    print("TESTS: 3_Translation_manager/TM_writer.py")
+    print("=" * 80)
+
+    tests = [
+        test_key_category,
+        test_patch_minimal,
+        test_translator_comment_kept
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] ÉCHEC: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [FAIL] ERREUR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 80)
+    print(f"RÉSULTATS: {passed} réussis, {failed} échoués")
+    print("=" * 80)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)